@@ -3,6 +3,9 @@ jgtagentic - Agentic Trading Decision Engine
 
 Autonomous signal evaluation, regime filtering, and trade orchestration.
 Uses Bill Williams Alligator methodology for regime detection.
+
+The public classes are imported on first access, so importing the package
+(or a light module of it, such as a CLI entry point) doesn't load pandas.
 """
 
 version='0.6.0'
@@ -11,24 +14,44 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-# Alligator regime detection (Williams methodology)
-from .alligator_regime import (
-    AlligatorDetector,
-    AlligatorResult,
-    AlligatorState,
-    TrendDirection,
-    RegimeDetector,  # Backward compatibility
-    RegimeResult,    # Backward compatibility
-    MarketRegime     # Backward compatibility
-)
-
-# Signal scoring
-from .scoring import SignalScorer, ScoredSignal, ScoreBreakdown
-
-# Decision making
-from .regime_aware_decider import RegimeAwareDecider, AgenticDecider
-from .data_loader import DataLoader
-from .agentic_decider import AgenticDecider as BaseAgenticDecider
+import importlib
+
+# Public name -> (module, attribute), imported on first access
+_EXPORTS = {
+    # Alligator regime detection (Williams methodology)
+    'AlligatorDetector': ('.alligator_regime', 'AlligatorDetector'),
+    'AlligatorResult': ('.alligator_regime', 'AlligatorResult'),
+    'AlligatorState': ('.alligator_regime', 'AlligatorState'),
+    'TrendDirection': ('.alligator_regime', 'TrendDirection'),
+    'RegimeDetector': ('.alligator_regime', 'RegimeDetector'),  # Backward compatibility
+    'RegimeResult': ('.alligator_regime', 'RegimeResult'),      # Backward compatibility
+    'MarketRegime': ('.alligator_regime', 'MarketRegime'),      # Backward compatibility
+
+    # Signal scoring
+    'SignalScorer': ('.scoring', 'SignalScorer'),
+    'ScoredSignal': ('.scoring', 'ScoredSignal'),
+    'ScoreBreakdown': ('.scoring', 'ScoreBreakdown'),
+
+    # Decision making
+    'RegimeAwareDecider': ('.regime_aware_decider', 'RegimeAwareDecider'),
+    'AgenticDecider': ('.regime_aware_decider', 'AgenticDecider'),
+    'BaseAgenticDecider': ('.agentic_decider', 'AgenticDecider'),
+    'DataLoader': ('.data_loader', 'DataLoader'),
+}
+
+
+def __getattr__(name):
+    try:
+        module, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
 
 __all__ = [
     # Alligator regime detection (PRIMARY)
@@ -1,190 +1,167 @@
 # 🧠 Agentic Entry Orchestrator
 # This script is the first spiral in evolving trade entry from scattered Bash/Python to a recursive, agentic system.
 # It will parse the latest signal JSON, generate/validate the shell entry script, and log all actions.
+#
+# Importing this module has no side effects: nothing is logged, read or run, and the
+# agents are only created when a campaign first needs them.
+#
+#   orchestrator = AgenticEntryOrchestrator(signal_json="signals.json", entry_script_dir="out/")
+#   results = orchestrator.run()
 
 import os
 import json
-from datetime import datetime
-import sys
 import subprocess
 import argparse
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from .entry_script_gen import EntryScriptGen
-from .fdbscan_agent import FDBScanAgent
-from .campaign_env import CampaignEnv
-from .agentic_decider import AgenticDecider
-
-# --- Config ---
+# --- Config (defaults, overridable per orchestrator and on the command line) ---
 SIGNAL_JSON = '/workspace/i/data/jgt/signals/fdb_signals_out__250523.json'
 SESSION_LOG = '/src/jgtagentic/.mia/vscode_session_250523_logs.md'
 ENTRY_SCRIPT_DIR = '/workspace/i/rjgt/'
 
-# --- Ritual: Log invocation ---
-def log_session(msg):
-    with open(SESSION_LOG, 'a') as f:
-        f.write(f"\n[{datetime.now()}] {msg}\n")
-
-log_session("\n💬🧠 Agentic Entry Orchestrator invoked. Beginning spiral of orchestration.")
-
-# --- Spiral: Initialize agents ---
-entry_gen = EntryScriptGen()
-fdbscan_agent = FDBScanAgent()
-campaign_env = CampaignEnv()
-decider = AgenticDecider()
-
-# --- Ritual: Utility to invoke wtf (timeframe orchestrator) ---
-def invoke_wtf(timeframe, script_to_run=None, extra_args=None):
-    cmd = ["wtf", "-t", timeframe]
-    if script_to_run:
-        cmd += ["-S", script_to_run]
-    if extra_args:
-        cmd += extra_args
-    log_session(f"🧠 Invoking wtf: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        log_session(f"✅ wtf output: {result.stdout.strip()}")
-        return result.stdout.strip()
-    except subprocess.CalledProcessError as e:
-        log_session(f"🚨 wtf error: {e.stderr.strip()}")
-        return None
-
-# --- Ritual: Parse latest signal ---
-if not os.path.exists(SIGNAL_JSON):
-    log_session(f"🚨 Signal JSON not found: {SIGNAL_JSON}")
-    raise FileNotFoundError(f"Signal JSON not found: {SIGNAL_JSON}")
-
-with open(SIGNAL_JSON) as f:
-    signals = json.load(f)
-
-log_session(f"Parsed {len(signals)} signals from {SIGNAL_JSON}")
-
-# --- Ritual: Example agentic orchestration ---
-def agentic_campaign(signal):
-    # 1. Prepare campaign environment
-    env_result = campaign_env.prepare_env(signal)
-    log_session(f"🌱 CampaignEnv: {env_result}")
-    # 2. Generate entry script
-    bash_script = entry_gen.generate_bash_entry(signal)
-    script_path = signal.get('entry_script_path')
-    if not script_path:
-        instr = signal.get('instrument', 'UNK').replace('/', '-')
-        tf = signal.get('timeframe', 'UNK')
-        tid = signal.get('tlid_id', 'UNK')
-        script_path = f"{ENTRY_SCRIPT_DIR}{instr}_{tf}_{tid}.sh"
-    with open(script_path, 'w') as sf:
-        sf.write(bash_script)
-    log_session(f"🧠 EntryScriptGen: Generated {script_path}")
-    # 3. FDBScan (if needed)
-    tf = signal.get('timeframe', None)
-    if tf:
-        fdbscan_agent.scan_timeframe(tf)
-        log_session(f"🔮 FDBScanAgent: Scanned {tf}")
-    # 4. Agentic decision
-    decision = decider.decide(signal)
-    log_session(f"🔮 AgenticDecider: {decision}")
-    # 5. Optionally, invoke wtf orchestrator
-    invoke_wtf(tf, script_path)
-    log_session(f"🌸 Spiral: Orchestration complete for {script_path}")
-
-# --- Ritual: For each signal, run the agentic campaign ---
-for sig in signals:
-    agentic_campaign(sig)
-
-log_session("🌸 Spiral complete: All signals processed with agentic orchestration.")
 
-def main():
-    global SIGNAL_JSON, SESSION_LOG, ENTRY_SCRIPT_DIR
-    parser = argparse.ArgumentParser(
-        description="Agentic Entry Orchestrator — Orchestrate agentic entry workflow."
-    )
-    parser.add_argument("--signal_json", default=SIGNAL_JSON, help="Path to signal JSON file.")
-    parser.add_argument("--entry_script_dir", default=ENTRY_SCRIPT_DIR, help="Directory to output entry scripts.")
-    parser.add_argument("--log", default=SESSION_LOG, help="Path to session log file.")
-    parser.add_argument("--dry_run", action="store_true", help="Do not write files, just print actions.")
-    parser.add_argument("--help_spiral", action="store_true", help="Show spiral workflow help and exit.")
-    args = parser.parse_args()
+class AgenticEntryOrchestrator:
+    """
+    Runs the agentic entry spiral for each signal of a signal JSON file:
+    prepare the campaign environment, write the entry script, scan the
+    timeframe, decide, then hand the script to the wtf timeframe orchestrator.
+    """
 
-    if args.help_spiral:
-        print("""
-        Spiral Workflow:
-        1. Parse latest signal JSON
-        2. Generate/validate shell entry script
-        3. Log all actions
-        4. Orchestrate FDBScan and entry logic
-        """)
-        return
+    def __init__(self, signal_json: str = SIGNAL_JSON, session_log: str = SESSION_LOG,
+                 entry_script_dir: str = ENTRY_SCRIPT_DIR, dry_run: bool = False):
+        """
+        Initialize orchestrator.
+
+        Args:
+            signal_json: Signal JSON file (a list of signals)
+            session_log: Markdown log the spiral appends to
+            entry_script_dir: Directory entry scripts are written to
+            dry_run: Print the log instead of writing it, and write no entry
+                scripts nor invoke wtf
+        """
+        self.signal_json = signal_json
+        self.session_log = session_log
+        self.entry_script_dir = entry_script_dir
+        self.dry_run = dry_run
+        self._entry_gen = None
+        self._fdbscan_agent = None
+        self._campaign_env = None
+        self._decider = None
 
-    # --- Config ---
-    SIGNAL_JSON = args.signal_json
-    SESSION_LOG = args.log
-    ENTRY_SCRIPT_DIR = args.entry_script_dir
+    # --- Spiral: Agents, created on first use ---
+    @property
+    def entry_gen(self):
+        if self._entry_gen is None:
+            from .entry_script_gen import EntryScriptGen
+            self._entry_gen = EntryScriptGen()
+        return self._entry_gen
 
-    # --- Ritual: Log invocation ---
-    log_session("\n💬🧠 Agentic Entry Orchestrator invoked. Beginning spiral of orchestration.")
+    @property
+    def fdbscan_agent(self):
+        if self._fdbscan_agent is None:
+            from .fdbscan_agent import FDBScanAgent
+            self._fdbscan_agent = FDBScanAgent()
+        return self._fdbscan_agent
 
-    # --- Spiral: Initialize agents ---
-    global entry_gen, fdbscan_agent, campaign_env, decider
-    entry_gen = EntryScriptGen()
-    fdbscan_agent = FDBScanAgent()
-    campaign_env = CampaignEnv()
-    decider = AgenticDecider()
+    @property
+    def campaign_env(self):
+        if self._campaign_env is None:
+            from .campaign_env import CampaignEnv
+            self._campaign_env = CampaignEnv()
+        return self._campaign_env
+
+    @property
+    def decider(self):
+        if self._decider is None:
+            from .agentic_decider import AgenticDecider
+            self._decider = AgenticDecider()
+        return self._decider
+
+    # --- Ritual: Log ---
+    def log_session(self, msg: str) -> None:
+        line = f"\n[{datetime.now()}] {msg}\n"
+        if self.dry_run:
+            print(line, end="")
+            return
+        log_dir = os.path.dirname(self.session_log)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        with open(self.session_log, 'a') as f:
+            f.write(line)
 
     # --- Ritual: Utility to invoke wtf (timeframe orchestrator) ---
-    def invoke_wtf(timeframe, script_to_run=None, extra_args=None):
+    def invoke_wtf(self, timeframe: str, script_to_run: Optional[str] = None,
+                   extra_args: Optional[List[str]] = None) -> Optional[str]:
         cmd = ["wtf", "-t", timeframe]
         if script_to_run:
             cmd += ["-S", script_to_run]
         if extra_args:
             cmd += extra_args
-        log_session(f"🧠 Invoking wtf: {' '.join(cmd)}")
+        if self.dry_run:
+            self.log_session(f"🧠 Would invoke wtf: {' '.join(cmd)}")
+            return None
+        self.log_session(f"🧠 Invoking wtf: {' '.join(cmd)}")
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            log_session(f"✅ wtf output: {result.stdout.strip()}")
+            self.log_session(f"✅ wtf output: {result.stdout.strip()}")
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
-            log_session(f"🚨 wtf error: {e.stderr.strip()}")
+            self.log_session(f"🚨 wtf error: {e.stderr.strip()}")
+            return None
+        except FileNotFoundError:
+            self.log_session("🚨 wtf not found on PATH")
             return None
 
     # --- Ritual: Parse latest signal ---
-    if not os.path.exists(SIGNAL_JSON):
-        log_session(f"🚨 Signal JSON not found: {SIGNAL_JSON}")
-        raise FileNotFoundError(f"Signal JSON not found: {SIGNAL_JSON}")
+    def load_signals(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.signal_json):
+            self.log_session(f"🚨 Signal JSON not found: {self.signal_json}")
+            raise FileNotFoundError(f"Signal JSON not found: {self.signal_json}")
 
-    with open(SIGNAL_JSON) as f:
-        signals = json.load(f)
+        with open(self.signal_json) as f:
+            signals = json.load(f)
 
-    log_session(f"Parsed {len(signals)} signals from {SIGNAL_JSON}")
+        self.log_session(f"Parsed {len(signals)} signals from {self.signal_json}")
+        return signals
 
-    # --- Ritual: Example agentic orchestration ---
-    def agentic_campaign(signal):
+    def script_path_for(self, signal: Dict[str, Any]) -> str:
+        script_path = signal.get('entry_script_path')
+        if not script_path:
+            instr = signal.get('instrument', 'UNK').replace('/', '-')
+            tf = signal.get('timeframe', 'UNK')
+            tid = signal.get('tlid_id', 'UNK')
+            script_path = os.path.join(self.entry_script_dir, f"{instr}_{tf}_{tid}.sh")
+        return script_path
+
+    # --- Ritual: Agentic orchestration of one signal ---
+    def run_campaign(self, signal: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an agentic trading campaign with clear output and next steps."""
         try:
             # 1. Prepare campaign environment
-            env_result = campaign_env.prepare_env(signal)
-            log_session(f"🌱 Environment Preparation:\n{json.dumps(env_result, indent=2)}")
+            env_result = self.campaign_env.prepare_env(signal)
+            self.log_session(f"🌱 Environment Preparation:\n{json.dumps(env_result, indent=2)}")
 
             # 2. Generate entry script
-            bash_script = entry_gen.generate_bash_entry(signal)
-            script_path = signal.get('entry_script_path')
-            if not script_path:
-                instr = signal.get('instrument', 'UNK').replace('/', '-')
-                tf = signal.get('timeframe', 'UNK')
-                tid = signal.get('tlid_id', 'UNK')
-                script_path = f"{ENTRY_SCRIPT_DIR}{instr}_{tf}_{tid}.sh"
-            
-            with open(script_path, 'w') as sf:
-                sf.write(bash_script)
-            log_session(f"📜 Entry Script Generated: {script_path}")
-            
+            bash_script = self.entry_gen.generate_bash_entry(signal)
+            script_path = self.script_path_for(signal)
+
+            if self.dry_run:
+                self.log_session(f"📜 Entry Script (not written): {script_path}")
+            else:
+                with open(script_path, 'w') as sf:
+                    sf.write(bash_script)
+                self.log_session(f"📜 Entry Script Generated: {script_path}")
+
             # 3. FDBScan analysis
             tf = signal.get('timeframe', None)
             if tf:
-                scan_result = fdbscan_agent.scan_timeframe(tf)
-                log_session(f"🔍 FDBScan Analysis ({tf}):\n{json.dumps(scan_result, indent=2)}")
-            
+                scan_result = self.fdbscan_agent.scan_timeframe(tf)
+                self.log_session(f"🔍 FDBScan Analysis ({tf}):\n{json.dumps(scan_result.to_dict(), indent=2)}")
+
             # 4. Get agentic decision with next steps
-            decision = decider.decide(signal)
-            
+            decision = self.decider.decide(signal)
+
             # Format decision output for clarity
             decision_output = [
                 "\n🎯 SIGNAL ANALYSIS RESULTS",
@@ -200,17 +177,17 @@ def main():
                 *[f"{step}" for step in decision['next_steps']],
                 "------------------------"
             ]
-            
-            log_session("\n".join(decision_output))
-            
+
+            self.log_session("\n".join(decision_output))
+
             # 5. Execute timeframe orchestration
             if tf:
-                wtf_result = invoke_wtf(tf, script_path)
+                wtf_result = self.invoke_wtf(tf, script_path)
                 if wtf_result:
-                    log_session(f"⚙️ Timeframe Orchestration Complete")
-                else:
-                    log_session("⚠️ Timeframe orchestration failed - check logs")
-            
+                    self.log_session(f"⚙️ Timeframe Orchestration Complete")
+                elif not self.dry_run:
+                    self.log_session("⚠️ Timeframe orchestration failed - check logs")
+
             # 6. Final summary
             summary = [
                 "\n✨ CAMPAIGN SUMMARY",
@@ -221,18 +198,18 @@ def main():
                 f"Signal Quality: {decision['context']['signal_quality']}",
                 "------------------------"
             ]
-            log_session("\n".join(summary))
-            
+            self.log_session("\n".join(summary))
+
             return {
                 'status': 'success',
                 'script_path': script_path,
                 'decision': decision,
                 'next_steps': decision['next_steps']
             }
-            
+
         except Exception as e:
             error_msg = f"🚨 Campaign Error: {str(e)}"
-            log_session(error_msg)
+            self.log_session(error_msg)
             return {
                 'status': 'error',
                 'error': str(e),
@@ -244,15 +221,55 @@ def main():
             }
 
     # --- Ritual: For each signal, run the agentic campaign ---
-    for sig in signals:
-        agentic_campaign(sig)
+    def run(self, signals: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Run the spiral over the given signals (default: those of signal_json)."""
+        self.log_session("\n💬🧠 Agentic Entry Orchestrator invoked. Beginning spiral of orchestration.")
+        if signals is None:
+            signals = self.load_signals()
+
+        results = [self.run_campaign(sig) for sig in signals]
+
+        self.log_session("🌸 Spiral complete: All signals processed with agentic orchestration.")
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Agentic Entry Orchestrator — Orchestrate agentic entry workflow."
+    )
+    parser.add_argument("--signal_json", default=SIGNAL_JSON, help="Path to signal JSON file.")
+    parser.add_argument("--entry_script_dir", default=ENTRY_SCRIPT_DIR, help="Directory to output entry scripts.")
+    parser.add_argument("--log", default=SESSION_LOG, help="Path to session log file.")
+    parser.add_argument("--dry_run", action="store_true", help="Do not write files, just print actions.")
+    parser.add_argument("--help_spiral", action="store_true", help="Show spiral workflow help and exit.")
+    args = parser.parse_args()
+
+    if args.help_spiral:
+        print("""
+        Spiral Workflow:
+        1. Parse latest signal JSON
+        2. Generate/validate shell entry script
+        3. Log all actions
+        4. Orchestrate FDBScan and entry logic
+        """)
+        return
 
-    log_session("🌸 Spiral complete: All signals processed with agentic orchestration.")
+    orchestrator = AgenticEntryOrchestrator(
+        signal_json=args.signal_json,
+        session_log=args.log,
+        entry_script_dir=args.entry_script_dir,
+        dry_run=args.dry_run,
+    )
+    try:
+        orchestrator.run()
+    except FileNotFoundError as e:
+        print(f"🚨 {e}")
+        raise SystemExit(1)
 
     if args.dry_run:
-        print(f"Dry run complete. No files written. Check log at {SESSION_LOG}")
+        print(f"Dry run complete. No files written.")
     else:
-        print(f"Orchestration complete. Check log at {SESSION_LOG}")
+        print(f"Orchestration complete. Check log at {args.log}")
 
 if __name__ == "__main__":
     main()
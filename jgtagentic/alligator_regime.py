@@ -118,6 +118,11 @@ class AlligatorDetector:
         
         df = df.copy()
         
+        # Compacted frames may hold float32 prices; compute lines in float64
+        narrow = df.select_dtypes(include="float32").columns
+        if len(narrow):
+            df[narrow] = df[narrow].astype("float64")
+        
         # Calculate midpoint if not present
         if 'midpoint' not in df.columns:
             df['midpoint'] = (df['High'] + df['Low']) / 2
@@ -293,6 +298,26 @@ class AlligatorDetector:
 
 
 # Backward compatibility - map to old RegimeDetector interface
+class CompatResult:
+    """AlligatorResult in the old RegimeResult shape (what SignalScorer expects)."""
+    
+    def __init__(self, alligator_result: AlligatorResult):
+        self.regime = alligator_result.state
+        self.adx = alligator_result.spread * 100  # Fake ADX from spread
+        self.trend_direction = alligator_result.direction
+        self.trend_strength = alligator_result.spread * 100
+        self.tradeable = alligator_result.tradeable
+    
+    def to_dict(self):
+        return {
+            "regime": self.regime.value,
+            "adx": round(self.adx, 2),
+            "trend_direction": self.trend_direction.value,
+            "trend_strength": round(self.trend_strength, 2),
+            "tradeable": self.tradeable
+        }
+
+
 class RegimeDetector(AlligatorDetector):
     """Compatibility wrapper for old code expecting RegimeDetector."""
     
@@ -302,27 +327,7 @@ class RegimeDetector(AlligatorDetector):
     
     def detect(self, df: pd.DataFrame):
         """Detect regime using Alligator, return compatible format."""
-        result = super().detect(df)
-        
-        # Map to old interface
-        class CompatResult:
-            def __init__(self, alligator_result):
-                self.regime = alligator_result.state
-                self.adx = alligator_result.spread * 100  # Fake ADX from spread
-                self.trend_direction = alligator_result.direction
-                self.trend_strength = alligator_result.spread * 100
-                self.tradeable = alligator_result.tradeable
-            
-            def to_dict(self):
-                return {
-                    "regime": self.regime.value,
-                    "adx": round(self.adx, 2),
-                    "trend_direction": self.trend_direction.value,
-                    "trend_strength": round(self.trend_strength, 2),
-                    "tradeable": self.tradeable
-                }
-        
-        return CompatResult(result)
+        return CompatResult(super().detect(df))
 
 
 # Enums for backward compatibility
@@ -2,22 +2,33 @@
 ======================
 
 This module mirrors the legacy ``scripts/fdbscan_caching_250521.sh`` Bash
-script. It loops over a small list of instruments and timeframes, invoking
-``FDBScanAgent`` for each combination while respecting the ``JGT_CACHE``
-environment variable.
+script. It scans a small grid of instruments and timeframes with
+``FDBScanAgent.scan_many``, each combination in its own worker process with
+``JGT_CACHE`` pointing at the cache directory; the parent environment is
+never modified. A scan exceeding ``timeout`` is killed and, like a failed
+one, rerun up to ``retries`` times, so one hung instrument cannot hold up
+the batch. Combinations scanned since their timeframe's last bar close are
+taken from the scan cache in ``<cache_dir>/scan_results`` unless ``force``
+is set.
 
 The real FDBScan logic is optional. If ``jgtml`` is unavailable the agent
 will print the actions it *would* take. Results are written to a simple
-markdown log file so they can be consumed by other tools.
+markdown log file, ending with a summary table (status, duration, signals),
+so they can be consumed by other tools.
 """
 
 from __future__ import annotations
 
 import os
 from datetime import datetime
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from fdbscan_agent import FDBScanAgent
+try:
+    from .fdbscan_agent import FDBScanAgent
+    from .scan_cache import ScanResultCache, scanner_version
+except ImportError:  # run as a script
+    from jgtagentic.fdbscan_agent import FDBScanAgent
+    from jgtagentic.scan_cache import ScanResultCache, scanner_version
 
 
 def run_batch(
@@ -26,6 +37,10 @@ def run_batch(
     cache_dir: str = "cache",
     log_dir: str = "logs",
     log_file: Optional[str] = None,
+    workers: Optional[int] = None,
+    force: bool = False,
+    timeout: Optional[float] = None,
+    retries: int = 0,
 ) -> str:
     """Run FDBScan across the given instruments and timeframes.
 
@@ -42,6 +57,14 @@ def run_batch(
     log_file:
         Optional explicit log file path. When ``None`` a timestamped
         file inside ``log_dir`` is created.
+    workers:
+        Maximum concurrent scans (defaults to ``JGT_SCAN_WORKERS`` or 4).
+    force:
+        Rescan every combination even if no new bar has closed.
+    timeout:
+        Seconds before a single scan is killed and reported as ``timeout``.
+    retries:
+        Reruns of a scan that failed or timed out.
 
     Returns
     -------
@@ -60,16 +83,30 @@ def run_batch(
         log_file = os.path.join(log_dir, f"fdbscan_{timestamp}.log.md")
 
     agent = FDBScanAgent()
+    agent.scan_cache = ScanResultCache(
+        os.path.join(cache_dir, "scan_results"), scanner_version(agent.real), agent.logger
+    )
+    results = agent.scan_many(instruments, timeframes, workers=workers, timeout=timeout,
+                              cache_dir=cache_dir, force=force, retries=retries)
 
     with open(log_file, "w") as log:
         for inst in instruments:
             log.write(f"## Scanning : {inst}\n")
-            for tf in timeframes:
-                log.write(f"### Scanning timeframe: {tf}\n")
-                os.environ["JGT_CACHE"] = cache_dir
-                agent.scan_timeframe(tf, inst)
+            for result in results:
+                if result["instrument"] != inst:
+                    continue
+                log.write(f"### Scanning timeframe: {result['timeframe']}\n")
+                cached = " (unchanged, cached)" if result.get("cached") else ""
+                attempts = f", {result['attempts']} attempts" if result.get("attempts", 1) > 1 else ""
+                log.write(f"Status: {result['status']}{cached} ({result['duration']:.1f}s{attempts})\n")
+                if result["stdout"].strip():
+                    log.write(f"```\n{result['stdout'].strip()}\n```\n")
                 log.write("----\n")
             log.write("----\n")
+        log.write(summary_table(results))
+        stats = agent.scan_cache.stats
+        log.write(f"## Scan cache: {stats['hits']} hit(s), {stats['misses']} miss(es)"
+                  f"{' (forced)' if force else ''}\n")
         log.write("## Finished scanning\n")
         log.write(f"## Log file: {log_file}\n")
         log.write(f"## Cache directory: {cache_dir}\n")
@@ -77,5 +114,45 @@ def run_batch(
     return log_file
 
 
+def _signals(result: Dict[str, Any]) -> str:
+    scan = result.get("result") or {}
+    return str(scan["signal_count"]) if "signal_count" in scan else "-"
+
+
+def summary_table(results: List[Dict[str, Any]]) -> str:
+    """Markdown table of scan outcomes, slowest first, with totals."""
+    lines = [
+        "## Summary\n",
+        "| Instrument | Timeframe | Status | Duration (s) | Signals | Attempts |\n",
+        "|---|---|---|---:|---:|---:|\n",
+    ]
+    for result in sorted(results, key=lambda r: r["duration"], reverse=True):
+        status = result["status"] + (" (cached)" if result.get("cached") else "")
+        lines.append(
+            f"| {result['instrument']} | {result['timeframe']} | {status} | {result['duration']:.1f}"
+            f" | {_signals(result)} | {result.get('attempts', 1)} |\n"
+        )
+    ok = sum(r["status"] == "ok" for r in results)
+    lines.append(f"\n{ok}/{len(results)} scans ok\n")
+    return "".join(lines)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Batch FDBScan over instruments and timeframes")
+    parser.add_argument("--instruments", nargs="*", help="Instruments to scan")
+    parser.add_argument("--timeframes", nargs="*", help="Timeframes to scan")
+    parser.add_argument("--cache-dir", default="cache", help="Directory used for JGT_CACHE")
+    parser.add_argument("--log-dir", default="logs", help="Directory for the markdown log")
+    parser.add_argument("--workers", type=int, help="Maximum concurrent scans")
+    parser.add_argument("--force", action="store_true", help="Rescan even if no bar closed since the last run")
+    parser.add_argument("--timeout", type=float, help="Seconds before a single scan is killed")
+    parser.add_argument("--retries", type=int, default=0, help="Reruns of a failed or timed-out scan")
+    args = parser.parse_args()
+    print(run_batch(args.instruments, args.timeframes, args.cache_dir, args.log_dir,
+                    workers=args.workers, force=args.force, timeout=args.timeout, retries=args.retries))
+
+
 if __name__ == "__main__":
-    run_batch()
+    main()
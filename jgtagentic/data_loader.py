@@ -5,20 +5,207 @@ Provides data access from jgt-data-server API for regime detection and signal sc
 """
 
 import os
+import time
 import logging
+import threading
+import numpy as np
 import pandas as pd
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 import requests
 
+from .market_store import MarketStore, normalize_instrument
+from .profiling import profiled_load
+from .timeframes import last_bar_close
+
+# Optional binary payload decoders - the loader negotiates only what is installed
+try:
+    import pyarrow as pa
+    _ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    _ARROW_AVAILABLE = False
+
+try:
+    import msgpack
+    _MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    _MSGPACK_AVAILABLE = False
+
+ARROW_STREAM_MIME = "application/vnd.apache.arrow.stream"
+MSGPACK_MIME = "application/msgpack"
+COLUMNS_JSON_MIME = "application/vnd.jgt.columns+json"
+JSON_MIME = "application/json"
+
+# Known CDS/PDS/TTF schema used by typed reads: prices fit float32, zone and
+# colour columns are low-cardinality strings.
+FLOAT32_COLUMNS = (
+    "Open", "High", "Low", "Close", "Median",
+    "jaw", "teeth", "lips", "bjaw", "bteeth", "blips", "tjaw", "tteeth", "tlips",
+    "fh", "fl",
+)
+CATEGORICAL_COLUMNS = ("zcol", "aocolor", "accolor")
+KNOWN_DTYPES: Dict[str, str] = {
+    **{col: "float32" for col in FLOAT32_COLUMNS},
+    **{col: "category" for col in CATEGORICAL_COLUMNS},
+}
+
+# Data types fetched together by DataLoader.load_bundle
+BUNDLE_TYPES = ("cds", "pds", "ttf")
+
+# Where DataLoader looks first (env: JGT_DATA_SOURCE_POLICY)
+SOURCE_POLICIES = ("api-first", "local-first", "local-if-fresh", "api-only")
+
+# Signal flag columns compacted to int8 when they hold small integers only
+SIGNAL_FLAG_PREFIXES = ("fdb", "mfi_", "zone_sig", "zlc", "aoaz", "aobz")
+
+
+def _fits_int8(values: np.ndarray) -> bool:
+    if len(values) == 0:
+        return False
+    if values.dtype.kind == "f":
+        if np.isnan(values).any() or not np.all(np.mod(values, 1) == 0):
+            return False
+    return -128 <= values.min() and values.max() <= 127
+
+
+def _fits_float32(values: np.ndarray, rtol: float) -> bool:
+    with np.errstate(over="ignore"):
+        narrowed = values.astype(np.float32).astype(np.float64)
+    return bool(np.allclose(narrowed, values, rtol=rtol, atol=0, equal_nan=True))
+
+
+def compact_frame(
+    df: pd.DataFrame,
+    rtol: float = 1e-6,
+    category_ratio: float = 0.5,
+    exclude: Sequence[str] = ()
+) -> pd.DataFrame:
+    """
+    Downcast columns to smaller dtypes without changing what they mean.
+    
+    - Signal flag columns (see SIGNAL_FLAG_PREFIXES) holding small integers
+      and no NaN become int8
+    - Other float64 columns become float32 when every value round-trips
+      within ``rtol`` (relative)
+    - Wider integer columns shrink to the smallest integer dtype that fits
+    - String columns with at most ``category_ratio`` distinct values per row
+      become categorical
+    
+    Args:
+        df: Frame to compact (not modified)
+        rtol: Largest relative error accepted for float32
+        category_ratio: Distinct/total ratio under which strings become categorical
+        exclude: Columns left untouched
+    
+    Returns:
+        Compacted frame
+    """
+    casts: Dict[str, Any] = {}
+    for name in df.columns:
+        if name in exclude:
+            continue
+        series = df[name]
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(dtype):
+            continue
+        if pd.api.types.is_float_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+            values = series.to_numpy()
+            if str(name).startswith(SIGNAL_FLAG_PREFIXES) and _fits_int8(values):
+                if dtype != np.int8:
+                    casts[name] = "int8"
+            elif dtype == np.float64 and _fits_float32(values, rtol):
+                casts[name] = "float32"
+            elif pd.api.types.is_integer_dtype(dtype):
+                smallest = pd.to_numeric(series, downcast="integer").dtype
+                if smallest != dtype:
+                    casts[name] = smallest
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if len(series) and series.nunique(dropna=True) <= category_ratio * len(series):
+                casts[name] = "category"
+    return df.astype(casts) if casts else df
+
+
+@dataclass
+class CachedFrame:
+    """In-process copy of a loaded frame and the bookkeeping needed to refresh it."""
+    frame: pd.DataFrame
+    last_timestamp: Optional[pd.Timestamp] = None
+    fetched_at: float = 0.0
+    source: str = "api"
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing service, then let single probes through.
+    
+    CLOSED: calls allowed, consecutive failures counted
+    OPEN: calls refused until ``reset_timeout`` seconds have passed
+    HALF_OPEN: one probe call allowed; success closes, failure re-opens
+    """
+    
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+    
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+    
+    def allow(self) -> bool:
+        """Whether a call may be attempted now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+    
+    def record_failure(self) -> bool:
+        """Count a failure. Returns True when this failure opened the circuit."""
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                opened = self.state != self.OPEN
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+                return opened
+            return False
+
 
 class DataLoader:
     """
     Load market data from jgt-data-server or local files.
     
     Supports:
-    - jgt-data-server REST API
+    - jgt-data-server REST API (Arrow IPC, msgpack, columnar or row JSON payloads)
+    - Incremental (delta) API refresh of cached frames
+    - Memory-mapped column store (see market_store.py)
     - Local file system (fallback)
+    - Circuit breaker on the API and a short-lived cache of missing keys/files
+    - Reuse of frames fetched since the last bar close (see prefetch.py)
+    - Source policies (api-first, local-first, local-if-fresh, api-only) and
+      reuse of parsed local files until their mtime/size changes
+    - Optional dtype compaction of loaded frames (see compact_frame)
     - Environment variable configuration
     """
     
@@ -26,7 +213,22 @@ class DataLoader:
         self,
         data_server_url: Optional[str] = None,
         local_data_path: Optional[str] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        incremental: Optional[bool] = None,
+        overlap_bars: int = 2,
+        timestamp_column: str = "Date",
+        typed: bool = False,
+        csv_engine: Optional[str] = None,
+        store_path: Optional[str] = None,
+        api_timeout: Optional[float] = None,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        negative_ttl: float = 60.0,
+        reuse_within_bar: bool = False,
+        source_policy: Optional[str] = None,
+        reuse_local: bool = True,
+        compact: Optional[bool] = None,
+        compact_rtol: float = 1e-6
     ):
         """
         Initialize data loader.
@@ -35,6 +237,34 @@ class DataLoader:
             data_server_url: URL of jgt-data-server (env: JGT_DATA_SERVER_URL)
             local_data_path: Path to local data files (env: JGTPY_DATA)
             logger: Logger instance
+            incremental: Remember the last timestamp per key and only request
+                newer rows on subsequent loads (env: JGT_DATA_INCREMENTAL=1)
+            overlap_bars: Number of trailing bars re-requested on each delta
+                fetch so revised last bars replace their cached version
+            timestamp_column: Column holding the bar timestamp
+            typed: Apply KNOWN_DTYPES (float32 prices, categorical zones) and
+                use the parsed timestamp column as index
+            csv_engine: pandas CSV engine for local reads, e.g. 'pyarrow'
+                (env: JGT_CSV_ENGINE; falls back to 'c' if unavailable)
+            store_path: Root of a memory-mapped market store preferred over
+                re-parsing CSVs (env: JGT_STORE_PATH)
+            api_timeout: Seconds to wait for the API (env: JGT_DATA_SERVER_TIMEOUT, default 10)
+            failure_threshold: Consecutive API failures before the circuit opens
+            reset_timeout: Seconds the circuit stays open before a probe request
+            negative_ttl: Seconds a missing API key or local file is remembered
+            reuse_within_bar: Serve a frame fetched after the timeframe's last
+                bar close from memory instead of fetching it again
+            source_policy: One of SOURCE_POLICIES (env: JGT_DATA_SOURCE_POLICY,
+                default 'api-first'). 'local-if-fresh' reads the local file
+                when it was written after the timeframe's last bar close and
+                asks the API otherwise
+            reuse_local: Keep parsed local files in memory and return them
+                again while the file's mtime and size are unchanged
+            compact: Downcast loaded frames with compact_frame - float32
+                indicators, int8 signal flags, categorical strings
+                (env: JGT_DATA_COMPACT=1)
+            compact_rtol: Largest relative error accepted when narrowing
+                float64 columns to float32
         """
         self.logger = logger or logging.getLogger("DataLoader")
         
@@ -50,13 +280,68 @@ class DataLoader:
             "/src/jgtml/data"
         )
         
+        if incremental is None:
+            incremental = os.getenv("JGT_DATA_INCREMENTAL") == "1"
+        self.incremental = incremental
+        self.overlap_bars = max(1, overlap_bars)
+        self.timestamp_column = timestamp_column
+        self.typed = typed
+        
+        csv_engine = csv_engine or os.getenv("JGT_CSV_ENGINE")
+        if csv_engine == "pyarrow" and not _ARROW_AVAILABLE:
+            self.logger.info("[DataLoader] pyarrow not installed - using the C CSV engine")
+            csv_engine = None
+        self.csv_engine = csv_engine
+        
+        store_path = store_path or os.getenv("JGT_STORE_PATH")
+        self.store = MarketStore(store_path, logger=self.logger) if store_path else None
+        
+        # Guards the caches and counters below: prefetch threads share the loader
+        self._state_lock = threading.Lock()
+        # Frames kept for delta refresh and within-bar reuse, keyed by
+        # (instrument, timeframe, data_type, dataset, projected columns)
+        self._cache: Dict[Tuple[Any, ...], CachedFrame] = {}
+        self.stats: Dict[str, int] = {
+            "api_requests": 0,
+            "delta_requests": 0,
+            "api_bytes": 0,
+            "local_reads": 0,
+            "store_reads": 0,
+            "api_skipped": 0,
+            "negative_hits": 0,
+            "warm_hits": 0,
+            "bundle_requests": 0,
+            "local_cache_hits": 0,
+        }
+        
+        self.api_timeout = api_timeout or float(os.getenv("JGT_DATA_SERVER_TIMEOUT", "10"))
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.negative_ttl = negative_ttl
+        self._missing: Dict[Any, float] = {}
+        self.reuse_within_bar = reuse_within_bar
+        self._bundle_supported = True
+        
+        source_policy = source_policy or os.getenv("JGT_DATA_SOURCE_POLICY", "api-first")
+        if source_policy not in SOURCE_POLICIES:
+            raise ValueError(f"Unknown source policy: {source_policy} (expected one of {', '.join(SOURCE_POLICIES)})")
+        self.source_policy = source_policy
+        self.reuse_local = reuse_local
+        if compact is None:
+            compact = os.getenv("JGT_DATA_COMPACT") == "1"
+        self.compact = compact
+        self.compact_rtol = compact_rtol
+        # Parsed CSVs keyed by (path, projected columns) -> ((mtime_ns, size), frame)
+        self._parsed: Dict[Tuple[str, Any], Tuple[Tuple[int, int], pd.DataFrame]] = {}
+        
         self.logger.info(f"[DataLoader] Initialized - Server: {self.data_server_url}, Local: {self.local_data_path}")
     
+    @profiled_load
     def load_cds(
         self,
         instrument: str,
         timeframe: str,
-        dataset: str = "current"
+        dataset: str = "current",
+        columns: Optional[Sequence[str]] = None
     ) -> Optional[pd.DataFrame]:
         """
         Load CDS (signal) data for an instrument.
@@ -65,24 +350,21 @@ class DataLoader:
             instrument: Instrument name (e.g., 'EUR-USD')
             timeframe: Timeframe (e.g., 'H4', 'D1')
             dataset: Dataset name ('current' or 'discovery')
+            columns: Only load these columns (timestamp column is always kept),
+                e.g. ['High', 'Low', 'Close'] for regime detection
         
         Returns:
             DataFrame with CDS data or None
         """
-        # Try API first
-        df = self._load_from_api(instrument, timeframe, "cds", dataset)
-        
-        # Fallback to local files
-        if df is None:
-            df = self._load_from_local(instrument, timeframe, "cds", dataset)
-        
-        return df
+        return self._load(instrument, timeframe, "cds", dataset, columns)
     
+    @profiled_load
     def load_pds(
         self,
         instrument: str,
         timeframe: str,
-        dataset: str = "current"
+        dataset: str = "current",
+        columns: Optional[Sequence[str]] = None
     ) -> Optional[pd.DataFrame]:
         """
         Load PDS (price) data for an instrument.
@@ -91,20 +373,20 @@ class DataLoader:
             instrument: Instrument name
             timeframe: Timeframe
             dataset: Dataset name
+            columns: Only load these columns (timestamp column is always kept)
         
         Returns:
             DataFrame with PDS data or None
         """
-        df = self._load_from_api(instrument, timeframe, "pds", dataset)
-        if df is None:
-            df = self._load_from_local(instrument, timeframe, "pds", dataset)
-        return df
+        return self._load(instrument, timeframe, "pds", dataset, columns)
     
+    @profiled_load
     def load_ttf(
         self,
         instrument: str,
         timeframe: str,
-        dataset: str = "current"
+        dataset: str = "current",
+        columns: Optional[Sequence[str]] = None
     ) -> Optional[pd.DataFrame]:
         """
         Load TTF (cross-timeframe features) data.
@@ -113,23 +395,247 @@ class DataLoader:
             instrument: Instrument name
             timeframe: Timeframe
             dataset: Dataset name
+            columns: Only load these columns (timestamp column is always kept)
         
         Returns:
             DataFrame with TTF data or None
         """
-        df = self._load_from_api(instrument, timeframe, "ttf", dataset)
+        return self._load(instrument, timeframe, "ttf", dataset, columns)
+    
+    @profiled_load
+    def load_bundle(
+        self,
+        instrument: str,
+        timeframe: str,
+        dataset: str = "current",
+        data_types: Sequence[str] = BUNDLE_TYPES,
+        columns: Optional[Dict[str, Sequence[str]]] = None,
+        align: bool = True
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Load several data types of one key in a single API round-trip.
+        
+        Types the API cannot provide are read from local files (store or CSV)
+        without a separate API attempt each. Servers without bundle support
+        are detected once and then loaded per type.
+        
+        Args:
+            instrument: Instrument name
+            timeframe: Timeframe
+            dataset: Dataset name
+            data_types: Data types to load, the first being the alignment base
+            columns: Optional projection per data type, e.g. {'cds': ['Close', 'fdbb']}
+            align: Index every frame by timestamp and reindex onto the first
+                loaded type, so rows line up across types
+        
+        Returns:
+            Dict of data type -> DataFrame (None where unavailable)
+        """
+        data_types = list(data_types)
+        wanted = {dt: self._projection((columns or {}).get(dt)) for dt in data_types}
+        keys = {dt: (instrument, timeframe, dt, dataset, tuple(wanted[dt]) if wanted[dt] else None) for dt in data_types}
+        
+        frames: Dict[str, Optional[pd.DataFrame]] = {}
+        if self.reuse_within_bar:
+            for dt in data_types:
+                warm = self._warm_frame(keys[dt], timeframe)
+                if warm is not None:
+                    self._count("warm_hits")
+                    frames[dt] = warm
+        
+        tried_local = set()
+        for dt in data_types:
+            if dt not in frames and self._prefers_local(instrument, timeframe, dt, dataset):
+                tried_local.add(dt)
+                df = self._load_from_local(instrument, timeframe, dt, dataset, wanted[dt])
+                if df is not None:
+                    if self.reuse_within_bar:
+                        self._remember(keys[dt], df, source="local")
+                    frames[dt] = df
+        
+        pending = [dt for dt in data_types if dt not in frames]
+        if pending:
+            fetched = self._load_bundle_from_api(instrument, timeframe, dataset, pending, wanted)
+            if fetched is None:
+                # No bundle support on the server - one request per type
+                for dt in pending:
+                    frames[dt] = self._load(instrument, timeframe, dt, dataset, wanted[dt])
+            else:
+                for dt in pending:
+                    df = fetched.get(dt)
+                    source = "api"
+                    if df is None and dt not in tried_local and self.source_policy != "api-only":
+                        df = self._load_from_local(instrument, timeframe, dt, dataset, wanted[dt])
+                        source = "local"
+                    if df is not None and (self.reuse_within_bar or (self.incremental and source == "api")):
+                        self._remember(keys[dt], df, source=source)
+                    frames[dt] = df
+        
+        frames = {dt: frames.get(dt) for dt in data_types}
+        return self._align(frames) if align else frames
+    
+    def refresh(self, instrument: Optional[str] = None) -> None:
+        """
+        Forget cached frames and missing keys so the next load starts fresh.
+        
+        Args:
+            instrument: Only forget this instrument (default: everything)
+        """
+        with self._state_lock:
+            if instrument is None:
+                self._cache.clear()
+                self._missing.clear()
+                self._parsed.clear()
+                return
+            for key in [k for k in self._cache if k[0] == instrument]:
+                del self._cache[key]
+            for key in [k for k in self._missing if k[1] == instrument]:
+                del self._missing[key]
+            prefix = f"{normalize_instrument(instrument)}-"
+            for key in [k for k in self._parsed if Path(k[0]).name.startswith(prefix)]:
+                del self._parsed[key]
+    
+    def _load(
+        self,
+        instrument: str,
+        timeframe: str,
+        data_type: str,
+        dataset: str,
+        columns: Optional[Sequence[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """Try the API first, then fall back to local files."""
+        wanted = self._projection(columns)
+        key = (instrument, timeframe, data_type, dataset, tuple(wanted) if wanted else None)
+        if self.reuse_within_bar:
+            warm = self._warm_frame(key, timeframe)
+            if warm is not None:
+                self._count("warm_hits")
+                return warm
+        
+        df = None
+        tried_local = self._prefers_local(instrument, timeframe, data_type, dataset)
+        if tried_local:
+            df = self._load_from_local(instrument, timeframe, data_type, dataset, wanted)
         if df is None:
-            df = self._load_from_local(instrument, timeframe, "ttf", dataset)
+            df = self._load_from_api(instrument, timeframe, data_type, dataset, wanted)
+            if df is not None:
+                return df
+            if tried_local or self.source_policy == "api-only":
+                return None
+            # API unavailable - stale or unchecked local data still beats nothing
+            df = self._load_from_local(instrument, timeframe, data_type, dataset, wanted)
+        if df is not None and self.reuse_within_bar:
+            self._remember(key, df, source="local")
         return df
     
+    def _prefers_local(self, instrument: str, timeframe: str, data_type: str, dataset: str) -> bool:
+        """Whether the source policy reads local files before asking the API."""
+        if self.source_policy == "local-first":
+            return True
+        if self.source_policy != "local-if-fresh":
+            return False
+        file_path = self._local_path(instrument, timeframe, data_type, dataset)
+        try:
+            mtime = file_path.stat().st_mtime
+            return mtime >= last_bar_close(timeframe).timestamp()
+        except (OSError, ValueError):
+            return False
+    
+    def _warm_frame(self, key: Tuple[Any, ...], timeframe: str) -> Optional[pd.DataFrame]:
+        """Cached frame for a key if it was fetched after the current bar opened."""
+        with self._state_lock:
+            cached = self._cache.get(key)
+        if cached is None:
+            return None
+        try:
+            bar_open = last_bar_close(timeframe).timestamp()
+        except ValueError:
+            return None
+        # Shallow copy so callers adding/dropping columns don't alter the cached frame
+        return cached.frame.copy(deep=False) if cached.fetched_at >= bar_open else None
+    
+    def start_prefetch(self, instruments: Sequence[str], timeframes: Sequence[str], **kwargs):
+        """
+        Warm this loader's cache right after each timeframe's bar close.
+        
+        Enables ``reuse_within_bar`` so decisions made after the close are
+        served the prefetched frames.
+        
+        Args:
+            instruments: Active universe
+            timeframes: Timeframes to refresh
+            **kwargs: Passed to BarClosePrefetcher (data_types, columns, delay, jitter, ...)
+        
+        Returns:
+            Started BarClosePrefetcher (call ``stop()`` to end it)
+        """
+        from .prefetch import BarClosePrefetcher
+        
+        self.reuse_within_bar = True
+        prefetcher = BarClosePrefetcher(self, instruments, timeframes, logger=self.logger, **kwargs)
+        return prefetcher.start()
+    
+    def _projection(self, columns: Optional[Sequence[str]]) -> Optional[List[str]]:
+        """Requested columns plus the timestamp column, or None for all columns."""
+        if not columns:
+            return None
+        wanted = list(dict.fromkeys(columns))
+        if self.timestamp_column not in wanted:
+            wanted.insert(0, self.timestamp_column)
+        return wanted
+    
+    def _apply_schema(self, df: pd.DataFrame, mapped: bool = False) -> pd.DataFrame:
+        """
+        Cast known columns to KNOWN_DTYPES, index by parsed timestamp and compact.
+        
+        ``mapped`` frames (from the market store) are only indexed: a cast
+        would copy their memory-mapped columns, so the store is written with
+        the target dtypes instead (``market_store convert --typed --compact``).
+        """
+        if not self.typed:
+            return df if mapped else self._compact(df)
+        if mapped:
+            if self.timestamp_column in df.columns:
+                # Shallow copy + del leaves the other mapped columns untouched
+                df = df.copy(deep=False)
+                df.index = pd.DatetimeIndex(pd.to_datetime(df[self.timestamp_column], errors="coerce"))
+                del df[self.timestamp_column]
+            return df
+        casts = {c: t for c, t in KNOWN_DTYPES.items() if c in df.columns and df[c].dtype != t}
+        if casts:
+            df = df.astype(casts)
+        if self.timestamp_column in df.columns:
+            df = df.set_index(pd.to_datetime(df[self.timestamp_column], errors="coerce"))
+            df = df.drop(columns=[self.timestamp_column])
+        return self._compact(df)
+    
+    def _compact(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply compact_frame when enabled, leaving the timestamp column alone."""
+        if not self.compact:
+            return df
+        return compact_frame(df, rtol=self.compact_rtol, exclude=(self.timestamp_column,))
+    
     def _load_from_api(
         self,
         instrument: str,
         timeframe: str,
         data_type: str,
-        dataset: str
+        dataset: str,
+        columns: Optional[List[str]] = None
     ) -> Optional[pd.DataFrame]:
-        """Load data from jgt-data-server API."""
+        """Load data from jgt-data-server API (only newer rows when incremental)."""
+        key = (instrument, timeframe, data_type, dataset, tuple(columns) if columns else None)
+        missing_key = ("api", instrument, timeframe, data_type, dataset)
+        if self._known_missing(missing_key):
+            return None
+        if not self.breaker.allow():
+            self._count("api_skipped")
+            return None
+        
+        with self._state_lock:
+            cached = self._cache.get(key) if self.incremental else None
+        if cached is not None and cached.source != "api":
+            cached = None
         try:
             url = f"{self.data_server_url}/market-data"
             params = {
@@ -138,46 +644,439 @@ class DataLoader:
                 "data_type": data_type,
                 "dataset": dataset
             }
+            if columns:
+                params["columns"] = ",".join(columns)
             
-            response = requests.get(url, params=params, timeout=10)
+            since = self._delta_since(cached)
+            if since is not None:
+                params["since"] = since.isoformat()
+                self._count("delta_requests")
+            
+            try:
+                response = requests.get(
+                    url,
+                    params=params,
+                    headers={"Accept": self._accept_header()},
+                    timeout=self.api_timeout
+                )
+            except requests.RequestException as e:
+                self._record_api_failure(e)
+                return None
+            self._count("api_requests")
+            self._count("api_bytes", len(response.content or b""))
+            
+            if response.status_code >= 500:
+                self._record_api_failure(f"HTTP {response.status_code}")
+                return None
+            self.breaker.record_success()
+            
+            if response.status_code == 404:
+                self._mark_missing(missing_key)
             
             if response.status_code == 200:
-                data = response.json()
-                if data.get("success") and data.get("data"):
-                    df = pd.DataFrame(data["data"])
+                payload = self._decode_payload(response)
+                if payload is not None:
+                    payload = self._select(payload, columns)
+                if payload is not None and since is not None:
+                    delta = payload
+                    df = self._merge_delta(cached, delta)
+                    self._remember(key, df)
+                    self.logger.info(
+                        f"[DataLoader] Merged {len(delta)} {data_type} rows from API: {instrument} {timeframe}"
+                    )
+                    return df
+                if payload is not None and not payload.empty:
+                    df = self._apply_schema(self._normalize_timestamps(payload))
+                    if self.incremental or self.reuse_within_bar:
+                        self._remember(key, df)
                     self.logger.info(f"[DataLoader] Loaded {data_type} from API: {instrument} {timeframe}")
                     return df
+                if payload is None:
+                    self._mark_missing(missing_key)
             
             self.logger.warning(f"[DataLoader] API load failed: {response.status_code}")
             return None
-            
+        
         except Exception as e:
             self.logger.warning(f"[DataLoader] API error: {e}")
             return None
     
+    def _load_bundle_from_api(
+        self,
+        instrument: str,
+        timeframe: str,
+        dataset: str,
+        data_types: List[str],
+        wanted: Dict[str, Optional[List[str]]]
+    ) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Request several data types from /market-data at once.
+        
+        The server answers ``{"success": true, "data": {"cds": ..., "pds": ...}}``
+        with each entry in any of the row/columnar layouts.
+        
+        Returns:
+            Frames per data type found (possibly empty), or None if the server
+            does not support bundles. Only a 200 success envelope whose data is
+            keyed by the requested types counts as bundle support; any other
+            answer disables bundles and marks nothing missing.
+        """
+        if not self._bundle_supported:
+            return None
+        missing_keys = {dt: ("api", instrument, timeframe, dt, dataset) for dt in data_types}
+        data_types = [dt for dt in data_types if not self._known_missing(missing_keys[dt])]
+        if not data_types:
+            return {}
+        if not self.breaker.allow():
+            self._count("api_skipped")
+            return {}
+        
+        params = {
+            "instrument": instrument,
+            "timeframe": timeframe,
+            "dataset": dataset,
+            "data_types": ",".join(data_types)
+        }
+        for dt in data_types:
+            if wanted.get(dt):
+                params[f"columns_{dt}"] = ",".join(wanted[dt])
+        
+        try:
+            response = requests.get(
+                f"{self.data_server_url}/market-data",
+                params=params,
+                headers={"Accept": self._accept_header(allow_arrow=False)},
+                timeout=self.api_timeout
+            )
+        except requests.RequestException as e:
+            self._record_api_failure(e)
+            return {}
+        self._count("api_requests")
+        self._count("bundle_requests")
+        self._count("api_bytes", len(response.content or b""))
+        
+        if response.status_code >= 500:
+            self._record_api_failure(f"HTTP {response.status_code}")
+            return {}
+        self.breaker.record_success()
+        if response.status_code == 404:
+            for key in missing_keys.values():
+                self._mark_missing(key)
+            return {}
+        
+        data = None
+        if response.status_code == 200:
+            try:
+                envelope = self._decode_envelope(response)
+            except Exception as e:
+                self.logger.warning(f"[DataLoader] API bundle error: {e}")
+                envelope = None
+            if isinstance(envelope, dict) and envelope.get("success"):
+                data = envelope.get("data")
+        if not isinstance(data, dict) or not data or not set(data) <= set(data_types):
+            self._bundle_supported = False
+            self.logger.info(
+                f"[DataLoader] No bundle support (HTTP {response.status_code}) - loading bundles per type"
+            )
+            return None
+        
+        frames: Dict[str, pd.DataFrame] = {}
+        try:
+            for dt in data_types:
+                df = self._frame_from_data(data.get(dt))
+                if df.empty:
+                    self._mark_missing(missing_keys[dt])
+                    continue
+                df = self._select(df, wanted.get(dt))
+                frames[dt] = self._apply_schema(self._normalize_timestamps(df))
+        except Exception as e:
+            self.logger.warning(f"[DataLoader] API bundle error: {e}")
+            return {}
+        
+        self.logger.info(
+            f"[DataLoader] Loaded bundle {','.join(frames) or '-'} from API: {instrument} {timeframe}"
+        )
+        return frames
+    
+    def _record_api_failure(self, error: Any) -> None:
+        """Count an unreachable/failing API call against the circuit breaker."""
+        if self.breaker.record_failure():
+            self.logger.warning(
+                f"[DataLoader] API circuit open after {self.breaker.failures} failures "
+                f"({error}) - using local data for {self.breaker.reset_timeout:.0f}s"
+            )
+        else:
+            self.logger.warning(f"[DataLoader] API error: {error}")
+    
+    def _known_missing(self, key: Any) -> bool:
+        """True while a key/file is remembered as missing."""
+        with self._state_lock:
+            expires = self._missing.get(key)
+            if expires is None:
+                return False
+            if time.monotonic() >= expires:
+                self._missing.pop(key, None)
+                return False
+            self.stats["negative_hits"] += 1
+            return True
+    
+    def _mark_missing(self, key: Any) -> None:
+        if self.negative_ttl > 0:
+            with self._state_lock:
+                self._missing[key] = time.monotonic() + self.negative_ttl
+    
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._state_lock:
+            self.stats[name] += amount
+    
+    @staticmethod
+    def _accept_header(allow_arrow: bool = True) -> str:
+        """Accept header preferring the most compact payload we can decode."""
+        offers = []
+        if _ARROW_AVAILABLE and allow_arrow:
+            offers.append(ARROW_STREAM_MIME)
+        if _MSGPACK_AVAILABLE:
+            offers.append(f"{MSGPACK_MIME};q=0.9")
+        offers.append(f"{COLUMNS_JSON_MIME};q=0.8")
+        offers.append(f"{JSON_MIME};q=0.5")
+        return ", ".join(offers)
+    
+    def _decode_payload(self, response) -> Optional[pd.DataFrame]:
+        """
+        Decode a /market-data response into a DataFrame.
+        
+        Arrow IPC streams are read directly into columns. msgpack and JSON
+        bodies share the ``{"success": ..., "data": ...}`` envelope where
+        ``data`` is either column-oriented (dict of lists) or the legacy
+        list of row dicts.
+        
+        Returns:
+            DataFrame (possibly empty) on success, None if the server reported failure
+        """
+        content_type = (response.headers or {}).get("Content-Type", JSON_MIME).split(";")[0].strip()
+        
+        if content_type == ARROW_STREAM_MIME and _ARROW_AVAILABLE:
+            return pa.ipc.open_stream(response.content).read_all().to_pandas()
+        
+        envelope = self._decode_envelope(response)
+        if not envelope.get("success"):
+            return None
+        return self._frame_from_data(envelope.get("data"))
+    
+    @staticmethod
+    def _decode_envelope(response) -> Dict[str, Any]:
+        """Decode a msgpack or JSON ``{"success": ..., "data": ...}`` body."""
+        content_type = (response.headers or {}).get("Content-Type", JSON_MIME).split(";")[0].strip()
+        if content_type == MSGPACK_MIME and _MSGPACK_AVAILABLE:
+            return msgpack.unpackb(response.content, raw=False)
+        return response.json()
+    
+    @classmethod
+    def _frame_from_data(cls, data: Any) -> pd.DataFrame:
+        """Frame from column-oriented (dict of lists) or row-oriented (list of dicts) data."""
+        data = data or []
+        if isinstance(data, dict):
+            return cls._frame_from_columns(data)
+        return pd.DataFrame(data)
+    
+    @staticmethod
+    def _frame_from_columns(columns: Dict[str, Any]) -> pd.DataFrame:
+        """Build a frame from column arrays, typing numeric columns without row dicts."""
+        arrays = {}
+        for name, values in columns.items():
+            arr = np.asarray(values)
+            if arr.dtype == object:
+                # Numeric columns with nulls come through as object; None -> NaN
+                try:
+                    arr = np.asarray(values, dtype="float64")
+                except (TypeError, ValueError):
+                    pass
+            arrays[name] = arr
+        return pd.DataFrame(arrays, copy=False)
+    
+    @staticmethod
+    def _select(df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Project to the requested columns in case the server ignored the hint."""
+        if not columns:
+            return df
+        return df[[c for c in columns if c in df.columns]]
+    
+    def _stamps(self, df: pd.DataFrame) -> Optional[pd.Series]:
+        """Bar timestamps of a frame, from the timestamp column or the typed index."""
+        if self.timestamp_column in df.columns:
+            return df[self.timestamp_column]
+        if df.index.name == self.timestamp_column:
+            return df.index.to_series()
+        return None
+    
+    def _delta_since(self, cached: Optional[CachedFrame]) -> Optional[pd.Timestamp]:
+        """Timestamp to request from, reaching back ``overlap_bars`` bars."""
+        if cached is None or cached.last_timestamp is None:
+            return None
+        stamps = self._stamps(cached.frame)
+        if len(stamps) < self.overlap_bars:
+            return None
+        return stamps.iloc[-self.overlap_bars]
+    
+    def _normalize_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Parse the timestamp column so cached and delta rows compare reliably."""
+        if self.incremental and self.timestamp_column in df.columns:
+            df[self.timestamp_column] = pd.to_datetime(df[self.timestamp_column], errors="coerce")
+        return df
+    
+    def _merge_delta(self, cached: CachedFrame, delta: pd.DataFrame) -> pd.DataFrame:
+        """Append new rows to the cached frame, replacing revised overlapping bars."""
+        if delta.empty:
+            return cached.frame.copy(deep=False)
+        delta = self._apply_schema(self._normalize_timestamps(delta))
+        if self.timestamp_column in cached.frame.columns:
+            merged = pd.concat([cached.frame, delta], ignore_index=True)
+            merged = merged.drop_duplicates(subset=[self.timestamp_column], keep="last")
+            return self._compact(merged.sort_values(self.timestamp_column).reset_index(drop=True))
+        # Typed frames are indexed by timestamp
+        merged = pd.concat([cached.frame, delta])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        return self._apply_schema(merged)
+    
+    def _align(self, frames: Dict[str, Optional[pd.DataFrame]]) -> Dict[str, Optional[pd.DataFrame]]:
+        """Index frames by timestamp and reindex them onto the first available one."""
+        indexed: Dict[str, Optional[pd.DataFrame]] = {}
+        for dt, df in frames.items():
+            if df is not None and self.timestamp_column in df.columns:
+                df = df.set_index(self.timestamp_column)
+                df.index = pd.to_datetime(df.index, errors="coerce")
+            if df is not None and df.index.name == self.timestamp_column:
+                df = df[~df.index.duplicated(keep="last")]
+            indexed[dt] = df
+        
+        base = next(
+            (df.index for df in indexed.values() if df is not None and df.index.name == self.timestamp_column),
+            None
+        )
+        if base is None:
+            return frames
+        return {
+            dt: df.reindex(base) if df is not None and df.index.name == self.timestamp_column else df
+            for dt, df in indexed.items()
+        }
+    
+    def _remember(self, key: Tuple[Any, ...], df: pd.DataFrame, source: str = "api") -> None:
+        """Record a frame, when it was fetched and its last timestamp for the next delta fetch."""
+        if df.empty:
+            with self._state_lock:
+                self._cache.pop(key, None)
+            return
+        stamps = self._stamps(df)
+        entry = CachedFrame(
+            frame=df.copy(deep=False),
+            last_timestamp=stamps.iloc[-1] if stamps is not None else None,
+            fetched_at=time.time(),
+            source=source,
+        )
+        with self._state_lock:
+            self._cache[key] = entry
+    
     def _load_from_local(
         self,
         instrument: str,
         timeframe: str,
         data_type: str,
-        dataset: str
+        dataset: str,
+        columns: Optional[List[str]] = None
     ) -> Optional[pd.DataFrame]:
-        """Load data from local file system."""
+        """Load data from local file system (memory-mapped store first, then CSV)."""
         try:
-            # Normalize instrument name for file path
-            inst_normalized = instrument.replace('/', '-').replace('_', '-')
+            file_path = self._local_path(instrument, timeframe, data_type, dataset)
+            missing_key = ("local", instrument, str(file_path))
+            if self._known_missing(missing_key):
+                return None
             
-            # Build file path
-            file_path = Path(self.local_data_path) / dataset / data_type / f"{inst_normalized}-{timeframe}.csv"
+            if self.store is not None:
+                df = self._load_from_store(instrument, timeframe, data_type, dataset, columns, file_path)
+                if df is not None:
+                    return df
             
             if file_path.exists():
-                df = pd.read_csv(file_path)
-                self.logger.info(f"[DataLoader] Loaded {data_type} from file: {file_path}")
-                return df
+                return self._read_local(file_path, data_type, columns)
             else:
                 self.logger.warning(f"[DataLoader] File not found: {file_path}")
+                self._mark_missing(missing_key)
                 return None
-                
+        
         except Exception as e:
             self.logger.error(f"[DataLoader] Local load error: {e}")
             return None
+    
+    def _local_path(self, instrument: str, timeframe: str, data_type: str, dataset: str) -> Path:
+        """CSV path of a key under the local data root."""
+        inst_normalized = normalize_instrument(instrument)
+        return Path(self.local_data_path) / dataset / data_type / f"{inst_normalized}-{timeframe}.csv"
+    
+    def _read_local(self, file_path: Path, data_type: str, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Parse a local CSV, reusing the previous parse while the file is unchanged."""
+        stat = file_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        parsed_key = (str(file_path), tuple(columns) if columns else None)
+        if self.reuse_local:
+            with self._state_lock:
+                entry = self._parsed.get(parsed_key)
+            if entry is not None and entry[0] == signature:
+                self._count("local_cache_hits")
+                self.logger.debug(f"[DataLoader] Reused parsed {data_type} file: {file_path}")
+                # Shallow copy so callers adding/dropping columns don't alter the cached frame
+                return entry[1].copy(deep=False)
+        
+        df = self._compact(self._read_csv(file_path, columns))
+        self._count("local_reads")
+        if self.reuse_local:
+            with self._state_lock:
+                self._parsed[parsed_key] = (signature, df)
+            df = df.copy(deep=False)
+        self.logger.info(f"[DataLoader] Loaded {data_type} from file: {file_path}")
+        return df
+    
+    def _load_from_store(
+        self,
+        instrument: str,
+        timeframe: str,
+        data_type: str,
+        dataset: str,
+        columns: Optional[List[str]],
+        csv_path: Path
+    ) -> Optional[pd.DataFrame]:
+        """Open the store entry unless the CSV it was converted from has changed."""
+        stored_mtime = self.store.source_mtime(instrument, timeframe, data_type, dataset)
+        if stored_mtime is not None and csv_path.exists() and csv_path.stat().st_mtime != stored_mtime:
+            self.logger.info(f"[DataLoader] Store entry stale, reading CSV: {csv_path}")
+            return None
+        df = self.store.open(instrument, timeframe, data_type, dataset, columns)
+        if df is None:
+            return None
+        self._count("store_reads")
+        self.logger.info(f"[DataLoader] Mapped {data_type} from store: {instrument} {timeframe}")
+        return self._apply_schema(df, mapped=True)
+    
+    def _read_csv(self, file_path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Read a CDS/PDS/TTF CSV, only parsing the projected columns.
+        
+        With ``typed`` the known dtypes are applied by the parser itself and
+        the timestamp column becomes a DatetimeIndex.
+        """
+        kwargs: Dict[str, Any] = {}
+        if self.csv_engine:
+            kwargs["engine"] = self.csv_engine
+        
+        header = None
+        if columns or self.typed:
+            header = list(pd.read_csv(file_path, nrows=0).columns)
+        if columns:
+            kwargs["usecols"] = [c for c in columns if c in header]
+            header = kwargs["usecols"]
+        if self.typed:
+            kwargs["dtype"] = {c: t for c, t in KNOWN_DTYPES.items() if c in header}
+            if self.timestamp_column in header:
+                kwargs["parse_dates"] = [self.timestamp_column]
+                kwargs["index_col"] = self.timestamp_column
+        
+        return pd.read_csv(file_path, **kwargs)
@@ -2,84 +2,300 @@
 🧠🌸🔮 Enhanced FDB Scanner — Intent-Aware Signal Detection
 
 Purpose: Bridge between intent specifications and signal detection.
+
+Intent specs are compiled once into a ``ScanPlan`` (see scan_plan). For
+every key of the plan the scanner loads the CDS columns the plan needs
+through ``DataLoader``, reads the Alligator state (``AlligatorDetector``),
+scores the latest bar (``SignalScorer``) and checks the spec's ``signals``
+requirements against the result, then marks each key's alignment with its
+higher timeframe. Keys are analyzed concurrently; indicator results are
+kept per key until new data arrives, so rescans within a bar only pay for
+the (warm) data lookup. The indicator cache is an LRU of at most
+``indicator_cache_size`` keys (env: JGT_INDICATOR_CACHE).
 """
 
+import os
 import logging
 import json
-from typing import Dict, List, Optional, Any
+import threading
+import contextvars
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 
+from .alligator_regime import AlligatorDetector, AlligatorResult, AlligatorState, CompatResult
+from .scoring import SignalScorer, ScoredSignal
+from .profiling import phase
+from .history import RingHistory
+from .scan_plan import PlanCache, ScanPlan, SignalPlan
+from .spec_cache import SpecCache
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_INDICATOR_CACHE_SIZE = 512
+
+BIAS_DIRECTIONS = {
+    "bullish": "LONG", "long": "LONG", "buy": "LONG",
+    "bearish": "SHORT", "short": "SHORT", "sell": "SHORT",
+}
+
+
+def _fractal(signals: Dict[str, Any], alligator: AlligatorResult, direction: str) -> bool:
+    """A fractal divergent bar on the latest bar."""
+    return any(signals.get(col) for col in ("fdb", "fdbb", "fdbs"))
+
+
+def _alligator_open(signals: Dict[str, Any], alligator: AlligatorResult, direction: str) -> bool:
+    """Alligator mouth open (EATING)."""
+    return alligator.state == AlligatorState.EATING
+
+
+def _momentum(signals: Dict[str, Any], alligator: AlligatorResult, direction: str) -> bool:
+    """Awesome Oscillator on the side of the trade."""
+    ao = signals.get("ao")
+    if isinstance(ao, (int, float)):
+        return ao > 0 if direction == "LONG" else ao < 0
+    return bool(signals.get("aoaz" if direction == "LONG" else "aobz"))
+
+
+def _volume(signals: Dict[str, Any], alligator: AlligatorResult, direction: str) -> bool:
+    """An active MFI signal."""
+    return any(signals.get(col) for col in ("mfi_sig", "mfi_green", "mfi_fake", "mfi_sq", "mfi"))
+
+
+# jgtml_components keys of a spec signal -> check on the analyzed key
+COMPONENT_CHECKS = {
+    "fractal_analysis": _fractal,
+    "alligator_state": _alligator_open,
+    "momentum": _momentum,
+    "volume_analysis": _volume,
+}
+
+
 class EnhancedFDBScanner:
     """Intent-aware wrapper for the JGT FDB scanner."""
-    
-    def __init__(self, logger=None):
+
+    def __init__(self, logger=None, profiler=None, loader=None,
+                 detector: Optional[AlligatorDetector] = None,
+                 scorer: Optional[SignalScorer] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 history_size: Optional[int] = None,
+                 indicator_cache_size: Optional[int] = None):
+        """
+        Initialize scanner.
+
+        Args:
+            logger: Logger instance
+            profiler: ScanProfiler recording each intent scan
+            loader: DataLoader providing CDS frames (default: one reusing
+                frames within the bar, created on first scan)
+            detector: Alligator detector (default: AlligatorDetector())
+            scorer: Signal scorer (default: SignalScorer())
+            max_workers: Keys analyzed concurrently
+            history_size: Signals kept in signal_history (env: JGT_HISTORY_SIZE)
+            indicator_cache_size: Keys whose indicator results are kept, least
+                recently used evicted first (env: JGT_INDICATOR_CACHE, 0 disables)
+        """
         self.logger = logger or logging.getLogger("EnhancedFDBScanner")
-        self.signal_history = []
-    
-    def scan_with_intent(self, intent_spec: Dict[str, Any]) -> Dict[str, Any]:
-        """Scan for signals using intent specification context."""
-        
+        self.signal_history = RingHistory(history_size, name="signals")
+        self.profiler = profiler
+        self._loader = loader
+        self.detector = detector or AlligatorDetector()
+        self.scorer = scorer or SignalScorer()
+        self.max_workers = max_workers
+        if indicator_cache_size is None:
+            indicator_cache_size = int(os.getenv("JGT_INDICATOR_CACHE", DEFAULT_INDICATOR_CACHE_SIZE))
+        self.indicator_cache_size = max(0, indicator_cache_size)
+        # (instrument, timeframe, columns) -> (data stamp, alligator result, scored signal)
+        self._indicators: "OrderedDict[Tuple[Any, ...], Tuple[Any, AlligatorResult, ScoredSignal]]" = OrderedDict()
+        self._indicators_lock = threading.Lock()
+        self.plans = PlanCache()
+        self.spec_cache = SpecCache(logger=self.logger)
+        self._loader_lock = threading.Lock()
+
+    @property
+    def loader(self):
+        with self._loader_lock:
+            if self._loader is None:
+                from .data_loader import DataLoader
+                self._loader = DataLoader(logger=self.logger, reuse_within_bar=True)
+            return self._loader
+
+    def scan_with_intent(self, intent_spec: Union[Dict[str, Any], ScanPlan]) -> Dict[str, Any]:
+        """Scan for signals using intent specification context (a spec or its compiled plan)."""
+
         self.logger.info("🔍 Starting intent-aware FDB scan")
-        
-        # For now, simulate enhanced scanning
-        enhanced_signals = self._simulate_enhanced_signals(intent_spec)
-        recommendations = self._generate_recommendations(enhanced_signals, intent_spec)
-        
+        started = datetime.now()
+        span = nullcontext()
+        if self.profiler is not None:
+            span = self.profiler.scan()
+        with span as current:
+            with phase("plan"):
+                plan = intent_spec if isinstance(intent_spec, ScanPlan) else self.plans.get(intent_spec)
+            # Label the span once the plan names the keys (an enclosing scan keeps its labels)
+            if current is not None and current.instrument is None and current.timeframe is None:
+                current.instrument = ",".join(plan.instruments) or None
+                current.timeframe = ",".join(plan.timeframes) or None
+            with phase("signals"):
+                enhanced_signals, missing = self._detect_signals(plan)
+            with phase("recommendations"):
+                recommendations = self._generate_recommendations(enhanced_signals, intent_spec)
+
+        self.signal_history.extend(enhanced_signals)
+
         result = {
-            "timestamp": datetime.now().isoformat(),
-            "intent_context": intent_spec,
+            "timestamp": started.isoformat(),
+            "intent_context": plan.to_dict() if intent_spec is plan else intent_spec,
+            "plan": plan.fingerprint,
             "enhanced_signals": enhanced_signals,
             "recommendations": recommendations,
+            "missing_data": missing,
+            "duration": round((datetime.now() - started).total_seconds(), 3),
             "success": True
         }
-        
+
         return result
-    
+
     def scan_from_spec_file(self, spec_file_path: str) -> Dict[str, Any]:
-        """Scan using intent specification from YAML file."""
-        
-        import yaml
-        with open(spec_file_path, 'r') as f:
-            intent_spec = yaml.safe_load(f)
-        
+        """Scan using intent specification from YAML file (parsed once per file content)."""
+
+        intent_spec = self.spec_cache.load(spec_file_path)
         return self.scan_with_intent(intent_spec)
-    
-    def _simulate_enhanced_signals(self, intent_spec: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Simulate enhanced signal detection."""
-        
-        signals = []
-        
-        for instrument in intent_spec.get("instruments", ["EUR/USD"]):
-            signal = {
-                "instrument": instrument,
-                "timeframe": "H4",
-                "direction": intent_spec.get("bias", "neutral"),
-                "quality_score": 0.75,
-                "intent_aligned": True
-            }
-            signals.append(signal)
-        
-        return signals
-    
-    def _generate_recommendations(self, signals: List[Dict[str, Any]], 
+
+    def _detect_signals(self, plan: ScanPlan) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Analyze every key of the plan concurrently, then resolve HTF dependencies."""
+
+        keys = plan.keys
+        workers = max(1, min(self.max_workers, len(keys)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="intent-scan") as pool:
+            # Each key runs in a copy of this context so profiling phases reach the scan
+            futures = [
+                pool.submit(contextvars.copy_context().run, self._analyze, instrument, timeframe, plan)
+                for instrument, timeframe in keys
+            ]
+            analyses = [future.result() for future in futures]
+
+        by_key = {key: a for key, a in zip(keys, analyses) if a is not None}
+        for (instrument, timeframe), analysis in by_key.items():
+            parent = plan.htf.get(timeframe)
+            analysis["htf"] = parent
+            if parent is not None:
+                higher = by_key.get((instrument, parent))
+                analysis["htf_aligned"] = None if higher is None else higher["direction"] == analysis["direction"]
+
+        signals = list(by_key.values())
+        missing = [f"{i} {tf}" for (i, tf), a in zip(keys, analyses) if a is None]
+        if missing:
+            self.logger.info(f"[EnhancedFDBScanner] No data for {len(missing)} of {len(keys)} keys")
+        return signals, missing
+
+    def _analyze(self, instrument: str, timeframe: str, plan: ScanPlan) -> Optional[Dict[str, Any]]:
+        """Indicators, score and requirement checks for one key."""
+
+        try:
+            df = self.loader.load_cds(instrument, timeframe, columns=list(plan.columns))
+        except Exception as e:
+            self.logger.warning(f"[EnhancedFDBScanner] Loading {instrument} {timeframe} failed: {e}")
+            return None
+        if df is None or df.empty:
+            return None
+
+        alligator, scored = self._indicators_for(instrument, timeframe, df, plan.columns)
+        requirements = [
+            self._evaluate_requirement(signal, scored, alligator)
+            for signal in plan.signals
+        ]
+        if requirements:
+            met = all(r["met"] for r in requirements)
+        else:
+            met = alligator.tradeable
+        bias = BIAS_DIRECTIONS.get(plan.bias or "")
+
+        return {
+            "instrument": instrument,
+            "timeframe": timeframe,
+            "direction": scored.direction,
+            "quality_score": round(scored.score / 100, 2),
+            "score": scored.score,
+            "intent_aligned": met and (bias is None or bias == scored.direction),
+            "requirements": requirements,
+            "alligator": alligator.to_dict(),
+            "entry": scored.entry_price,
+            "stop": scored.stop_price,
+            "target": scored.target_price,
+            "risk_reward": round(scored.risk_reward, 2),
+            "factors": scored.breakdown.factors,
+        }
+
+    def _indicators_for(self, instrument: str, timeframe: str, df,
+                        columns: Tuple[str, ...] = ()) -> Tuple[AlligatorResult, ScoredSignal]:
+        """Alligator and score for a frame, reused until the key's data changes."""
+
+        stamp = (len(df), df.index[-1], df["Close"].iloc[-1] if "Close" in df.columns else None)
+        cache_key = (instrument, timeframe, columns)
+        with self._indicators_lock:
+            cached = self._indicators.get(cache_key)
+            if cached is not None and cached[0] == stamp:
+                self._indicators.move_to_end(cache_key)
+                return cached[1], cached[2]
+        with phase("indicators"):
+            alligator = self.detector.detect(df)
+            scored = self.scorer.score(df, CompatResult(alligator), instrument, timeframe)
+        if self.indicator_cache_size:
+            with self._indicators_lock:
+                self._indicators[cache_key] = (stamp, alligator, scored)
+                self._indicators.move_to_end(cache_key)
+                while len(self._indicators) > self.indicator_cache_size:
+                    self._indicators.popitem(last=False)
+        return alligator, scored
+
+    def _evaluate_requirement(self, signal: SignalPlan, scored: ScoredSignal,
+                              alligator: AlligatorResult) -> Dict[str, Any]:
+        """Check one planned signal's components (and optional min_score) on a key."""
+
+        components = {
+            name: COMPONENT_CHECKS[name](scored.active_signals, alligator, scored.direction)
+            for name in signal.components
+        }
+        met = all(components.values()) and (signal.min_score is None or scored.score >= signal.min_score)
+        return {
+            "name": signal.name,
+            "met": met,
+            "components": components,
+            "unchecked": list(signal.unchecked),
+            "priority": signal.priority,
+        }
+
+    def _generate_recommendations(self, signals: List[Dict[str, Any]],
                                 intent_spec: Dict[str, Any]) -> Dict[str, Any]:
         """Generate strategic recommendations based on enhanced signals."""
-        
+
         if not signals:
             return {
                 "action": "wait",
                 "reason": "No signals detected"
             }
-        
-        avg_quality = sum(s.get("quality_score", 0) for s in signals) / len(signals)
-        
+
+        aligned = [s for s in signals if s.get("intent_aligned")]
+        if not aligned:
+            return {
+                "action": "wait",
+                "reason": f"No signal meets the intent requirements ({len(signals)} keys scanned)"
+            }
+
+        avg_quality = sum(s.get("quality_score", 0) for s in aligned) / len(aligned)
+        best = max(aligned, key=lambda s: s.get("score", 0))
+
         if avg_quality >= 0.7:
             return {
                 "action": "validate",
-                "reason": f"Good quality signals detected (avg: {avg_quality:.2f})"
+                "reason": f"Good quality signals detected (avg: {avg_quality:.2f})",
+                "best": f"{best['instrument']} {best['timeframe']} {best['direction']}"
             }
         else:
             return {
-                "action": "wait", 
-                "reason": "Scanner in development"
-            } 
\ No newline at end of file
+                "action": "wait",
+                "reason": f"{len(aligned)} intent-aligned signals below quality threshold (avg: {avg_quality:.2f})",
+                "best": f"{best['instrument']} {best['timeframe']} {best['direction']}"
+            }
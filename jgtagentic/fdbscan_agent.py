@@ -18,6 +18,23 @@ from typing import List, Optional, Dict, Any
 import os
 import sys
 import argparse
+import threading
+import time
+from contextlib import nullcontext, redirect_stdout
+from datetime import datetime, timezone
+
+try:
+    from .scan_workers import run_scans
+    from .ritual_pipeline import run_pipeline
+    from .scan_cache import ScanResultCache, scanner_version
+    from .scan_result import ScanResult, read_signal_output, signals_from
+    from .profiling import ScanProfiler, PROFILE_MODES, phase
+except ImportError:  # imported as a top-level module
+    from jgtagentic.scan_workers import run_scans
+    from jgtagentic.ritual_pipeline import run_pipeline
+    from jgtagentic.scan_cache import ScanResultCache, scanner_version
+    from jgtagentic.scan_result import ScanResult, read_signal_output, signals_from
+    from jgtagentic.profiling import ScanProfiler, PROFILE_MODES, phase
 
 # --- Ritual Import: True FDBScan ---
 # Use the installed jgtml package if available. The tests run in an isolated
@@ -38,6 +55,10 @@ try:
 except ImportError:
     _ENHANCED_AVAILABLE = False
 
+# fdb_scanner_2408.main() reads sys.argv; in-process scans from several
+# threads (e.g. the scan daemon) must not interleave their argv swaps.
+_ARGV_LOCK = threading.Lock()
+
 class FDBScanAgent:
     """
     Enhanced Signal Scribe with intent awareness and strategic automation.
@@ -47,11 +68,21 @@ class FDBScanAgent:
     - Uses enhanced scanner with intent context
     - Provides strategic recommendations
     - Integrates with session management
+    - Skips scans unchanged since the last closed bar (scan_cache or
+      env JGT_SCAN_CACHE=<dir>)
+    - Records per-scan phase timings and data volume (profiler)
+    - Reuses the analysis of repeated observations (observation_capture memo)
+    - Prints scan progress to stdout, or to progress_stream (the CLI passes
+      stderr with --ndjson so stdout carries only JSON lines)
     """
     
-    def __init__(self, logger=None, real: bool = False):
+    def __init__(self, logger=None, real: bool = False, scan_cache: Optional["ScanResultCache"] = None,
+                 profiler: Optional["ScanProfiler"] = None,
+                 observation_capture: Optional["ObservationCapture"] = None,
+                 progress_stream=None):
         self.logger = logger or logging.getLogger("FDBScanAgent")
         self.logger.setLevel(logging.INFO)
+        self.progress_stream = progress_stream
         
         # Default to dry-run mode unless explicitly requested
         self.real = (
@@ -60,10 +91,15 @@ class FDBScanAgent:
             or os.getenv("JGT_ENABLE_REAL_FDBSCAN") == "1"
         )
 
+        if scan_cache is None and os.getenv("JGT_SCAN_CACHE"):
+            scan_cache = ScanResultCache(os.getenv("JGT_SCAN_CACHE"), scanner_version(self.real), self.logger)
+        self.scan_cache = scan_cache
+        self.profiler = profiler
+
         # Initialize enhanced components if available
         if _ENHANCED_AVAILABLE:
-            self.enhanced_scanner = EnhancedFDBScanner(logger=self.logger)
-            self.observation_capture = ObservationCapture(logger=self.logger)
+            self.enhanced_scanner = EnhancedFDBScanner(logger=self.logger, profiler=profiler)
+            self.observation_capture = observation_capture or ObservationCapture(logger=self.logger)
             self.intent_parser = IntentSpecParser()
         else:
             self.enhanced_scanner = None
@@ -159,10 +195,31 @@ class FDBScanAgent:
             }
 
     def scan_timeframe(self, timeframe: str, instrument: Optional[str] = None,
-                      with_intent: bool = False):
+                      with_intent: bool = False, force: bool = False):
         """
         Scan a single timeframe. Enhanced to optionally use intent context.
+
+        With a scan cache, a timeframe already scanned since its last bar
+        close returns the stored result (``cached=True``) instead of scanning
+        again, unless ``force`` is set.
+
+        Progress messages and the scanner's own output go to
+        ``progress_stream`` when one is set, stdout otherwise.
+
+        Returns:
+            ScanResult with signals found, timing and status; the enhanced
+            scanner's dict when ``with_intent`` is used
         """
+        if self.profiler is None:
+            return self._scan_timeframe(timeframe, instrument, with_intent, force)
+        with self.profiler.scan(instrument, timeframe) as span:
+            result = self._scan_timeframe(timeframe, instrument, with_intent, force)
+        if isinstance(result, ScanResult) and not result.cached and span.rows:
+            result.data_rows, result.data_bytes = span.rows, span.bytes
+        return result
+
+    def _scan_timeframe(self, timeframe: str, instrument: Optional[str],
+                        with_intent: bool, force: bool):
 
         self.logger.info(
             f"[FDBScanAgent] Scanning timeframe: {timeframe}" +
@@ -186,42 +243,147 @@ class FDBScanAgent:
             
             return self.enhanced_scanner.scan_with_intent(basic_intent)
         
+        cache_instrument = instrument or "ALL"
+        bar_close = None
+        if self.scan_cache is not None:
+            with phase("cache"):
+                cached = None if force else self.scan_cache.get(cache_instrument, timeframe)
+            if cached is not None:
+                print(
+                    f"Unchanged since last scan: {timeframe}" +
+                    (f" for {instrument}" if instrument else ""),
+                    file=self.progress_stream
+                )
+                result = ScanResult.from_dict(cached)
+                result.cached = True
+                return result
+            bar_close = self.scan_cache.bar_key(timeframe)
+
+        result = ScanResult(
+            instrument=instrument,
+            timeframe=timeframe,
+            mode="real" if self.real and _FDBSCAN_AVAILABLE else "dry",
+            started_at=datetime.now(timezone.utc).isoformat(),
+            bar_close=bar_close,
+        )
+        start = time.perf_counter()
+
         # Original implementation for backward compatibility
         if self.real and _FDBSCAN_AVAILABLE:
-            sys_argv_backup = sys.argv.copy()
-            sys.argv = ["fdbscan"]
+            argv = ["fdbscan"]
             if instrument:
-                sys.argv += ["-i", instrument]
-            sys.argv += ["-t", timeframe]
-            try:
-                fdb_scanner_2408.main()
-            finally:
-                sys.argv = sys_argv_backup
+                argv += ["-i", instrument]
+            argv += ["-t", timeframe]
+            with _ARGV_LOCK:
+                sys_argv_backup = sys.argv.copy()
+                sys.argv = argv
+                try:
+                    scan_started = time.time()
+                    with phase("scanner"), self._scanner_output():
+                        returned = fdb_scanner_2408.main()
+                    # main() is the scanner's CLI entry point: it returns nothing and
+                    # writes its signals to an fdb_signals_out file
+                    if returned is not None:
+                        result.signals = signals_from(returned)
+                    else:
+                        signals = read_signal_output(instrument, timeframe, scan_started)
+                        if signals is None:
+                            self.logger.warning(
+                                f"[FDBScanAgent] No fdb_signals_out file written for {timeframe} "
+                                f"(set JGT_SIGNALS_DIR to the scanner's output directory)"
+                            )
+                        result.signals = signals or []
+                except Exception as e:
+                    self.logger.error(f"[FDBScanAgent] Scan failed for {timeframe}: {e}")
+                    result.status = "failed"
+                    result.error = str(e)
+                finally:
+                    sys.argv = sys_argv_backup
         else:
             if self.real and not _FDBSCAN_AVAILABLE:
-                print("[FDBScanAgent] Real mode requested but jgtml.fdb_scanner_2408 not available.")
+                print("[FDBScanAgent] Real mode requested but jgtml.fdb_scanner_2408 not available.",
+                      file=self.progress_stream)
             print(
                 f"Would scan: {timeframe}" +
-                (f" for {instrument}" if instrument else "")
+                (f" for {instrument}" if instrument else ""),
+                file=self.progress_stream
             )
             if fdb_scanner_2408 is not None:
-                print("\n[FDBScanAgent] Placeholder mode — showing fdbscan help:\n")
-                argv_backup = sys.argv.copy()
-                sys.argv = ["fdbscan", "--help"]
-                try:
+                print("\n[FDBScanAgent] Placeholder mode — showing fdbscan help:\n", file=self.progress_stream)
+                with _ARGV_LOCK:
+                    argv_backup = sys.argv.copy()
+                    sys.argv = ["fdbscan", "--help"]
                     try:
-                        fdb_scanner_2408.main()
-                    except SystemExit:
-                        pass
-                finally:
-                    sys.argv = argv_backup
+                        with self._scanner_output():
+                            try:
+                                fdb_scanner_2408.main()
+                            except SystemExit:
+                                pass
+                    finally:
+                        sys.argv = argv_backup
+
+        result.duration = round(time.perf_counter() - start, 3)
+        if self.scan_cache is not None and result.ok:
+            with phase("cache"):
+                self.scan_cache.put(cache_instrument, timeframe, result.to_dict(), bar_close=bar_close)
+        self.logger.info(
+            f"[FDBScanAgent] Scan {result.status} for {timeframe}: "
+            f"{result.signal_count} signals in {result.duration:.2f}s"
+        )
+        return result
+
+    def _scanner_output(self):
+        """Send what the jgtml scanner prints to progress_stream, if one is set."""
+        if self.progress_stream is None:
+            return nullcontext()
+        return redirect_stdout(self.progress_stream)
+
+    def scan_many(self, instruments: List[str], timeframes: List[str],
+                  workers: Optional[int] = None, timeout: Optional[float] = None,
+                  cache_dir: Optional[str] = None, force: bool = False,
+                  retries: int = 0) -> List[Dict[str, Any]]:
+        """
+        Scan every instrument/timeframe pair in isolated worker processes.
 
-        self.logger.info(f"[FDBScanAgent] Scan complete for {timeframe}")
+        Each scan runs ``scan`` through this CLI in its own process (own argv,
+        environment and JGT_CACHE), at most ``workers`` at a time. Pairs the
+        scan cache holds a current result for are not rescanned unless
+        ``force`` is set. Scans that fail or exceed ``timeout`` are rerun up
+        to ``retries`` times.
+
+        Returns:
+            One dict per scan with status, exit code, duration and output
+        """
+        self.logger.info(
+            f"[FDBScanAgent] Scanning {len(instruments)}x{len(timeframes)} grid"
+            + (f" with {workers} workers" if workers else "")
+        )
+        outcomes = run_scans(
+            instruments,
+            timeframes,
+            workers=workers,
+            real=self.real,
+            cache_dir=cache_dir or os.getenv("JGT_CACHE"),
+            timeout=timeout,
+            cache=self.scan_cache,
+            force=force,
+            retries=retries,
+            logger=self.logger,
+        )
+        return [outcome.to_dict() for outcome in outcomes]
 
     def ritual_sequence(self, sequence: List[str] = ["H4", "H1", "m15", "m5"],
-                       with_intent: bool = False):
+                       with_intent: bool = False,
+                       instruments: Optional[List[str]] = None,
+                       workers: Optional[int] = None):
         """
         Perform the full FDBScan ritual sequence with optional intent context.
+
+        With ``instruments`` the sequence runs pipelined: one dependency chain
+        per instrument in isolated worker processes, each timeframe waiting
+        only for the higher timeframe of the same instrument. Returns the
+        pipeline report (timings and critical path) as a dict; otherwise
+        the list of ScanResult, one per timeframe.
         """
         self.logger.info(f"[FDBScanAgent] Starting ritual sequence: {' → '.join(sequence)}")
         
@@ -244,10 +406,22 @@ class FDBScanAgent:
             
             return self.enhanced_scanner.scan_with_intent(sequence_intent)
         
+        if instruments:
+            report = run_pipeline(
+                instruments,
+                sequence,
+                workers=workers,
+                real=self.real,
+                cache_dir=os.getenv("JGT_CACHE"),
+                logger=self.logger,
+            )
+            self.logger.info(f"[FDBScanAgent] Ritual pipeline complete: {report.summary()}")
+            return report.to_dict()
+
         # Original sequence implementation
-        for tf in sequence:
-            self.scan_timeframe(tf)
+        results = [self.scan_timeframe(tf) for tf in sequence]
         self.logger.info("[FDBScanAgent] Ritual sequence complete.")
+        return results
 
     def scan_all(self, with_intent: bool = False):
         """
@@ -268,6 +442,10 @@ class FDBScanAgent:
         parser = argparse.ArgumentParser(
             description="FDBScanAgent — Enhanced agentic invocation of FDBScan rituals."
         )
+        parser.add_argument("--profile", nargs="?", const="timing", choices=PROFILE_MODES,
+                            help="Profile in-process scans and print a report to stderr "
+                                 "(timing, cprofile or pyinstrument; default: timing)")
+        parser.add_argument("--profile-dir", help="Directory for per-scan profile captures")
         subparsers = parser.add_subparsers(dest="command", required=True)
 
         # Original scan command
@@ -279,6 +457,8 @@ class FDBScanAgent:
         scan_parser.add_argument("--instrument", help="Instrument to scan")
         scan_parser.add_argument("--real", action="store_true", help="Invoke real FDBScan logic")
         scan_parser.add_argument("--with-intent", action="store_true", help="Use enhanced intent-aware scanning")
+        scan_parser.add_argument("--force", action="store_true", help="Rescan even if no bar closed since the last scan")
+        scan_parser.add_argument("--ndjson", action="store_true", help="Print the result as one JSON line")
 
         # New observation-based scan
         obs_parser = subparsers.add_parser(
@@ -296,25 +476,76 @@ class FDBScanAgent:
         )
         spec_parser.add_argument("spec_file", help="Path to .jgtml-spec file")
 
+        # Parallel grid scan in worker processes
+        many_parser = subparsers.add_parser(
+            "many",
+            help="Scan several instruments and timeframes in parallel worker processes"
+        )
+        many_parser.add_argument("--instruments", nargs="+", required=True, help="Instruments to scan")
+        many_parser.add_argument("--timeframes", nargs="+", required=True, help="Timeframes to scan")
+        many_parser.add_argument("--workers", type=int, help="Maximum concurrent scans (env: JGT_SCAN_WORKERS)")
+        many_parser.add_argument("--timeout", type=float, help="Seconds before a scan is killed")
+        many_parser.add_argument("--retries", type=int, default=0, help="Reruns of a failed or timed-out scan")
+        many_parser.add_argument("--real", action="store_true", help="Invoke real FDBScan logic")
+        many_parser.add_argument("--force", action="store_true", help="Rescan even if no bar closed since the last scan")
+        many_parser.add_argument("--ndjson", action="store_true", help="Stream one JSON line per scan")
+
+        # Continuous bar-close daemon
+        daemon_parser = subparsers.add_parser(
+            "daemon",
+            help="Stay resident and scan each timeframe right after its bar closes"
+        )
+        daemon_parser.add_argument("--instruments", nargs="+", required=True, help="Instruments to watch")
+        daemon_parser.add_argument("--timeframes", nargs="+", default=["H4", "H1", "m15", "m5"],
+                                   help="Timeframes to watch")
+        daemon_parser.add_argument("--output", help="NDJSON file results are appended to")
+        daemon_parser.add_argument("--delay", type=float, default=2.0, help="Seconds after the bar close before scanning")
+        daemon_parser.add_argument("--cycles", type=int, help="Stop after this many bar closes")
+        daemon_parser.add_argument("--scan-now", action="store_true", help="Scan all timeframes once at startup")
+        daemon_parser.add_argument("--no-analysis", action="store_true",
+                                   help="Skip regime detection and signal scoring of loaded data")
+        daemon_parser.add_argument("--real", action="store_true", help="Invoke real FDBScan logic")
+
         # Original ritual command
         ritual_parser = subparsers.add_parser("ritual", help="Perform a custom ritual sequence of scans")
         ritual_parser.add_argument("--sequence", nargs="*", default=["H4", "H1", "m15", "m5"], 
                                   help="Sequence of timeframes")
+        ritual_parser.add_argument("--instruments", nargs="*",
+                                  help="Pipeline the sequence per instrument in worker processes")
+        ritual_parser.add_argument("--workers", type=int, help="Maximum concurrent scans when pipelining")
         ritual_parser.add_argument("--real", action="store_true", help="Invoke real FDBScan logic")
         ritual_parser.add_argument("--with-intent", action="store_true", help="Use enhanced intent-aware scanning")
+        ritual_parser.add_argument("--ndjson", action="store_true", help="Stream one JSON line per scan")
 
         # Original all command
         all_parser = subparsers.add_parser("all", help="Perform the canonical scan ritual")
         all_parser.add_argument("--real", action="store_true", help="Invoke real FDBScan logic")
         all_parser.add_argument("--with-intent", action="store_true", help="Use enhanced intent-aware scanning")
+        all_parser.add_argument("--ndjson", action="store_true", help="Stream one JSON line per scan")
 
         args = parser.parse_args()
-        agent = FDBScanAgent(real=getattr(args, "real", False))
+        profiler = ScanProfiler(args.profile, args.profile_dir) if args.profile else None
+        ndjson = getattr(args, "ndjson", False)
+        agent = FDBScanAgent(real=getattr(args, "real", False), profiler=profiler,
+                             progress_stream=sys.stderr if ndjson else None)
+        try:
+            FDBScanAgent._run_command(agent, args, ndjson)
+        finally:
+            if profiler is not None:
+                print(profiler.report(), file=sys.stderr)
+
+    @staticmethod
+    def _run_command(agent: "FDBScanAgent", args, ndjson: bool):
+        """Dispatch a parsed CLI command."""
         
         if args.command == "scan":
             result = agent.scan_timeframe(args.timeframe, args.instrument, 
-                                        getattr(args, "with_intent", False))
-            if isinstance(result, dict):
+                                        getattr(args, "with_intent", False), args.force)
+            if isinstance(result, ScanResult):
+                _emit([result], ndjson)
+                if not result.ok:
+                    sys.exit(1)
+            elif isinstance(result, dict):
                 import json
                 print(json.dumps(result, indent=2))
                 
@@ -328,18 +559,60 @@ class FDBScanAgent:
             import json
             print(json.dumps(result, indent=2))
             
+        elif args.command == "many":
+            results = agent.scan_many(args.instruments, args.timeframes, args.workers, args.timeout,
+                                      force=args.force, retries=args.retries)
+            if ndjson:
+                _emit(results, ndjson)
+            else:
+                import json
+                print(json.dumps(results, indent=2))
+            if not all(r["status"] == "ok" for r in results):
+                sys.exit(1)
+
+        elif args.command == "daemon":
+            import asyncio
+            try:
+                from .scan_daemon import ScanDaemon
+            except ImportError:
+                from jgtagentic.scan_daemon import ScanDaemon
+            logging.basicConfig(level=logging.INFO)
+            daemon = ScanDaemon(agent, args.instruments, args.timeframes, output=args.output,
+                                analyze=not args.no_analysis, delay=args.delay)
+            try:
+                asyncio.run(daemon.run(max_cycles=args.cycles, scan_now=args.scan_now))
+            except KeyboardInterrupt:
+                pass
+
         elif args.command == "ritual":
-            result = agent.ritual_sequence(args.sequence, getattr(args, "with_intent", False))
-            if isinstance(result, dict):
+            result = agent.ritual_sequence(args.sequence, getattr(args, "with_intent", False),
+                                           args.instruments, args.workers)
+            if isinstance(result, list):
+                _emit(result, ndjson)
+            elif ndjson and isinstance(result, dict) and "outcomes" in result:
+                _emit(result["outcomes"], ndjson)
+            elif isinstance(result, dict):
                 import json
                 print(json.dumps(result, indent=2))
                 
         elif args.command == "all":
             result = agent.scan_all(getattr(args, "with_intent", False))
-            if isinstance(result, dict):
+            if isinstance(result, list):
+                _emit(result, ndjson)
+            elif isinstance(result, dict):
                 import json
                 print(json.dumps(result, indent=2))
 
+def _emit(results, ndjson: bool = False):
+    """Print scan results, one JSON line each with ``ndjson``."""
+    import json
+    records = [r.to_dict() if isinstance(r, ScanResult) else r for r in results]
+    if ndjson:
+        for record in records:
+            print(json.dumps(record, default=str), flush=True)
+    else:
+        print(json.dumps(records if len(records) != 1 else records[0], indent=2, default=str))
+
 def main():
     """Entry point for the ``agentic-fdbscan`` console script."""
     FDBScanAgent.cli()
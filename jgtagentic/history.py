@@ -0,0 +1,182 @@
+"""
+Bounded History
+
+Fixed-capacity ring buffer for the histories kept by long-lived agents
+(scanner signals, observations, loaded specs). Memory stays flat however
+long the process runs: once full, each new entry evicts the oldest, which
+is optionally appended to an NDJSON spill file (rotated by size) so older
+history remains on disk.
+
+Entries are indexed by instrument for quick lookup of recent history.
+
+Configuration (env):
+    JGT_HISTORY_SIZE   Entries kept in memory per history (default 1000)
+    JGT_HISTORY_DIR    Directory for spill files <name>.<pid>.<instance>.ndjson, one
+                       per history object so processes never share a file
+                       (default: no spill)
+
+Usage:
+    history = RingHistory(500, name="signals", key=lambda s: s.get("instrument"))
+    history.append(signal)
+    history.for_instrument("EUR/USD", limit=10)
+"""
+
+import os
+import json
+import itertools
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_CAPACITY = 1000
+DEFAULT_SPILL_BYTES = 10 * 1024 * 1024
+
+# Numbers the histories of this process, so each spills to its own file
+_INSTANCE_IDS = itertools.count(1)
+
+
+def _keys(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return [str(v) for v in value if v is not None]
+    return [str(value)]
+
+
+class RingHistory:
+    """
+    Ring buffer with per-instrument index and optional spill-to-disk.
+
+    Supports the list operations the histories used (``append``, ``extend``,
+    ``len``, iteration, indexing), oldest entry first.
+    """
+
+    def __init__(
+        self,
+        capacity: Optional[int] = None,
+        name: Optional[str] = None,
+        key: Optional[Callable[[Any], Any]] = None,
+        spill_path: Optional[str] = None,
+        max_spill_bytes: int = DEFAULT_SPILL_BYTES,
+        backups: int = 3
+    ):
+        """
+        Initialize history.
+
+        Args:
+            capacity: Entries kept in memory (env: JGT_HISTORY_SIZE, default 1000)
+            name: History name; with JGT_HISTORY_DIR set, evicted entries
+                spill to <JGT_HISTORY_DIR>/<name>.<pid>.<instance>.ndjson
+            key: Instrument(s) of an entry, one string or a list
+                (default: the entry's 'instrument' / 'instruments' field)
+            spill_path: Explicit NDJSON file for evicted entries
+            max_spill_bytes: Spill file size that triggers rotation
+            backups: Rotated spill files kept (<path>.1 ... <path>.N)
+        """
+        self.capacity = max(1, int(capacity or os.getenv("JGT_HISTORY_SIZE", DEFAULT_CAPACITY)))
+        self.name = name
+        self.key = key or self._default_key
+        if spill_path is None and name and os.getenv("JGT_HISTORY_DIR"):
+            spill_path = os.path.join(
+                os.getenv("JGT_HISTORY_DIR"), f"{name}.{os.getpid()}.{next(_INSTANCE_IDS)}.ndjson"
+            )
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.max_spill_bytes = max_spill_bytes
+        self.backups = backups
+        self.spilled = 0
+
+        self._entries: Deque[Any] = deque()
+        self._index: Dict[str, Deque[Any]] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _default_key(entry: Any) -> Any:
+        if isinstance(entry, dict):
+            return entry.get("instrument") or entry.get("instruments")
+        return getattr(entry, "instrument", None) or getattr(entry, "instruments", None)
+
+    def append(self, entry: Any) -> None:
+        """Add an entry, evicting (and spilling) the oldest when full."""
+        with self._lock:
+            if len(self._entries) >= self.capacity:
+                self._evict()
+            self._entries.append(entry)
+            for k in _keys(self.key(entry)):
+                self._index.setdefault(k, deque()).append(entry)
+
+    def extend(self, entries: Iterable[Any]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def _evict(self) -> None:
+        oldest = self._entries.popleft()
+        for k in _keys(self.key(oldest)):
+            bucket = self._index.get(k)
+            # The oldest entry overall is also the oldest of each of its buckets
+            if bucket and bucket[0] is oldest:
+                bucket.popleft()
+                if not bucket:
+                    del self._index[k]
+        if self.spill_path is not None:
+            self._spill(oldest)
+
+    def _spill(self, entry: Any) -> None:
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if self.spill_path.stat().st_size >= self.max_spill_bytes:
+                self._rotate()
+        except FileNotFoundError:
+            pass
+        with open(self.spill_path, "a") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+        self.spilled += 1
+
+    def _rotate(self) -> None:
+        if self.backups < 1:
+            self.spill_path.unlink()
+            return
+        for i in range(self.backups - 1, 0, -1):
+            older = self.spill_path.with_name(f"{self.spill_path.name}.{i}")
+            if older.exists():
+                os.replace(older, self.spill_path.with_name(f"{self.spill_path.name}.{i + 1}"))
+        os.replace(self.spill_path, self.spill_path.with_name(f"{self.spill_path.name}.1"))
+
+    def for_instrument(self, instrument: str, limit: Optional[int] = None) -> List[Any]:
+        """In-memory entries for an instrument, oldest first (the last ``limit`` only)."""
+        with self._lock:
+            bucket = list(self._index.get(instrument, ()))
+        return bucket[-limit:] if limit else bucket
+
+    def instruments(self) -> List[str]:
+        with self._lock:
+            return list(self._index)
+
+    def recent(self, n: int) -> List[Any]:
+        """The ``n`` newest entries, oldest first."""
+        with self._lock:
+            return list(self._entries)[-n:] if n > 0 else []
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __getitem__(self, item):
+        with self._lock:
+            if isinstance(item, slice):
+                return list(self._entries)[item]
+            return self._entries[item]
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __repr__(self) -> str:
+        return f"RingHistory(name={self.name!r}, size={len(self)}, capacity={self.capacity})"
@@ -6,24 +6,28 @@ Enhanced to consolidate all prototypes and provide comprehensive intent processi
 """
 
 from typing import Any, Dict, List, Optional
-import yaml
 import json
 from datetime import datetime
 
+from .history import RingHistory
+from .scan_plan import PlanCache, ScanPlan
+from .spec_cache import SpecCache
+
 
 class IntentSpecParser:
     """Enhanced parser for trading intent specifications."""
 
-    def __init__(self):
-        self.spec_history = []
+    def __init__(self, history_size: Optional[int] = None):
+        self.spec_history = RingHistory(
+            history_size, name="specs", key=lambda entry: entry["spec"].get("instruments")
+        )
+        self.plans = PlanCache()
+        self.spec_cache = SpecCache(self.validate_spec, namespace="validated")
         self.templates = IntentTemplateLibrary()
 
     def load(self, path: str) -> Dict[str, Any]:
-        """Load and validate a YAML intent specification from path."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        
-        validated_spec = self.validate_spec(data or {})
+        """Load and validate a YAML intent specification from path (cached until the file changes)."""
+        validated_spec = self.spec_cache.load(path)
         self.spec_history.append({
             "path": path,
             "timestamp": datetime.now().isoformat(),
@@ -99,6 +103,10 @@ class IntentSpecParser:
         
         return self.templates.observation_to_spec(observation, instruments, timeframes)
 
+    def compile(self, spec: Dict[str, Any]) -> ScanPlan:
+        """Compile a spec into the ScanPlan the scanner executes (cached by content)."""
+        return self.plans.get(spec)
+
     def translate_to_scan_params(self, spec: Dict[str, Any]) -> Dict[str, Any]:
         """Translate intent specification to FDB scanner parameters."""
         
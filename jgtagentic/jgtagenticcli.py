@@ -109,11 +109,16 @@ The observation interface converts natural language market analysis into:
 - Strategic scanning parameters
 - Quality assessment and recommendations
 
-Example:
+Examples:
   jgtagentic observe "SPX500 breaking above 4200 resistance with strong volume"
+  jgtagentic observe --file journal.ndjson --output analysis.ndjson --workers 8
         """
     )
-    observe_parser.add_argument("observation", help="Natural language market observation")
+    observe_parser.add_argument("observation", nargs="?", help="Natural language market observation")
+    observe_parser.add_argument("--file", help="Ingest an observation archive (NDJSON, markdown or text, '-' for stdin)")
+    observe_parser.add_argument("--output", help="With --file: write each observation's result as NDJSON")
+    observe_parser.add_argument("--workers", type=int, help="With --file: analysis processes (default: CPU count)")
+    observe_parser.add_argument("--batch-size", type=int, help="With --file: observations per worker task")
     observe_parser.add_argument("--instruments", nargs="*", help="Target instruments")
     observe_parser.add_argument("--timeframes", nargs="*", help="Target timeframes")
     observe_parser.add_argument("--confidence", type=float, help="Confidence level (0-1)")
@@ -132,6 +137,7 @@ The spec interface provides:
 
 Examples:
   jgtagentic spec validate strategy.jgtml-spec
+  jgtagentic spec validate-all specs/ --output report.json
   jgtagentic spec template confluence_strategy
   jgtagentic spec create "Trend following with momentum confirmation"
         """
@@ -141,6 +147,16 @@ Examples:
     # Spec validate
     validate_parser = spec_subparsers.add_parser("validate", help="Validate intent specification")
     validate_parser.add_argument("spec_file", help="Path to intent specification file")
+
+    # Spec validate-all
+    validate_all_parser = spec_subparsers.add_parser(
+        "validate-all", help="Validate every specification under a directory in parallel"
+    )
+    validate_all_parser.add_argument("directory", help="Spec library directory (searched recursively)")
+    validate_all_parser.add_argument("--pattern", default="*.jgtml-spec", help="Spec file glob (default: *.jgtml-spec)")
+    validate_all_parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    validate_all_parser.add_argument("--cache", help="Result cache file (default: $JGT_SPEC_CACHE/validation.json)")
+    validate_all_parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
     
     # Spec template
     template_parser = spec_subparsers.add_parser("template", help="Generate from template")
@@ -192,7 +208,8 @@ Example:
             if observation_result['quality_score'] >= 0.6:
                 print("\n🔍 Quality threshold met - initiating enhanced scan...")
                 
-                agent = FDBScanAgent()
+                # Sharing the capture lets the scan reuse the analysis above
+                agent = FDBScanAgent(observation_capture=capture)
                 scan_result = agent.scan_with_observation(args.observation)
                 
                 if scan_result.get('success'):
@@ -247,6 +264,12 @@ Example:
         elif args.timeframe:
             print(f"\n🎯 Timeframe scanning: {args.timeframe}")
             result = agent.scan_timeframe(args.timeframe, args.instrument, args.with_intent)
+            if hasattr(result, "to_dict"):
+                print(
+                    f"{'✨' if result.ok else '❌'} {result.status}: {result.signal_count} signals"
+                    f" in {result.duration:.2f}s" + (" (unchanged, cached)" if result.cached else "")
+                )
+                print(json.dumps(result.to_dict(), indent=2))
             
         else:
             print("\n⚠️ Please specify scanning method: --observe, --spec, --timeframe, or --all")
@@ -270,6 +293,20 @@ Example:
         if not _ENHANCED_AVAILABLE:
             print("\n❌ Enhanced observation features not available")
             sys.exit(1)
+        
+        if args.file:
+            summary = ObservationCapture().capture_stream(
+                args.file, output=args.output, workers=args.workers, batch_size=args.batch_size
+            )
+            print(json.dumps(summary, indent=2))
+            print(
+                f"📚 {summary['observations']} observations in {summary['duration']}s "
+                f"({summary['observations_per_sec']}/s)",
+                file=sys.stderr
+            )
+            return
+        if not args.observation:
+            observe_parser.error("an observation or --file is required")
             
         print(f"\n🔍 Processing observation: {args.observation}")
         
@@ -304,6 +341,29 @@ Example:
                 print(json.dumps(spec, indent=2))
             except Exception as e:
                 print(f"❌ Validation failed: {e}")
+
+        elif args.spec_action == "validate-all":
+            from jgtagentic.spec_validation import ValidationCache, validate_directory
+            if not os.path.isdir(args.directory):
+                print(f"❌ Not a directory: {args.directory}", file=sys.stderr)
+                sys.exit(2)
+            report = validate_directory(
+                args.directory, pattern=args.pattern, workers=args.workers,
+                cache=ValidationCache(args.cache)
+            )
+            if args.output:
+                with open(args.output, 'w') as f:
+                    json.dump(report, f, indent=2)
+            else:
+                print(json.dumps(report, indent=2))
+            status = "✅" if not report["invalid"] else "❌"
+            print(
+                f"{status} {report['valid']}/{report['total']} specifications valid "
+                f"({report['cached']} cached) in {report['duration']}s",
+                file=sys.stderr
+            )
+            if report["invalid"]:
+                sys.exit(1)
                 
         elif args.spec_action == "template":
             spec = parser_instance.templates.get_template(args.template_name)
@@ -0,0 +1,290 @@
+"""
+Memory-mapped Market Data Store
+
+Companion on-disk format for the ``JGTPY_DATA/<dataset>/<type>/*.csv`` tree.
+Each CSV becomes a directory of one ``.npy`` file per column (or a single
+Arrow IPC file when pyarrow is installed and requested). Opening a frame
+memory-maps the column files read-only, so every worker process on a host
+shares the same page-cache pages instead of each parsing its own copy.
+
+Layout:
+    <store>/<dataset>/<type>/<INSTRUMENT>-<TF>.npcols/meta.json
+    <store>/<dataset>/<type>/<INSTRUMENT>-<TF>.npcols/<n>.npy   (one per column)
+    <store>/<dataset>/<type>/<INSTRUMENT>-<TF>.arrow
+
+Convert an existing CSV tree:
+    python -m jgtagentic.market_store convert --source $JGTPY_DATA --store $JGT_STORE_PATH
+
+Mapped columns are used as stored: a DataLoader with ``typed`` or ``compact``
+does not cast them, since a cast copies the column into private memory. Write
+the store with the dtypes the loaders use (``convert --typed --compact``).
+
+Frames share the mapped pages only on pandas >= 2.0, whose DataFrame
+constructor honours ``copy=False`` for a dict of arrays; older pandas copies
+(and consolidates) the columns when the frame is built, so reads still work
+but each process holds its own copy.
+"""
+
+import os
+import json
+import shutil
+import logging
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+    _ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    _ARROW_AVAILABLE = False
+
+NPY_SUFFIX = ".npcols"
+ARROW_SUFFIX = ".arrow"
+META_FILE = "meta.json"
+
+
+def normalize_instrument(instrument: str) -> str:
+    """File-name form of an instrument ('EUR/USD' -> 'EUR-USD')."""
+    return instrument.replace('/', '-').replace('_', '-')
+
+
+class MarketStore:
+    """
+    Read and write memory-mapped column stores.
+
+    Numeric and datetime columns are stored as raw ``.npy`` arrays. String
+    columns are stored as categorical codes plus their categories in
+    ``meta.json`` so they can be mapped too.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        fmt: str = "npy",
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize store.
+
+        Args:
+            root: Store root directory
+            fmt: Format used when writing, 'npy' or 'arrow'
+            logger: Logger instance
+        """
+        self.root = Path(root)
+        if fmt == "arrow" and not _ARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for the 'arrow' store format")
+        self.fmt = fmt
+        self.logger = logger or logging.getLogger("MarketStore")
+
+    def path_for(self, instrument: str, timeframe: str, data_type: str, dataset: str, fmt: Optional[str] = None) -> Path:
+        """Store path of a key for the given format."""
+        suffix = ARROW_SUFFIX if (fmt or self.fmt) == "arrow" else NPY_SUFFIX
+        name = f"{normalize_instrument(instrument)}-{timeframe}{suffix}"
+        return self.root / dataset / data_type / name
+
+    def source_mtime(self, instrument: str, timeframe: str, data_type: str, dataset: str) -> Optional[float]:
+        """mtime of the CSV a stored frame was converted from, if recorded."""
+        meta_path = self.path_for(instrument, timeframe, data_type, dataset, "npy") / META_FILE
+        if meta_path.exists():
+            with open(meta_path) as f:
+                return json.load(f).get("source_mtime")
+        arrow_path = self.path_for(instrument, timeframe, data_type, dataset, "arrow")
+        if arrow_path.exists() and _ARROW_AVAILABLE:
+            with pa.memory_map(str(arrow_path), "r") as source:
+                metadata = pa.ipc.open_file(source).schema.metadata or {}
+            value = metadata.get(b"source_mtime")
+            return float(value) if value else None
+        return None
+
+    def write(
+        self,
+        df: pd.DataFrame,
+        instrument: str,
+        timeframe: str,
+        data_type: str,
+        dataset: str,
+        source_mtime: Optional[float] = None
+    ) -> Path:
+        """
+        Write a frame to the store, replacing any previous version.
+
+        Returns:
+            Path of the written store entry
+        """
+        target = self.path_for(instrument, timeframe, data_type, dataset)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.tmp{os.getpid()}")
+
+        if self.fmt == "arrow":
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({
+                **(table.schema.metadata or {}),
+                b"source_mtime": str(source_mtime or "").encode(),
+            })
+            with pa.OSFile(str(tmp), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        else:
+            tmp.mkdir(parents=True, exist_ok=True)
+            columns = []
+            for position, name in enumerate(df.columns):
+                columns.append(self._write_column(tmp, position, name, df[name]))
+            meta = {"rows": len(df), "columns": columns, "source_mtime": source_mtime}
+            with open(tmp / META_FILE, "w") as f:
+                json.dump(meta, f)
+
+        if target.is_dir():
+            shutil.rmtree(target)
+        os.replace(tmp, target)
+        return target
+
+    @staticmethod
+    def _write_column(directory: Path, position: int, name: str, series: pd.Series) -> Dict[str, Any]:
+        """Write one column as .npy and describe it for meta.json."""
+        # Column names are not always valid file names, so files are numbered
+        entry: Dict[str, Any] = {"name": name, "file": f"{position}.npy"}
+        if pd.api.types.is_numeric_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype):
+            values = series.to_numpy()
+            entry["kind"] = "numeric"
+        elif pd.api.types.is_datetime64_any_dtype(series.dtype):
+            values = series.to_numpy(dtype="datetime64[ns]")
+            entry["kind"] = "datetime"
+        else:
+            categorical = pd.Categorical(series)
+            values = categorical.codes
+            entry["kind"] = "category"
+            entry["categories"] = [str(c) for c in categorical.categories]
+        np.save(directory / entry["file"], np.ascontiguousarray(values), allow_pickle=False)
+        return entry
+
+    def open(
+        self,
+        instrument: str,
+        timeframe: str,
+        data_type: str,
+        dataset: str,
+        columns: Optional[Sequence[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Open a stored frame via memory mapping.
+
+        Args:
+            columns: Only map these columns
+
+        Returns:
+            DataFrame backed by read-only mapped arrays, or None if not stored
+        """
+        npy_path = self.path_for(instrument, timeframe, data_type, dataset, "npy")
+        if (npy_path / META_FILE).exists():
+            return self._open_npy(npy_path, columns)
+        arrow_path = self.path_for(instrument, timeframe, data_type, dataset, "arrow")
+        if arrow_path.exists() and _ARROW_AVAILABLE:
+            source = pa.memory_map(str(arrow_path), "r")
+            table = pa.ipc.open_file(source).read_all()
+            if columns:
+                table = table.select([c for c in columns if c in table.column_names])
+            return table.to_pandas()
+        return None
+
+    @staticmethod
+    def _open_npy(path: Path, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+        """Map each requested column file and assemble a frame without copying numerics."""
+        with open(path / META_FILE) as f:
+            meta = json.load(f)
+        wanted = set(columns) if columns else None
+        arrays = {}
+        for entry in meta["columns"]:
+            if wanted is not None and entry["name"] not in wanted:
+                continue
+            values = np.load(path / entry["file"], mmap_mode="r", allow_pickle=False)
+            if entry["kind"] == "category":
+                arrays[entry["name"]] = pd.Categorical.from_codes(values, categories=entry["categories"])
+            else:
+                arrays[entry["name"]] = values
+        # Zero-copy on pandas >= 2.0 only (see module docstring)
+        return pd.DataFrame(arrays, copy=False)
+
+
+def convert_csv_tree(
+    source_root: str,
+    store_root: str,
+    datasets: Optional[List[str]] = None,
+    fmt: str = "npy",
+    force: bool = False,
+    timestamp_column: str = "Date",
+    typed: bool = False,
+    compact: bool = False,
+    compact_rtol: float = 1e-6,
+    logger: Optional[logging.Logger] = None
+) -> List[Path]:
+    """
+    Convert ``<source>/<dataset>/<type>/<INST>-<TF>.csv`` files into a store.
+
+    Files whose store entry already records the current CSV mtime are skipped
+    unless ``force`` is set. ``typed`` and ``compact`` store the dtypes a
+    DataLoader with the same options would produce, so its mapped reads need
+    no casts.
+
+    Returns:
+        Paths of written store entries
+    """
+    # Imported here: data_loader imports this module
+    from .data_loader import KNOWN_DTYPES, compact_frame
+
+    logger = logger or logging.getLogger("MarketStore")
+    store = MarketStore(store_root, fmt=fmt, logger=logger)
+    written = []
+    for csv_path in sorted(Path(source_root).glob("*/*/*.csv")):
+        dataset = csv_path.parent.parent.name
+        data_type = csv_path.parent.name
+        if datasets and dataset not in datasets:
+            continue
+        instrument, _, timeframe = csv_path.stem.rpartition("-")
+        if not instrument:
+            continue
+        mtime = csv_path.stat().st_mtime
+        if not force and store.source_mtime(instrument, timeframe, data_type, dataset) == mtime:
+            continue
+        df = pd.read_csv(csv_path)
+        if timestamp_column in df.columns:
+            df[timestamp_column] = pd.to_datetime(df[timestamp_column], errors="coerce")
+        if typed:
+            df = df.astype({c: t for c, t in KNOWN_DTYPES.items() if c in df.columns})
+        if compact:
+            df = compact_frame(df, rtol=compact_rtol, exclude=(timestamp_column,))
+        written.append(store.write(df, instrument, timeframe, data_type, dataset, source_mtime=mtime))
+        logger.info(f"[MarketStore] Converted {csv_path}")
+    return written
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Memory-mapped market data store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    convert_parser = subparsers.add_parser("convert", help="Convert a JGTPY_DATA CSV tree into a store")
+    convert_parser.add_argument("--source", default=os.getenv("JGTPY_DATA", "/src/jgtml/data"), help="CSV root")
+    convert_parser.add_argument("--store", default=os.getenv("JGT_STORE_PATH"), required=not os.getenv("JGT_STORE_PATH"),
+                                help="Store root (env: JGT_STORE_PATH)")
+    convert_parser.add_argument("--dataset", nargs="*", help="Only convert these datasets")
+    convert_parser.add_argument("--format", choices=["npy", "arrow"], default="npy", help="Store format")
+    convert_parser.add_argument("--force", action="store_true", help="Rewrite entries that are up to date")
+    convert_parser.add_argument("--typed", action="store_true",
+                                help="Store the known float32/categorical dtypes (for typed loaders)")
+    convert_parser.add_argument("--compact", action="store_true",
+                                help="Store compacted dtypes (for loaders with JGT_DATA_COMPACT=1)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    written = convert_csv_tree(args.source, args.store, args.dataset, args.format, args.force,
+                               typed=args.typed, compact=args.compact)
+    print(f"Converted {len(written)} file(s) into {args.store}")
+
+
+if __name__ == "__main__":
+    main()
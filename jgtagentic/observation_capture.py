@@ -9,14 +9,22 @@ Architecture:
 Market Observation → Linguistic Analysis → Intent Specification → Scanner Parameters
 """
 
+import os
+import copy
 import logging
 import json
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from dataclasses import dataclass
 
 from .intent_spec import IntentSpecParser
+from .history import RingHistory
+from .observation_matcher import ObservationMatcher
+
+DEFAULT_MEMO_SIZE = 256
 
 
 @dataclass
@@ -43,16 +51,34 @@ class ObservationCapture:
     5. Provides feedback on observation quality
     """
     
-    def __init__(self, logger=None):
+    def __init__(self, logger=None, history_size: Optional[int] = None,
+                 instruments: Optional[List[str]] = None,
+                 memo_size: Optional[int] = None):
         self.logger = logger or logging.getLogger("ObservationCapture")
-        self.intent_parser = IntentSpecParser()
-        self.observation_history = []
+        self.intent_parser = IntentSpecParser(history_size=history_size)
+        self.observation_history = RingHistory(history_size, name="observations")
+        # Instruments recognized in observations (default: ObservationMatcher's list + JGT_INSTRUMENTS)
+        self.matcher = ObservationMatcher(instruments)
+        # Analyses of recent observations by normalized text (env: JGT_OBSERVATION_MEMO, 0 disables)
+        if memo_size is None:
+            memo_size = int(os.getenv("JGT_OBSERVATION_MEMO", DEFAULT_MEMO_SIZE))
+        self.memo_size = max(0, memo_size)
+        self.memo_stats = {"hits": 0, "misses": 0}
+        self._memo: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
         
     def capture_observation(self, observation_text: str) -> Dict[str, Any]:
         """Capture and process a market observation."""
         
-        # Analyze the observation
-        analysis = self._analyze_observation(observation_text)
+        result = self._observation_result(observation_text)
+        self.observation_history.append(result["observation"])
+        return result
+    
+    def _observation_result(self, observation_text: str) -> Dict[str, Any]:
+        """Analysis and intent specification of one observation (no history)."""
+        
+        # Analyze the observation (or reuse the analysis of the same text)
+        analysis = self._memoized_analysis(observation_text)
         
         result = {
             "observation": {
@@ -124,25 +150,64 @@ class ObservationCapture:
             "trading_recommendations": self._generate_session_recommendations(consolidated_intent)
         }
     
-    def _analyze_observation(self, text: str) -> Dict[str, Any]:
-        """Analyze observation text and extract trading context."""
-        
-        text_lower = text.lower()
-        
-        # Extract instruments
-        instruments = self._extract_instruments(text)
-        
-        # Extract timeframes  
-        timeframes = self._extract_timeframes(text)
+    def capture_stream(self, source, output=None, workers: Optional[int] = None,
+                       batch_size: Optional[int] = None,
+                       session_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Capture an archive of observations in bulk (see observation_ingest).
         
-        # Analyze sentiment
-        sentiment = self._analyze_sentiment(text_lower)
+        Args:
+            source: NDJSON / markdown / text file, or an iterable of observation texts
+            output: NDJSON file (or stream) receiving each observation's result
+            workers: Analysis processes (default: CPU count)
+            batch_size: Observations per worker task
+            session_context: Additional session context
+            
+        Returns:
+            Session summary with consolidated intent and throughput (observations/sec)
+        """
+        from .observation_ingest import DEFAULT_BATCH_SIZE, ingest_observations
         
-        # Detect signal type
-        signal_type = self._detect_signal_type(text_lower)
+        return ingest_observations(
+            source, output, capture=self, workers=workers,
+            batch_size=batch_size or DEFAULT_BATCH_SIZE, session_context=session_context
+        )
+    
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Memo key of an observation: lowercased, whitespace collapsed."""
+        return " ".join(text.lower().split())
+    
+    def _memoized_analysis(self, text: str) -> Dict[str, Any]:
+        """Analysis of an observation, from the LRU memo when the same text was seen."""
+        
+        if not self.memo_size:
+            return self._analyze_observation(text)
+        key = self.normalize(text)
+        with self._memo_lock:
+            analysis = self._memo.get(key)
+            if analysis is not None:
+                self._memo.move_to_end(key)
+                self.memo_stats["hits"] += 1
+                return copy.deepcopy(analysis)
+        analysis = self._analyze_observation(text)
+        with self._memo_lock:
+            self._memo[key] = analysis
+            self.memo_stats["misses"] += 1
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return copy.deepcopy(analysis)
+    
+    def _analyze_observation(self, text: str) -> Dict[str, Any]:
+        """Analyze observation text and extract trading context."""
         
-        # Assess confidence
-        confidence = self._assess_confidence(text_lower)
+        # Instruments, timeframes, sentiment, signal type and confidence in one pass
+        match = self.matcher.match(text)
+        instruments = match.instruments or ["EUR/USD"]
+        timeframes = match.timeframes or ["H4", "H1"]
+        sentiment = match.sentiment
+        signal_type = match.signal_type
+        confidence = match.confidence
         
         # Generate signals
         signals = self._generate_signals(signal_type, sentiment)
@@ -160,82 +225,6 @@ class ObservationCapture:
             "recommendations": recommendations
         }
     
-    def _extract_instruments(self, text: str) -> List[str]:
-        """Extract instrument symbols from observation text."""
-        
-        text_upper = text.upper()
-        instruments = []
-        
-        if 'EUR' in text_upper and 'USD' in text_upper:
-            instruments.append('EUR/USD')
-        elif 'GBP' in text_upper and 'USD' in text_upper:
-            instruments.append('GBP/USD')
-        elif 'SPX' in text_upper or 'SP500' in text_upper:
-            instruments.append('SPX500')
-        elif 'XAU' in text_upper or 'GOLD' in text_upper:
-            instruments.append('XAU/USD')
-        
-        return instruments if instruments else ["EUR/USD"]
-    
-    def _extract_timeframes(self, text: str) -> List[str]:
-        """Extract timeframes from observation text."""
-        
-        text_lower = text.lower()
-        timeframes = []
-        
-        if any(word in text_lower for word in ['hour', 'h1', 'h4']):
-            timeframes.extend(['H4', 'H1'])
-        if any(word in text_lower for word in ['daily', 'day', 'd1']):
-            timeframes.append('D1')
-        if any(word in text_lower for word in ['15', 'fifteen', 'm15']):
-            timeframes.append('m15')
-        
-        return timeframes if timeframes else ["H4", "H1"]
-    
-    def _analyze_sentiment(self, text: str) -> str:
-        """Analyze sentiment from observation text."""
-        
-        bullish_words = ['bullish', 'buy', 'long', 'up', 'rising', 'breakout', 'above', 'strong']
-        bearish_words = ['bearish', 'sell', 'short', 'down', 'falling', 'breakdown', 'below', 'weak']
-        
-        bullish_count = sum(1 for word in bullish_words if word in text)
-        bearish_count = sum(1 for word in bearish_words if word in text)
-        
-        if bullish_count > bearish_count:
-            return "bullish"
-        elif bearish_count > bullish_count:
-            return "bearish"
-        else:
-            return "neutral"
-    
-    def _detect_signal_type(self, text: str) -> str:
-        """Detect the type of trading signal from observation."""
-        
-        if any(word in text for word in ["breakout", "break", "above", "below"]):
-            return "breakout"
-        elif any(word in text for word in ["alligator", "gator", "mouth"]):
-            return "alligator"
-        elif any(word in text for word in ["momentum", "strong", "acceleration"]):
-            return "momentum"
-        elif any(word in text for word in ["confluence", "align", "multiple"]):
-            return "confluence"
-        else:
-            return "general"
-    
-    def _assess_confidence(self, text: str) -> float:
-        """Assess confidence based on linguistic cues."""
-        
-        high_confidence_words = ['clear', 'strong', 'definite', 'obvious']
-        low_confidence_words = ['maybe', 'might', 'could', 'possibly']
-        
-        high_count = sum(1 for word in high_confidence_words if word in text)
-        low_count = sum(1 for word in low_confidence_words if word in text)
-        
-        base_confidence = 0.7
-        confidence = base_confidence + (high_count * 0.1) - (low_count * 0.1)
-        
-        return max(0.1, min(1.0, confidence))
-    
     def _generate_signals(self, signal_type: str, sentiment: str) -> List[Dict[str, Any]]:
         """Generate signals based on detected type and sentiment."""
         
@@ -0,0 +1,341 @@
+"""
+Bulk Observation Ingestion
+
+Replays archives of market observations (journal notes) through
+``ObservationCapture`` at scale:
+
+- observations stream from a file, never held in memory all at once
+  (NDJSON, markdown journals or plain text, one note per line)
+- batches are analyzed across a process pool, at most a few batches in flight
+- the session intent is consolidated incrementally as results arrive
+- each result is written to an NDJSON output as soon as its batch is done,
+  in input order
+- the run reports its throughput (observations/sec)
+
+Input formats:
+    .ndjson / .jsonl   One observation per line: a JSON string, or an object with
+                       "text" (or "observation") and optional "timestamp" / "id"
+    .md / .markdown    Paragraphs and list items are observations; ATX headings
+                       ("# ", "## " ...) are kept as each observation's "section";
+                       code fences skipped
+    anything else      One observation per non-blank line
+
+Usage:
+    capture = ObservationCapture()
+    summary = capture.capture_stream("journal.ndjson", output="analysis.ndjson", workers=8)
+    print(summary["observations_per_sec"])
+
+    jgtagentic observe --file journal.md --output analysis.ndjson
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Union
+
+from .observation_capture import ObservationCapture
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_PROGRESS_EVERY = 5000
+
+_MARKDOWN_SUFFIXES = (".md", ".markdown")
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+_LIST_MARKERS = ("- ", "* ", "+ ")
+# ATX heading: 1-6 '#' then a space or end of line ('#EURUSD' is a note, not a heading)
+_HEADING = re.compile(r"(#{1,6})(?:\s+|$)")
+
+Record = Dict[str, Any]
+
+
+def _ndjson_records(lines: Iterable[str], source: str, logger: logging.Logger) -> Iterator[Record]:
+    for n, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError as e:
+            logger.warning(f"[ObservationIngest] Skipping {source}:{n}: {e}")
+            continue
+        if isinstance(value, str):
+            record = {"text": value}
+        elif isinstance(value, dict):
+            record = {k: v for k, v in value.items() if k not in ("text", "observation")}
+            record["text"] = value.get("text") or value.get("observation") or ""
+        else:
+            logger.warning(f"[ObservationIngest] Skipping {source}:{n}: not a string or object")
+            continue
+        if record["text"]:
+            record["source"] = f"{source}:{n}"
+            yield record
+
+
+def _markdown_records(lines: Iterable[str], source: str) -> Iterator[Record]:
+    section = None
+    block: List[str] = []
+    start = 0
+    in_fence = False
+
+    def flush():
+        if block:
+            record = {"text": " ".join(block), "source": f"{source}:{start}"}
+            if section:
+                record["section"] = section
+            block.clear()
+            return record
+        return None
+
+    for n, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            in_fence = not in_fence
+            record = flush()
+        elif in_fence:
+            continue
+        elif not stripped or _HEADING.match(stripped):
+            record = flush()
+            if stripped:
+                section = stripped.lstrip("#").strip() or None
+        elif stripped[:2] in _LIST_MARKERS:
+            record = flush()
+            block.append(stripped[2:].strip())
+            start = n
+        else:
+            record = None
+            if not block:
+                start = n
+            block.append(stripped)
+        if record:
+            yield record
+    record = flush()
+    if record:
+        yield record
+
+
+def _line_records(lines: Iterable[str], source: str) -> Iterator[Record]:
+    for n, line in enumerate(lines, 1):
+        text = line.strip()
+        if text:
+            yield {"text": text, "source": f"{source}:{n}"}
+
+
+def read_observations(path: str, logger: Optional[logging.Logger] = None) -> Iterator[Record]:
+    """
+    Stream observation records from a file ('-' reads NDJSON from stdin).
+
+    Yields:
+        Records with "text", "source" (file:line) and any extra fields of the input
+    """
+    logger = logger or logging.getLogger("ObservationIngest")
+    suffix = Path(path).suffix.lower()
+    with (nullcontext(sys.stdin) if path == "-" else open(path, encoding="utf-8")) as f:
+        if path == "-" or suffix in _NDJSON_SUFFIXES:
+            yield from _ndjson_records(f, path, logger)
+        elif suffix in _MARKDOWN_SUFFIXES:
+            yield from _markdown_records(f, path)
+        else:
+            yield from _line_records(f, path)
+
+
+class SessionConsolidator:
+    """
+    Running consolidation of observation results into one session intent.
+
+    Keeps counts rather than the results, so memory stays flat however many
+    observations are added. Signals are deduplicated by name.
+    """
+
+    def __init__(self, session_context: Optional[Dict[str, Any]] = None):
+        self.session_context = session_context or {}
+        self.count = 0
+        self.instruments: Dict[str, int] = {}
+        self.timeframes: Dict[str, int] = {}
+        self.signals: Dict[str, Dict[str, Any]] = {}
+        self.signal_counts: Dict[str, int] = {}
+        self.sentiment_counts = {"bullish": 0, "bearish": 0, "neutral": 0}
+        self._quality_total = 0.0
+
+    def add(self, result: Dict[str, Any]) -> None:
+        observation = result["observation"]
+        self.count += 1
+        for instrument in observation["instruments"]:
+            self.instruments[instrument] = self.instruments.get(instrument, 0) + 1
+        for timeframe in observation["timeframes"]:
+            self.timeframes[timeframe] = self.timeframes.get(timeframe, 0) + 1
+        for signal in result["intent_specification"].get("signals", []):
+            name = signal.get("name", "unnamed_signal")
+            self.signals.setdefault(name, signal)
+            self.signal_counts[name] = self.signal_counts.get(name, 0) + 1
+        self.sentiment_counts[observation["sentiment"]] += 1
+        self._quality_total += result["quality_score"]
+
+    def intent(self) -> Dict[str, Any]:
+        """Consolidated intent, shaped like ObservationCapture.capture_session's."""
+        return {
+            "strategy_intent": "Multi-observation trading session analysis",
+            "instruments": list(self.instruments),
+            "timeframes": list(self.timeframes),
+            "signals": list(self.signals.values()),
+            "signal_counts": dict(self.signal_counts),
+            "bias": max(self.sentiment_counts, key=self.sentiment_counts.get),
+            "observation_count": self.count,
+            "session_context": self.session_context,
+            "risk_management": {
+                "position_size": 1,
+                "max_risk_percent": 2.0,
+                "target_rr": 2.0
+            }
+        }
+
+    def quality(self) -> float:
+        """Average observation quality, plus the consistency bonus of capture_session."""
+        if not self.count:
+            return 0.0
+        sentiments = sum(1 for n in self.sentiment_counts.values() if n)
+        consistency_bonus = 0.1 if sentiments <= 2 else 0.0
+        return min(1.0, self._quality_total / self.count + consistency_bonus)
+
+
+# Per-process capture used by pool workers
+_WORKER_CAPTURE: Optional[ObservationCapture] = None
+
+
+def _init_worker(matcher) -> None:
+    global _WORKER_CAPTURE
+    _WORKER_CAPTURE = ObservationCapture(history_size=1)
+    _WORKER_CAPTURE.matcher = matcher
+
+
+def _analyze_batch(texts: List[str]) -> List[Dict[str, Any]]:
+    return [_WORKER_CAPTURE._observation_result(text) for text in texts]
+
+
+def _batched(records: Iterable[Record], size: int) -> Iterator[List[Record]]:
+    it = iter(records)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _analyzed_batches(records: Iterable[Record], capture: ObservationCapture,
+                      workers: int, batch_size: int) -> Iterator[tuple]:
+    """
+    (batch, results) pairs in input order, at most 2 x workers batches in flight.
+
+    The pool is only started once there are two batches to analyze (a
+    smaller input is analyzed in-process), and never with more processes
+    than batches read ahead.
+    """
+    batches = _batched(records, batch_size)
+    head = list(islice(batches, workers * 2))
+    if workers <= 1 or len(head) <= 1:
+        for batch in chain(head, batches):
+            yield batch, [capture._observation_result(r["text"]) for r in batch]
+        return
+    workers = min(workers, len(head))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(capture.matcher,)) as pool:
+        pending = deque()
+        for batch in chain(head, batches):
+            pending.append((batch, pool.submit(_analyze_batch, [r["text"] for r in batch])))
+            if len(pending) >= workers * 2:
+                batch, future = pending.popleft()
+                yield batch, future.result()
+        while pending:
+            batch, future = pending.popleft()
+            yield batch, future.result()
+
+
+def ingest_observations(
+    source: Union[str, Iterable[Union[str, Record]]],
+    output: Union[str, IO[str], None] = None,
+    capture: Optional[ObservationCapture] = None,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    session_context: Optional[Dict[str, Any]] = None,
+    progress_every: int = DEFAULT_PROGRESS_EVERY,
+    logger: Optional[logging.Logger] = None
+) -> Dict[str, Any]:
+    """
+    Analyze a stream of observations and consolidate them into a session.
+
+    Args:
+        source: Observation file (see read_observations) or an iterable of
+            texts / records with a "text" field
+        output: NDJSON file path or text stream receiving one result per observation
+        capture: ObservationCapture whose matcher and history are used
+        workers: Analysis processes (default: CPU count; 1 analyzes in-process)
+        batch_size: Observations per worker task
+        session_context: Stored in the consolidated intent
+        progress_every: Log throughput every N observations
+        logger: Logger instance
+
+    Returns:
+        Session summary with consolidated intent and throughput metrics
+    """
+    capture = capture or ObservationCapture()
+    logger = logger or capture.logger
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    if isinstance(source, str):
+        records: Iterable[Record] = read_observations(source, logger)
+    else:
+        records = ({"text": r} if isinstance(r, str) else r for r in source)
+
+    consolidator = SessionConsolidator(session_context)
+    started = time.perf_counter()
+    next_progress = progress_every
+    out = open(output, "w", encoding="utf-8") if isinstance(output, str) else nullcontext(output)
+    with out as stream:
+        for batch, results in _analyzed_batches(records, capture, workers, batch_size):
+            for record, result in zip(batch, results):
+                if record.get("timestamp"):
+                    result["observation"]["timestamp"] = record["timestamp"]
+                extra = {k: v for k, v in record.items() if k != "text"}
+                consolidator.add(result)
+                capture.observation_history.append(result["observation"])
+                if stream is not None:
+                    stream.write(json.dumps({**extra, **result}, default=str) + "\n")
+            if stream is not None:
+                stream.flush()
+            if progress_every and consolidator.count >= next_progress:
+                elapsed = time.perf_counter() - started
+                logger.info(
+                    f"[ObservationIngest] {consolidator.count} observations "
+                    f"({consolidator.count / elapsed:.0f}/s)"
+                )
+                next_progress += progress_every
+
+    duration = time.perf_counter() - started
+    intent = consolidator.intent()
+    summary = {
+        "session_timestamp": datetime.now().isoformat(),
+        "source": source if isinstance(source, str) else None,
+        "output": output if isinstance(output, str) else None,
+        "observations": consolidator.count,
+        "workers": workers,
+        "batch_size": batch_size,
+        "duration": round(duration, 3),
+        "observations_per_sec": round(consolidator.count / duration, 1) if duration > 0 else None,
+        "consolidated_instruments": intent["instruments"],
+        "consolidated_timeframes": intent["timeframes"],
+        "consolidated_intent": intent,
+        "session_quality": consolidator.quality(),
+        "trading_recommendations": capture._generate_session_recommendations(intent),
+    }
+    logger.info(
+        f"[ObservationIngest] {summary['observations']} observations in {summary['duration']}s "
+        f"({summary['observations_per_sec']}/s, {workers} workers)"
+    )
+    return summary
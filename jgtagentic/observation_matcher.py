@@ -0,0 +1,197 @@
+"""
+Observation Matcher
+
+Extracts trading context from a market observation in a single pass: the
+text is tokenized once and every token is looked up in one precompiled term
+table mapping words to instruments, timeframes, sentiment, signal type and
+confidence cues. Analysis time is linear in the length of the text, however
+many symbols and keywords are configured.
+
+Terms match whole words, allowing common inflections (``hours``, ``breaking``,
+``clearly``). Instruments match any configured symbol written as ``EUR/USD``,
+``EURUSD`` or ``EUR-USD`` plus aliases (``gold``, ``sp500``); a currency pair
+is also recognized when both of its currencies are mentioned.
+
+Configuration (env):
+    JGT_INSTRUMENTS   Extra comma-separated symbols to recognize (e.g. "NZD/CAD,UK100")
+
+Usage:
+    matcher = ObservationMatcher(instruments=["EUR/USD", "SPX500"])
+    match = matcher.match("EUR/USD looks clearly bullish on the daily")
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+DEFAULT_INSTRUMENTS = (
+    "EUR/USD", "GBP/USD", "USD/JPY", "USD/CHF", "USD/CAD", "AUD/USD", "NZD/USD",
+    "EUR/GBP", "EUR/JPY", "GBP/JPY", "AUD/JPY", "EUR/CHF", "AUD/CAD",
+    "XAU/USD", "XAG/USD", "SPX500", "NAS100", "US30", "GER30", "UK100", "JPN225",
+)
+
+DEFAULT_ALIASES = {
+    "spx": "SPX500", "sp500": "SPX500", "s&p": "SPX500",
+    "nasdaq": "NAS100", "dow": "US30", "dax": "GER30", "ftse": "UK100", "nikkei": "JPN225",
+    "gold": "XAU/USD", "silver": "XAG/USD",
+}
+
+# Timeframes added for any of their words, listed in output order
+TIMEFRAME_TERMS: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (("H4", "H1"), ("hour", "h1", "h4")),
+    (("D1",), ("daily", "day", "d1")),
+    (("m15",), ("15", "fifteen", "m15")),
+)
+
+SENTIMENT_TERMS = {
+    "bullish": ("bullish", "buy", "long", "up", "uptrend", "rising", "breakout", "above", "strong"),
+    "bearish": ("bearish", "sell", "short", "down", "downtrend", "falling", "breakdown", "below", "weak"),
+}
+
+# Signal types by priority: the first type with a matching word wins
+SIGNAL_TERMS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("breakout", ("breakout", "break", "above", "below")),
+    ("alligator", ("alligator", "gator", "mouth")),
+    ("momentum", ("momentum", "strong", "acceleration")),
+    ("confluence", ("confluence", "align", "multiple")),
+)
+
+CONFIDENCE_TERMS = {
+    "high": ("clear", "strong", "definite", "obvious"),
+    "low": ("maybe", "might", "could", "possibly"),
+}
+
+BASE_CONFIDENCE = 0.7
+CONFIDENCE_STEP = 0.1
+
+_TOKEN = re.compile(r"[a-z0-9&]+(?:[/\-][a-z0-9&]+)*")
+_SEPARATOR = re.compile(r"[/\-]")
+_SUFFIXES = ("ing", "ly", "ed", "es", "s")
+
+
+@dataclass
+class ObservationMatch:
+    """Trading context extracted from one observation."""
+    instruments: List[str]
+    timeframes: List[str]
+    sentiment: str
+    signal_type: str
+    confidence: float
+    terms: List[str] = field(default_factory=list)
+
+
+class ObservationMatcher:
+    """
+    Precompiled term table for one-pass observation analysis.
+    """
+
+    def __init__(self, instruments: Optional[Iterable[str]] = None,
+                 aliases: Optional[Dict[str, str]] = None):
+        """
+        Initialize matcher.
+
+        Args:
+            instruments: Symbols to recognize (default: DEFAULT_INSTRUMENTS
+                plus JGT_INSTRUMENTS)
+            aliases: Extra words naming a symbol, e.g. {"cable": "GBP/USD"}
+        """
+        if instruments is None:
+            extra = [s.strip() for s in os.getenv("JGT_INSTRUMENTS", "").split(",") if s.strip()]
+            instruments = list(DEFAULT_INSTRUMENTS) + extra
+        self.instruments = list(dict.fromkeys(instruments))
+        self._symbols: Dict[str, str] = {}
+        self._pairs: List[Tuple[str, str, str]] = []
+        for symbol in self.instruments:
+            self._add_symbol(symbol)
+        for alias, symbol in {**DEFAULT_ALIASES, **(aliases or {})}.items():
+            if symbol in self.instruments:
+                self._symbols[alias.lower()] = symbol
+        self._currencies: Set[str] = {leg for pair in self._pairs for leg in pair[1:]}
+
+        # word -> (category, value) entries
+        self._terms: Dict[str, List[Tuple[str, object]]] = {}
+        for timeframes, words in TIMEFRAME_TERMS:
+            self._add_terms("timeframe", timeframes, words)
+        for sentiment, words in SENTIMENT_TERMS.items():
+            self._add_terms("sentiment", sentiment, words)
+        for priority, (signal_type, words) in enumerate(SIGNAL_TERMS):
+            self._add_terms("signal", priority, words)
+        for level, words in CONFIDENCE_TERMS.items():
+            self._add_terms("confidence", level, words)
+
+    def _add_symbol(self, symbol: str) -> None:
+        lower = symbol.lower()
+        self._symbols[lower] = symbol
+        if "/" in lower:
+            base, quote = lower.split("/", 1)
+            self._symbols[base + quote] = symbol
+            self._symbols[f"{base}-{quote}"] = symbol
+            self._pairs.append((symbol, base, quote))
+
+    def _add_terms(self, category: str, value, words: Iterable[str]) -> None:
+        for word in words:
+            self._terms.setdefault(word, []).append((category, value))
+
+    def _lookup(self, token: str) -> Optional[str]:
+        """Term a word stands for, trying it without common inflections."""
+        if token in self._terms:
+            return token
+        for suffix in _SUFFIXES:
+            if token.endswith(suffix) and token[:-len(suffix)] in self._terms:
+                return token[:-len(suffix)]
+        return None
+
+    def match(self, text: str) -> ObservationMatch:
+        """Extract instruments, timeframes, sentiment, signal type and confidence."""
+        instruments: Dict[str, None] = {}
+        currencies: Set[str] = set()
+        terms: Dict[str, None] = {}
+
+        for token in _TOKEN.findall(text.lower()):
+            symbol = self._symbols.get(token)
+            if symbol is not None:
+                instruments[symbol] = None
+                continue
+            for word in _SEPARATOR.split(token):
+                if word in self._currencies:
+                    currencies.add(word)
+                term = self._lookup(word)
+                if term is not None:
+                    terms[term] = None
+
+        for symbol, base, quote in self._pairs:
+            if base in currencies and quote in currencies:
+                instruments[symbol] = None
+
+        counts: Dict[Tuple[str, object], int] = {}
+        for term in terms:
+            for entry in self._terms[term]:
+                counts[entry] = counts.get(entry, 0) + 1
+
+        timeframes: Dict[str, None] = {}
+        for group, _ in TIMEFRAME_TERMS:
+            if ("timeframe", group) in counts:
+                timeframes.update(dict.fromkeys(group))
+
+        bullish = counts.get(("sentiment", "bullish"), 0)
+        bearish = counts.get(("sentiment", "bearish"), 0)
+        sentiment = "bullish" if bullish > bearish else "bearish" if bearish > bullish else "neutral"
+
+        priorities = [value for category, value in counts if category == "signal"]
+        signal_type = SIGNAL_TERMS[min(priorities)][0] if priorities else "general"
+
+        confidence = (
+            BASE_CONFIDENCE
+            + counts.get(("confidence", "high"), 0) * CONFIDENCE_STEP
+            - counts.get(("confidence", "low"), 0) * CONFIDENCE_STEP
+        )
+
+        return ObservationMatch(
+            instruments=list(instruments),
+            timeframes=list(timeframes),
+            sentiment=sentiment,
+            signal_type=signal_type,
+            confidence=max(0.1, min(1.0, confidence)),
+            terms=list(terms),
+        )
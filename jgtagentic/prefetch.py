@@ -0,0 +1,158 @@
+"""
+Bar-Close Prefetcher for DataLoader
+
+Warms a DataLoader's in-process cache right after each timeframe's bar
+closes, so decisions made after the close read warm frames instead of
+putting the fetch on their critical path.
+
+Usage:
+    loader = DataLoader()
+    prefetcher = loader.start_prefetch(["EUR-USD", "GBP-USD"], ["H4", "H1", "m15"])
+    ...
+    prefetcher.stop()
+"""
+
+import time
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, Sequence
+
+from .timeframes import next_closes
+
+
+class BarClosePrefetcher:
+    """
+    Background thread that reloads the active universe after bar closes.
+
+    Each timeframe is refreshed ``delay`` seconds after its bar close (to let
+    the data server publish the closed bar). Individual keys are spread over
+    ``jitter`` seconds and at most ``max_workers`` loads run at once.
+    """
+
+    def __init__(
+        self,
+        loader,
+        instruments: Sequence[str],
+        timeframes: Sequence[str],
+        data_types: Sequence[str] = ("cds",),
+        dataset: str = "current",
+        columns: Optional[Sequence[str]] = None,
+        delay: float = 2.0,
+        jitter: float = 5.0,
+        max_workers: int = 4,
+        clock: Callable[[], float] = time.time,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize prefetcher.
+
+        Args:
+            loader: DataLoader whose cache is warmed
+            instruments: Active universe
+            timeframes: Timeframes to refresh at their bar closes
+            data_types: Data types loaded per key ('cds', 'pds', 'ttf')
+            dataset: Dataset name
+            columns: Optional column projection passed to the loader
+            delay: Seconds to wait after the bar close before fetching
+            jitter: Maximum random extra delay per key, spreading server load
+            max_workers: Maximum concurrent loads
+            clock: Wall-clock function (seconds since epoch)
+            logger: Logger instance
+        """
+        self.loader = loader
+        self.instruments = list(instruments)
+        self.timeframes = list(timeframes)
+        self.data_types = list(data_types)
+        self.dataset = dataset
+        self.columns = list(columns) if columns else None
+        self.delay = delay
+        self.jitter = jitter
+        self.max_workers = max(1, max_workers)
+        self.clock = clock
+        self.logger = logger or logging.getLogger("BarClosePrefetcher")
+
+        self.cycles = 0
+        self.last_run: Dict[str, float] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _loader_for(self, data_type: str):
+        return {
+            "cds": self.loader.load_cds,
+            "pds": self.loader.load_pds,
+            "ttf": self.loader.load_ttf,
+        }[data_type]
+
+    def warm(self, timeframes: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """
+        Load every instrument/data type for the given timeframes now.
+
+        Returns:
+            Counts of 'loaded' and 'missing' keys
+        """
+        timeframes = list(timeframes or self.timeframes)
+        jobs = [
+            (inst, tf, data_type)
+            for tf in timeframes
+            for inst in self.instruments
+            for data_type in self.data_types
+        ]
+
+        def run(job):
+            inst, tf, data_type = job
+            if self.jitter > 0 and self._stop.wait(random.uniform(0, self.jitter)):
+                return False
+            df = self._loader_for(data_type)(inst, tf, dataset=self.dataset, columns=self.columns)
+            return df is not None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="prefetch") as pool:
+            results = list(pool.map(run, jobs))
+
+        now = self.clock()
+        for tf in timeframes:
+            self.last_run[tf] = now
+        loaded = sum(results)
+        self.logger.info(f"[Prefetch] Warmed {loaded}/{len(jobs)} keys for {', '.join(timeframes)}")
+        return {"loaded": loaded, "missing": len(jobs) - loaded}
+
+    def seconds_until_next(self):
+        """Seconds until the next scheduled refresh and the timeframes due then."""
+        now = datetime.fromtimestamp(self.clock(), tz=timezone.utc)
+        when, due = next_closes(self.timeframes, now)
+        return max(0.0, (when - now).total_seconds() + self.delay), due
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            wait, due = self.seconds_until_next()
+            if self._stop.wait(wait):
+                break
+            try:
+                self.warm(due)
+                self.cycles += 1
+            except Exception as e:
+                self.logger.error(f"[Prefetch] Warm cycle failed for {due}: {e}")
+
+    def start(self, warm_now: bool = False) -> "BarClosePrefetcher":
+        """Start the background thread (optionally warming everything first)."""
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        if warm_now:
+            self.warm()
+        self._thread = threading.Thread(target=self._run, name="BarClosePrefetcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
@@ -0,0 +1,278 @@
+"""
+Scan Profiling
+
+Records where a scan spends its time: per instrument/timeframe phase
+timings (cache lookup, data loading, indicators, scanner), rows and bytes
+loaded, and optionally a cProfile or pyinstrument capture of the scan.
+
+Code on the hot path marks phases with the module-level ``phase()`` and
+``record_frame()``; both are no-ops unless a scan is being profiled in the
+current context, so unprofiled scans pay almost nothing. Work fanned out to
+threads joins the scan when submitted with ``contextvars.copy_context().run``;
+phases running concurrently add up their thread time.
+
+Usage:
+    profiler = ScanProfiler(mode="cprofile", output_dir="profiles")
+    agent = FDBScanAgent(profiler=profiler)
+    agent.scan_all()
+    print(profiler.report())
+
+    agentic-fdbscan --profile cprofile all
+"""
+
+import io
+import time
+import pstats
+import cProfile
+import logging
+import functools
+import threading
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import pyinstrument
+    _PYINSTRUMENT_AVAILABLE = True
+except ImportError:
+    pyinstrument = None
+    _PYINSTRUMENT_AVAILABLE = False
+
+PROFILE_MODES = ("timing", "cprofile", "pyinstrument")
+
+_CURRENT: "contextvars.ContextVar[Optional[ScanSpan]]" = contextvars.ContextVar("scan_span", default=None)
+_ACTIVE: "contextvars.ContextVar[frozenset]" = contextvars.ContextVar("scan_phases", default=frozenset())
+
+
+@dataclass
+class ScanSpan:
+    """Timings and data volume of one profiled scan."""
+    instrument: Optional[str]
+    timeframe: Optional[str]
+    total: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+    rows: int = 0
+    bytes: int = 0
+    capture: Optional[str] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def label(self) -> str:
+        return " ".join(p for p in (self.instrument, self.timeframe) if p) or "scan"
+
+    def add_data(self, rows: int, nbytes: int) -> None:
+        with self._lock:
+            self.rows += rows
+            self.bytes += nbytes
+
+    def add_time(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "instrument": self.instrument,
+            "timeframe": self.timeframe,
+            "total": round(self.total, 6),
+            "phases": {k: round(v, 6) for k, v in self.phases.items()},
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "capture": self.capture,
+        }
+
+
+def current_span() -> Optional[ScanSpan]:
+    """The scan being profiled in this context, if any."""
+    return _CURRENT.get()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Time a phase of the current scan.
+
+    Nested phases of the same name count once, so a loader called from
+    another loader is not timed twice.
+    """
+    span = _CURRENT.get()
+    active = _ACTIVE.get()
+    if span is None or name in active:
+        yield
+        return
+    token = _ACTIVE.set(active | {name})
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _ACTIVE.reset(token)
+        span.add_time(name, time.perf_counter() - start)
+
+
+def record_frame(df) -> None:
+    """Count the rows and in-memory bytes of a loaded frame against the current scan."""
+    span = _CURRENT.get()
+    if span is None or df is None:
+        return
+    span.add_data(len(df), int(df.memory_usage(deep=True).sum()))
+
+
+def profiled_load(func):
+    """Decorate a loader method: time it as the 'load' phase and record what it returned."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _CURRENT.get() is None:
+            return func(*args, **kwargs)
+        with phase("load"):
+            result = func(*args, **kwargs)
+        for df in (result.values() if isinstance(result, dict) else [result]):
+            record_frame(df)
+        return result
+    return wrapper
+
+
+class ScanProfiler:
+    """
+    Collects a ScanSpan per scan and aggregates them into a report.
+    """
+
+    def __init__(
+        self,
+        mode: str = "timing",
+        output_dir: Optional[str] = None,
+        top: int = 15,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            mode: 'timing' (phases only), 'cprofile' or 'pyinstrument'
+            output_dir: Directory for per-scan captures (.prof / .txt)
+            top: Functions listed in the report's cProfile section
+            logger: Logger instance
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode '{mode}'. Use one of: {', '.join(PROFILE_MODES)}")
+        self.logger = logger or logging.getLogger("ScanProfiler")
+        if mode == "pyinstrument" and not _PYINSTRUMENT_AVAILABLE:
+            self.logger.warning("[ScanProfiler] pyinstrument not installed - falling back to cProfile")
+            mode = "cprofile"
+        self.mode = mode
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.top = top
+        self.spans: List[ScanSpan] = []
+        self._stats = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def scan(self, instrument: Optional[str] = None, timeframe: Optional[str] = None) -> Iterator[ScanSpan]:
+        """
+        Profile one scan. Inside an already profiled scan, yields that scan's span.
+        """
+        outer = _CURRENT.get()
+        if outer is not None:
+            yield outer
+            return
+        span = ScanSpan(instrument, timeframe)
+        token = _CURRENT.set(span)
+        capture = self._start_capture()
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.total = time.perf_counter() - start
+            self._stop_capture(capture, span)
+            _CURRENT.reset(token)
+            with self._lock:
+                self.spans.append(span)
+
+    def _start_capture(self):
+        try:
+            if self.mode == "cprofile":
+                capture = cProfile.Profile()
+                capture.enable()
+                return capture
+            if self.mode == "pyinstrument":
+                capture = pyinstrument.Profiler()
+                capture.start()
+                return capture
+        except (ValueError, RuntimeError) as e:
+            # Only one profiler can run at a time; concurrent scans get timings only
+            self.logger.debug(f"[ScanProfiler] Capture skipped: {e}")
+        return None
+
+    def _stop_capture(self, capture, span: ScanSpan) -> None:
+        if capture is None:
+            return
+        name = span.label.replace("/", "-").replace(" ", "-")
+        if self.mode == "cprofile":
+            capture.disable()
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(capture, stream=io.StringIO())
+                else:
+                    self._stats.add(capture)
+            if self.output_dir is not None:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                path = self.output_dir / f"{name}.prof"
+                capture.dump_stats(str(path))
+                span.capture = str(path)
+        else:
+            capture.stop()
+            if self.output_dir is not None:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                path = self.output_dir / f"{name}.txt"
+                path.write_text(capture.output_text(unicode=False, color=False))
+                span.capture = str(path)
+
+    def phase_totals(self) -> Dict[str, float]:
+        """Seconds per phase over all scans, including unattributed 'other' time."""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            for name, seconds in span.phases.items():
+                totals[name] = totals.get(name, 0.0) + seconds
+            other = span.total - sum(span.phases.values())
+            if other > 0:
+                totals["other"] = totals.get("other", 0.0) + other
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "scans": [span.to_dict() for span in self.spans],
+            "phases": {k: round(v, 6) for k, v in self.phase_totals().items()},
+            "total": round(sum(span.total for span in self.spans), 6),
+            "rows": sum(span.rows for span in self.spans),
+            "bytes": sum(span.bytes for span in self.spans),
+        }
+
+    def report(self) -> str:
+        """Aggregated, human-readable profile of every recorded scan."""
+        total = sum(span.total for span in self.spans)
+        lines = [f"Scan profile: {len(self.spans)} scans, {total:.3f}s ({self.mode})"]
+        if not self.spans:
+            return lines[0]
+        lines.append("")
+        lines.append("Phase totals:")
+        for name, seconds in sorted(self.phase_totals().items(), key=lambda kv: kv[1], reverse=True):
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f"  {name:<16}{seconds:>10.3f}s {share:>6.1f}%")
+        lines.append("")
+        lines.append("Per scan:")
+        for span in sorted(self.spans, key=lambda s: s.total, reverse=True):
+            phases = " ".join(f"{k}={v:.3f}s" for k, v in span.phases.items())
+            lines.append(
+                f"  {span.label:<20}{span.total:>9.3f}s  rows={span.rows} bytes={span.bytes}"
+                + (f"  {phases}" if phases else "")
+                + (f"  [{span.capture}]" if span.capture else "")
+            )
+        if self._stats is not None:
+            stream = io.StringIO()
+            self._stats.stream = stream
+            self._stats.sort_stats("cumulative").print_stats(self.top)
+            lines.append("")
+            lines.append(f"Top {self.top} functions (cumulative):")
+            lines.extend("  " + line for line in stream.getvalue().strip().splitlines())
+        return "\n".join(lines)
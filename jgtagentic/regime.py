@@ -95,7 +95,7 @@ class RegimeDetector:
         # Ensure we have EMA
         ema_col = f'ema_{self.trend_ma_period}'
         if ema_col not in df.columns:
-            df[ema_col] = df['Close'].ewm(span=self.trend_ma_period, adjust=False).mean()
+            df[ema_col] = df['Close'].astype('float64').ewm(span=self.trend_ma_period, adjust=False).mean()
         
         latest = df.iloc[-1]
         
@@ -165,9 +165,10 @@ class RegimeDetector:
         Returns:
             Series with ADX values
         """
-        high = df['High']
-        low = df['Low']
-        close = df['Close']
+        # float64 even for compacted (float32) frames
+        high = df['High'].astype('float64')
+        low = df['Low'].astype('float64')
+        close = df['Close'].astype('float64')
         
         # Calculate +DM and -DM
         plus_dm = high.diff()
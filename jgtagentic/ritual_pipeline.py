@@ -0,0 +1,180 @@
+"""
+Pipelined Ritual Sequence
+
+Schedules the H4 → H1 → m15 → m5 ritual as one dependency chain per
+instrument instead of one timeframe at a time across all instruments. A
+lower-timeframe scan only waits for the higher-timeframe scan of the *same*
+instrument, so EUR/USD m15 can run while SPX500 H4 is still scanning and the
+whole sequence takes roughly the depth of the slowest instrument's chain.
+
+Ready scans are started longest-remaining-chain first and the report names
+the critical path (the chain that bounds the total latency).
+
+Usage:
+    from jgtagentic.ritual_pipeline import run_pipeline
+    report = run_pipeline(["EUR/USD", "SPX500"], ["H4", "H1", "m15", "m5"], workers=4)
+    print(report.summary())
+"""
+
+import os
+import time
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .scan_workers import DEFAULT_WORKERS, ScanJob, ScanOutcome, run_scan_job
+
+
+@dataclass
+class StageSpan:
+    """When one scan of the pipeline ran, relative to the pipeline start."""
+    instrument: str
+    timeframe: str
+    status: str
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class PipelineReport:
+    """Outcomes, timings and critical path of a pipelined ritual."""
+    sequence: List[str]
+    outcomes: List[ScanOutcome]
+    spans: List[StageSpan]
+    wall_seconds: float
+    serial_seconds: float
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(o.ok for o in self.outcomes)
+
+    def to_dict(self) -> dict:
+        return {
+            "sequence": self.sequence,
+            "ok": self.ok,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "serial_seconds": round(self.serial_seconds, 3),
+            "critical_path": self.critical_path,
+            "critical_path_seconds": round(self.critical_path_seconds, 3),
+            "outcomes": [o.to_dict() for o in self.outcomes],
+            "spans": [asdict(s) for s in self.spans],
+        }
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.outcomes)} scans in {self.wall_seconds:.1f}s "
+            f"(serial {self.serial_seconds:.1f}s); critical path "
+            f"{' → '.join(self.critical_path) or '-'} = {self.critical_path_seconds:.1f}s"
+        )
+
+
+def run_pipeline(
+    instruments: Iterable[str],
+    sequence: Iterable[str],
+    workers: Optional[int] = None,
+    real: bool = False,
+    cache_dir: Optional[str] = None,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+    stop_on_failure: bool = True,
+    run_job: Optional[Callable[[ScanJob], ScanOutcome]] = None,
+    logger: Optional[logging.Logger] = None
+) -> PipelineReport:
+    """
+    Run the ritual sequence as per-instrument dependency chains.
+
+    Args:
+        instruments: Instruments to scan
+        sequence: Timeframes from highest to lowest; each waits for the
+            previous one of the same instrument
+        workers: Maximum concurrent scans (env: JGT_SCAN_WORKERS, default 4)
+        real: Invoke the real FDBScan logic instead of dry-run
+        cache_dir: JGT_CACHE for the workers
+        timeout: Seconds before a scan is killed
+        env: Extra environment variables for every worker
+        stop_on_failure: Skip the rest of an instrument's chain when a scan fails
+        run_job: Runs one job (default: isolated worker process)
+        logger: Logger instance
+
+    Returns:
+        PipelineReport with outcomes in instrument-major sequence order
+    """
+    logger = logger or logging.getLogger("RitualPipeline")
+    instruments = list(instruments)
+    sequence = list(sequence)
+    run_job = run_job or (lambda job: run_scan_job(job, timeout))
+    workers = max(1, workers or int(os.getenv("JGT_SCAN_WORKERS", DEFAULT_WORKERS)))
+
+    chains = {
+        inst: [ScanJob(inst, tf, real=real, cache_dir=cache_dir, env=dict(env or {})) for tf in sequence]
+        for inst in instruments
+    }
+    position = {inst: 0 for inst in instruments}
+    results: Dict[tuple, ScanOutcome] = {}
+    spans: List[StageSpan] = []
+    ready = [inst for inst in instruments if chains[inst]]
+    origin = time.perf_counter()
+
+    def timed(job: ScanJob):
+        start = time.perf_counter() - origin
+        outcome = run_job(job)
+        return outcome, start, time.perf_counter() - origin
+
+    logger.info(
+        f"[RitualPipeline] {len(instruments)} instruments x {' → '.join(sequence)} with {workers} workers"
+    )
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ritual") as pool:
+        running = {}
+        while ready or running:
+            # Longest remaining chain first keeps the critical path moving
+            ready.sort(key=lambda inst: len(sequence) - position[inst], reverse=True)
+            while ready and len(running) < workers:
+                inst = ready.pop(0)
+                running[pool.submit(timed, chains[inst][position[inst]])] = inst
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                inst = running.pop(future)
+                outcome, start, end = future.result()
+                results[(inst, outcome.timeframe)] = outcome
+                spans.append(StageSpan(inst, outcome.timeframe, outcome.status, start, end))
+                position[inst] += 1
+                if position[inst] >= len(sequence):
+                    continue
+                if outcome.ok or not stop_on_failure:
+                    ready.append(inst)
+                    continue
+                for job in chains[inst][position[inst]:]:
+                    results[(inst, job.timeframe)] = ScanOutcome(
+                        instrument=inst,
+                        timeframe=job.timeframe,
+                        status="skipped",
+                        returncode=None,
+                        duration=0.0,
+                    )
+                logger.warning(f"[RitualPipeline] {inst} {outcome.timeframe} {outcome.status} - rest of chain skipped")
+
+    wall = time.perf_counter() - origin
+    chain_seconds = {
+        inst: sum(s.duration for s in spans if s.instrument == inst) for inst in instruments
+    }
+    critical = max(chain_seconds, key=chain_seconds.get) if chain_seconds else None
+    report = PipelineReport(
+        sequence=sequence,
+        outcomes=[results[(inst, tf)] for inst in instruments for tf in sequence if (inst, tf) in results],
+        spans=sorted(spans, key=lambda s: s.start),
+        wall_seconds=wall,
+        serial_seconds=sum(s.duration for s in spans),
+        critical_path=[f"{critical} {tf}" for tf in sequence if (critical, tf) in results
+                       and results[(critical, tf)].status != "skipped"] if critical else [],
+        critical_path_seconds=chain_seconds.get(critical, 0.0) if critical else 0.0,
+    )
+    logger.info(f"[RitualPipeline] {report.summary()}")
+    return report
@@ -0,0 +1,146 @@
+"""
+Scan Result Cache
+
+Remembers the result of each instrument/timeframe scan together with the
+bar it was taken on. Until the timeframe's next bar closes (or the scanner
+changes) a new scan could only reproduce the same result, so callers return
+the stored one instead of rescanning.
+
+Entries are JSON files:
+    <root>/<INSTRUMENT>-<TF>.json
+    {"instrument", "timeframe", "bar_close", "version", "stored_at", "result"}
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    from .market_store import normalize_instrument
+    from .timeframes import last_bar_close
+except ImportError:  # imported as a top-level module
+    from jgtagentic.market_store import normalize_instrument
+    from jgtagentic.timeframes import last_bar_close
+
+
+def _package_version(name: str) -> str:
+    try:
+        from importlib.metadata import version
+        return version(name)
+    except Exception:
+        return "n/a"
+
+
+def scanner_version(real: bool = False) -> str:
+    """Identify the scanner producing results; results of another version never match."""
+    mode = "real" if real else "dry"
+    return f"jgtagentic {_package_version('jgtagentic')}; jgtml {_package_version('jgtml')}; {mode}"
+
+
+class ScanResultCache:
+    """
+    Scan results keyed by (instrument, timeframe, last closed bar, scanner version).
+    """
+
+    def __init__(
+        self,
+        root: str,
+        version: Optional[str] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            root: Directory holding one JSON file per instrument/timeframe
+            version: Scanner version string (default: scanner_version())
+            logger: Logger instance
+        """
+        self.root = Path(root)
+        self.version = version or scanner_version()
+        self.logger = logger or logging.getLogger("ScanResultCache")
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0}
+
+    def path_for(self, instrument: str, timeframe: str) -> Path:
+        return self.root / f"{normalize_instrument(instrument)}-{timeframe}.json"
+
+    @staticmethod
+    def bar_key(timeframe: str, now: Optional[datetime] = None) -> Optional[str]:
+        """Last closed bar of a timeframe, or None for timeframes we can't place."""
+        try:
+            return last_bar_close(timeframe, now).isoformat()
+        except ValueError:
+            return None
+
+    def get(self, instrument: str, timeframe: str, now: Optional[datetime] = None) -> Optional[Any]:
+        """
+        Stored result if no bar has closed since it was scanned.
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        bar_close = self.bar_key(timeframe, now)
+        entry = self._read(self.path_for(instrument, timeframe))
+        if (
+            bar_close is not None
+            and entry is not None
+            and entry.get("bar_close") == bar_close
+            and entry.get("version") == self.version
+        ):
+            self.stats["hits"] += 1
+            self.logger.info(f"[ScanResultCache] Unchanged since {bar_close}: {instrument} {timeframe}")
+            return entry.get("result")
+        self.stats["misses"] += 1
+        return None
+
+    def put(
+        self,
+        instrument: str,
+        timeframe: str,
+        result: Any,
+        bar_close: Optional[str] = None
+    ) -> bool:
+        """
+        Store a scan result for the bar it was taken on.
+
+        Args:
+            bar_close: Bar key from bar_key() taken when the scan *started*
+                (default: now), so a bar closing mid-scan forces a rescan
+
+        Returns:
+            True if stored
+        """
+        bar_close = bar_close or self.bar_key(timeframe)
+        if bar_close is None:
+            return False
+        path = self.path_for(instrument, timeframe)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "instrument": instrument,
+            "timeframe": timeframe,
+            "bar_close": bar_close,
+            "version": self.version,
+            "stored_at": time.time(),
+            "result": result,
+        }
+        tmp = path.with_name(f"{path.name}.tmp{os.getpid()}-{threading.get_ident()}")
+        with open(tmp, "w") as f:
+            json.dump(entry, f, default=str)
+        os.replace(tmp, path)
+        self.stats["stores"] += 1
+        return True
+
+    def _read(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"[ScanResultCache] Ignoring unreadable entry {path}: {e}")
+            return None
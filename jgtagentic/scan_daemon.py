@@ -0,0 +1,208 @@
+"""
+Continuous FDBScan Daemon
+
+Long-running replacement for the shell scan loops. One process keeps the
+``FDBScanAgent``, a ``DataLoader`` (with its in-memory caches) and the
+regime/score detectors alive, sleeps until the next bar close of any watched
+timeframe, then scans only the timeframes that just closed.
+
+Every scan is published as one JSON line to an NDJSON file (if configured)
+and, for in-process consumers that pass one, to an ``asyncio.Queue``. A
+bounded queue that fills up drops its oldest result, so a slow consumer never
+holds the daemon back.
+
+Usage:
+    agentic-fdbscan daemon --instruments EUR/USD SPX500 --timeframes H4 H1 m15 --output scans.ndjson
+"""
+
+import json
+import time
+import asyncio
+import logging
+import contextvars
+from functools import partial
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .profiling import phase
+from .timeframes import TIMEFRAME_ORDER, last_bar_close, next_closes
+
+
+class ScanDaemon:
+    """
+    Bar-close driven scanner running on an asyncio event loop.
+    """
+
+    def __init__(
+        self,
+        agent,
+        instruments: Sequence[str],
+        timeframes: Sequence[str],
+        output: Optional[str] = None,
+        loader=None,
+        analyze: bool = True,
+        delay: float = 2.0,
+        clock: Callable[[], float] = time.time,
+        queue: Optional[asyncio.Queue] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize daemon.
+
+        Args:
+            agent: FDBScanAgent used for every scan
+            instruments: Instruments watched
+            timeframes: Timeframes watched; each is scanned after its bar close
+            output: NDJSON file results are appended to
+            loader: DataLoader for the regime/score analysis (default: a new
+                one reusing frames within the bar)
+            analyze: Attach regime detection and signal scoring to each result
+            delay: Seconds after the bar close before scanning
+            clock: Wall-clock function (seconds since epoch)
+            queue: Queue results are also put on (default: none); when it is
+                bounded and full, the oldest result is dropped
+            logger: Logger instance
+        """
+        self.agent = agent
+        self.instruments = list(instruments)
+        self.timeframes = [tf for tf in reversed(TIMEFRAME_ORDER) if tf in set(timeframes)]
+        unknown = set(timeframes) - set(self.timeframes)
+        if unknown:
+            raise ValueError(f"Unknown timeframe(s): {', '.join(sorted(unknown))}")
+        self.output = Path(output) if output else None
+        self.delay = delay
+        self.clock = clock
+        self.logger = logger or logging.getLogger("ScanDaemon")
+
+        self.analyze = analyze
+        self.loader = loader
+        self.detector = None
+        self.scorer = None
+        if analyze:
+            from .regime import RegimeDetector
+            from .scoring import SignalScorer
+            if self.loader is None:
+                from .data_loader import DataLoader
+                self.loader = DataLoader(logger=self.logger, reuse_within_bar=True)
+            self.detector = RegimeDetector()
+            self.scorer = SignalScorer()
+
+        self.queue = queue
+        self.cycles = 0
+        self.published = 0
+        self.dropped = 0
+        self._stop: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _now(self) -> datetime:
+        return datetime.fromtimestamp(self.clock(), tz=timezone.utc)
+
+    def seconds_until_next(self):
+        """Seconds until the next scan and the timeframes due then."""
+        now = self._now()
+        when, due = next_closes(self.timeframes, now)
+        return max(0.0, (when - now).total_seconds() + self.delay), due
+
+    def _scan_one(self, instrument: str, timeframe: str) -> Dict[str, Any]:
+        """Scan and analyze one key (runs in a worker thread)."""
+        profiler = getattr(self.agent, "profiler", None)
+        if profiler is None:
+            return self._scan_and_analyze(instrument, timeframe)
+        with profiler.scan(instrument, timeframe):
+            return self._scan_and_analyze(instrument, timeframe)
+
+    def _scan_and_analyze(self, instrument: str, timeframe: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        record: Dict[str, Any] = {
+            "instrument": instrument,
+            "timeframe": timeframe,
+            "bar_close": last_bar_close(timeframe, self._now()).isoformat(),
+            "scanned_at": self._now().isoformat(),
+        }
+        try:
+            scan = self.agent.scan_timeframe(timeframe, instrument)
+            if self.analyze:
+                record["analysis"] = self._analysis(instrument, timeframe, scan)
+            record["scan"] = scan.to_dict() if hasattr(scan, "to_dict") else scan
+            record["status"] = getattr(scan, "status", "ok")
+        except Exception as e:
+            self.logger.error(f"[ScanDaemon] {instrument} {timeframe} failed: {e}")
+            record["status"] = "failed"
+            record["error"] = str(e)
+        record["duration"] = round(time.perf_counter() - start, 3)
+        return record
+
+    def _analysis(self, instrument: str, timeframe: str, scan=None) -> Optional[Dict[str, Any]]:
+        df = self.loader.load_cds(instrument, timeframe)
+        if df is None or df.empty:
+            return None
+        if hasattr(scan, "data_rows"):
+            scan.data_rows = len(df)
+            scan.data_bytes = int(df.memory_usage(deep=True).sum())
+        with phase("indicators"):
+            regime = self.detector.detect(df)
+            scored = self.scorer.score(df, regime, instrument, timeframe)
+        return {"regime": regime.to_dict(), "signal": scored.to_dict()}
+
+    async def publish(self, record: Dict[str, Any]) -> None:
+        """Append a result to the NDJSON output and the queue, if any."""
+        if self.output is not None:
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.output, "a") as f:
+                f.write(json.dumps(record, default=str) + "\n")
+        if self.queue is not None:
+            if self.queue.full():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait(record)
+        self.published += 1
+
+    async def scan_due(self, timeframes: Sequence[str]) -> List[Dict[str, Any]]:
+        """Scan every instrument for the given timeframes, highest timeframe first."""
+        loop = asyncio.get_running_loop()
+        records = []
+        for timeframe in timeframes:
+            # Scans run on the loop's default executor, each in a copy of the current context
+            results = await asyncio.gather(*[
+                loop.run_in_executor(
+                    None, partial(contextvars.copy_context().run, self._scan_one, instrument, timeframe)
+                )
+                for instrument in self.instruments
+            ])
+            for record in results:
+                await self.publish(record)
+            records.extend(results)
+        self.logger.info(f"[ScanDaemon] Scanned {', '.join(timeframes)} for {len(self.instruments)} instruments")
+        return records
+
+    async def run(self, max_cycles: Optional[int] = None, scan_now: bool = False) -> None:
+        """
+        Sleep until each bar close and scan the timeframes that closed.
+
+        Args:
+            max_cycles: Stop after this many bar-close wakeups (default: run until stop())
+            scan_now: Scan every watched timeframe once before waiting
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self.logger.info(
+            f"[ScanDaemon] Watching {', '.join(self.timeframes)} for {len(self.instruments)} instruments"
+        )
+        if scan_now:
+            await self.scan_due(self.timeframes)
+        while not self._stop.is_set() and (max_cycles is None or self.cycles < max_cycles):
+            wait, due = self.seconds_until_next()
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=wait)
+                break
+            except asyncio.TimeoutError:
+                pass
+            await self.scan_due(due)
+            self.cycles += 1
+        self.logger.info(f"[ScanDaemon] Stopped after {self.cycles} cycles, {self.published} results")
+
+    def stop(self) -> None:
+        """Ask a running daemon to stop (safe to call from other threads)."""
+        if self._loop is not None and self._stop is not None:
+            self._loop.call_soon_threadsafe(self._stop.set)
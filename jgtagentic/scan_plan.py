@@ -0,0 +1,202 @@
+"""
+Intent Scan Plans
+
+Compiles an intent specification once into a ``ScanPlan`` the
+``EnhancedFDBScanner`` executes directly:
+
+- deduplicated instrument x timeframe keys
+- the CDS columns to load: the scorer's inputs plus those of the spec's signals
+- the indicators to compute
+- each timeframe's higher-timeframe (HTF) dependency within the spec
+
+Plans are immutable and identified by a fingerprint of the spec's content,
+so repeated scans of the same spec reuse the compiled plan.
+
+Usage:
+    plan = compile_plan(spec)
+    scanner.scan_with_intent(plan)
+"""
+
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from .scoring import SignalScorer
+from .timeframes import TIMEFRAME_ORDER
+
+# Columns every plan loads: everything SignalScorer reads, so a projected
+# frame scores the same as the full one
+BASE_COLUMNS = tuple(SignalScorer.REQUIRED_COLUMNS)
+
+# jgtml_components keys -> CDS columns they read
+COMPONENT_COLUMNS = {
+    "fractal_analysis": ("fdb", "fdbb", "fdbs", "fh", "fl"),
+    "alligator_state": ("jaw", "teeth", "lips"),
+    "momentum": ("ao", "aoaz", "aobz"),
+    "volume_analysis": ("mfi", "mfi_sig", "mfi_green", "mfi_fake", "mfi_sq"),
+}
+
+# jgtml_components keys -> indicators computed for them
+COMPONENT_INDICATORS = {
+    "fractal_analysis": "fractals",
+    "alligator_state": "alligator",
+    "momentum": "ao",
+    "volume_analysis": "mfi",
+}
+
+DEFAULT_PLAN_CACHE_SIZE = 64
+
+# Spec keys that change on every validation without changing the intent
+_VOLATILE_KEYS = ("validation_timestamp",)
+
+
+@dataclass(frozen=True)
+class SignalPlan:
+    """One spec signal: the components to check and the columns they read."""
+    name: str
+    components: Tuple[str, ...]
+    unchecked: Tuple[str, ...]
+    columns: Tuple[str, ...]
+    min_score: Optional[float] = None
+    priority: float = 1.0
+
+
+@dataclass(frozen=True)
+class ScanPlan:
+    """Compiled, immutable execution plan of an intent spec."""
+    fingerprint: str
+    instruments: Tuple[str, ...]
+    timeframes: Tuple[str, ...]
+    keys: Tuple[Tuple[str, str], ...]
+    columns: Tuple[str, ...]
+    indicators: Tuple[str, ...]
+    htf: Dict[str, Optional[str]] = field(default_factory=dict)
+    signals: Tuple[SignalPlan, ...] = ()
+    bias: Optional[str] = None
+    strategy_intent: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "strategy_intent": self.strategy_intent,
+            "instruments": list(self.instruments),
+            "timeframes": list(self.timeframes),
+            "keys": [list(k) for k in self.keys],
+            "columns": list(self.columns),
+            "indicators": list(self.indicators),
+            "htf": dict(self.htf),
+            "bias": self.bias,
+            "signals": [
+                {
+                    "name": s.name,
+                    "components": list(s.components),
+                    "unchecked": list(s.unchecked),
+                    "columns": list(s.columns),
+                    "min_score": s.min_score,
+                    "priority": s.priority,
+                }
+                for s in self.signals
+            ],
+        }
+
+
+def spec_fingerprint(spec: Dict[str, Any]) -> str:
+    """Content hash of a spec, ignoring validation timestamps."""
+    stable = {k: v for k, v in spec.items() if k not in _VOLATILE_KEYS}
+    payload = json.dumps(stable, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _unique(values) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(v for v in values if v))
+
+
+def _higher_timeframes(timeframes: Tuple[str, ...]) -> Dict[str, Optional[str]]:
+    """Next higher timeframe present in the spec for each timeframe."""
+    rank = {tf: i for i, tf in enumerate(TIMEFRAME_ORDER)}
+    known = sorted((tf for tf in timeframes if tf in rank), key=rank.get)
+    htf: Dict[str, Optional[str]] = {tf: None for tf in timeframes}
+    for lower, higher in zip(known, known[1:]):
+        htf[lower] = higher
+    return htf
+
+
+def _signal_plan(signal: Dict[str, Any]) -> SignalPlan:
+    names = list(signal.get("jgtml_components") or {})
+    components = tuple(n for n in names if n in COMPONENT_COLUMNS)
+    validation = signal.get("validation") or {}
+    return SignalPlan(
+        name=signal.get("name", "unnamed_signal"),
+        components=components,
+        unchecked=tuple(n for n in names if n not in COMPONENT_COLUMNS),
+        columns=_unique(c for n in components for c in COMPONENT_COLUMNS[n]),
+        min_score=validation.get("min_score"),
+        priority=signal.get("priority", 1.0),
+    )
+
+
+def compile_plan(spec: Dict[str, Any], fingerprint: Optional[str] = None) -> ScanPlan:
+    """
+    Compile an intent spec into a ScanPlan.
+
+    Args:
+        spec: Intent specification (raw or validated)
+        fingerprint: Precomputed spec_fingerprint(spec)
+
+    Returns:
+        ScanPlan
+    """
+    instruments = _unique(spec.get("instruments") or ["EUR/USD"])
+    timeframes = _unique(spec.get("timeframes") or ["H4"])
+    signals = tuple(_signal_plan(s) for s in spec.get("signals") or [])
+    indicators = ["alligator", "score"]
+    indicators += [COMPONENT_INDICATORS[c] for s in signals for c in s.components]
+    bias = spec.get("bias")
+
+    return ScanPlan(
+        fingerprint=fingerprint or spec_fingerprint(spec),
+        instruments=instruments,
+        timeframes=timeframes,
+        keys=tuple((i, tf) for i in instruments for tf in timeframes),
+        columns=_unique(list(BASE_COLUMNS) + [c for s in signals for c in s.columns]),
+        indicators=_unique(indicators),
+        htf=_higher_timeframes(timeframes),
+        signals=signals,
+        bias=str(bias).lower() if bias else None,
+        strategy_intent=spec.get("strategy_intent", ""),
+    )
+
+
+class PlanCache:
+    """
+    Compiled plans by spec fingerprint (least recently used evicted first).
+    """
+
+    def __init__(self, size: int = DEFAULT_PLAN_CACHE_SIZE):
+        self.size = size
+        self.stats = {"hits": 0, "compiled": 0}
+        self._plans: "OrderedDict[str, ScanPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, spec: Dict[str, Any]) -> ScanPlan:
+        """Plan of a spec, compiling it on first use."""
+        fingerprint = spec_fingerprint(spec)
+        with self._lock:
+            plan = self._plans.get(fingerprint)
+            if plan is not None:
+                self._plans.move_to_end(fingerprint)
+                self.stats["hits"] += 1
+                return plan
+        plan = compile_plan(spec, fingerprint)
+        with self._lock:
+            self._plans[fingerprint] = plan
+            self.stats["compiled"] += 1
+            if len(self._plans) > self.size:
+                self._plans.popitem(last=False)
+        return plan
+
+    def __len__(self) -> int:
+        return len(self._plans)
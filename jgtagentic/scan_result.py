@@ -0,0 +1,120 @@
+"""
+Structured Scan Results
+
+``FDBScanAgent.scan_timeframe`` returns a ``ScanResult`` instead of only
+printing, so batch runs, the daemon and decision stages can consume scans
+in-process. ``to_json()`` gives the one-line form the CLI streams with
+``--ndjson``; ``from_dict()`` reads it back.
+
+Real scans run ``jgtml.fdb_scanner_2408.main()``, a command-line entry point
+that returns nothing and writes its signals to ``fdb_signals_out__<date>.json``.
+``read_signal_output()`` reads back the signals of one scan from that file.
+
+Configuration (env):
+    JGT_SIGNALS_DIR   Directory the scanner writes fdb_signals_out files to
+                      (default: the current directory)
+
+Usage:
+    result = FDBScanAgent().scan_timeframe("H1", "EUR/USD")
+    if result.ok and result.signal_count:
+        ...
+"""
+
+import os
+import json
+from pathlib import Path
+from dataclasses import dataclass, field, fields, asdict
+from typing import Any, Dict, List, Optional
+
+SIGNAL_FILE_PATTERN = "fdb_signals_out__*.json"
+
+
+@dataclass
+class ScanResult:
+    """Outcome of one instrument/timeframe scan."""
+    instrument: Optional[str]
+    timeframe: str
+    status: str = "ok"  # 'ok' or 'failed'
+    mode: str = "dry"  # 'real' or 'dry'
+    signals: List[Dict[str, Any]] = field(default_factory=list)
+    started_at: Optional[str] = None
+    duration: float = 0.0
+    cached: bool = False
+    bar_close: Optional[str] = None
+    data_rows: int = 0
+    data_bytes: int = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    @property
+    def signal_count(self) -> int:
+        return len(self.signals)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["signal_count"] = self.signal_count
+        return data
+
+    def to_json(self) -> str:
+        """Single-line JSON (one NDJSON record)."""
+        return json.dumps(self.to_dict(), default=str)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScanResult":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def signals_from(value: Any) -> List[Dict[str, Any]]:
+    """
+    Normalize what a scanner returned into a list of signal dicts.
+
+    Accepts a list of signals or a mapping of signal key -> signal (the
+    ``fdb_signals_out`` layout); anything else yields no signals.
+    """
+    if isinstance(value, dict):
+        return [
+            {"key": key, **signal} if isinstance(signal, dict) else {"key": key, "value": signal}
+            for key, signal in value.items()
+        ]
+    if isinstance(value, (list, tuple)):
+        return [s if isinstance(s, dict) else {"value": s} for s in value]
+    return []
+
+
+def _signal_matches(signal: Dict[str, Any], instrument: Optional[str], timeframe: str) -> bool:
+    """Whether a signal belongs to a scan; keys read '<instrument>_<timeframe>_<n>'."""
+    parts = str(signal.get("key", "")).split("_")
+    signal_instrument = signal.get("instrument") or (parts[0] if len(parts) > 1 else None)
+    signal_timeframe = signal.get("timeframe") or (parts[1] if len(parts) > 1 else None)
+    if instrument and signal_instrument and signal_instrument != instrument:
+        return False
+    return not signal_timeframe or signal_timeframe == timeframe
+
+
+def read_signal_output(instrument: Optional[str], timeframe: str, since: float,
+                       directory: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Signals of one scan from the newest fdb_signals_out file written since a time.
+
+    Args:
+        instrument: Instrument scanned (None keeps every instrument)
+        timeframe: Timeframe scanned
+        since: Scan start (seconds since epoch); older files are ignored
+        directory: Where the scanner writes (default: JGT_SIGNALS_DIR or cwd)
+
+    Returns:
+        The scan's signals, or None when the scanner wrote no file since ``since``
+    """
+    directory = Path(directory or os.getenv("JGT_SIGNALS_DIR") or ".")
+    # File times may be rounded down to the second
+    files = [f for f in directory.glob(SIGNAL_FILE_PATTERN) if f.stat().st_mtime >= since - 1]
+    if not files:
+        return None
+    newest = max(files, key=lambda f: f.stat().st_mtime)
+    with open(newest) as f:
+        signals = signals_from(json.load(f))
+    return [s for s in signals if _signal_matches(s, instrument, timeframe)]
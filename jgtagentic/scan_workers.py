@@ -0,0 +1,254 @@
+"""
+Isolated FDBScan Workers
+
+Runs ``FDBScanAgent`` scans in separate worker processes so that each scan
+gets its own ``sys.argv``, environment and ``JGT_CACHE`` and a slow or
+crashing scan cannot take the others down. A bounded pool of threads waits on
+the processes, so a grid of scans finishes in roughly the time of the
+slowest one.
+
+Usage:
+    from jgtagentic.scan_workers import run_scans
+    outcomes = run_scans(["EUR/USD", "SPX500"], ["H4", "H1"], workers=4)
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields, asdict
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_WORKERS = 4
+
+# Directory holding the jgtagentic package, so workers import the same code
+_PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class ScanJob:
+    """One instrument/timeframe scan and the environment it runs in."""
+    instrument: str
+    timeframe: str
+    real: bool = False
+    cache_dir: Optional[str] = None
+    env: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.instrument} {self.timeframe}"
+
+
+@dataclass
+class ScanOutcome:
+    """Exit status and captured output of a worker scan."""
+    instrument: str
+    timeframe: str
+    status: str  # 'ok', 'failed' or 'timeout'
+    returncode: Optional[int]
+    duration: float
+    stdout: str = ""
+    stderr: str = ""
+    cached: bool = False
+    result: Optional[dict] = None  # the worker's ScanResult as a dict
+    attempts: int = 1
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScanOutcome":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    @classmethod
+    def from_result(cls, instrument: str, timeframe: str, result: dict, cached: bool = False) -> "ScanOutcome":
+        """Outcome of a successful worker that printed ``result`` (a ScanResult dict)."""
+        return cls(
+            instrument=instrument,
+            timeframe=timeframe,
+            status="ok",
+            returncode=0,
+            duration=result.get("duration", 0.0),
+            stdout=json.dumps(result, default=str) + "\n",
+            cached=cached,
+            result=result,
+        )
+
+
+def build_command(job: ScanJob) -> List[str]:
+    """Command line running a single scan through the FDBScanAgent CLI."""
+    command = [
+        sys.executable, "-m", "jgtagentic.fdbscan_agent", "scan",
+        "--timeframe", job.timeframe,
+        "--instrument", job.instrument,
+        "--ndjson",
+    ]
+    if job.real:
+        command.append("--real")
+    return command
+
+
+def job_environment(job: ScanJob, base: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Environment for a worker: the parent's plus per-job overrides and JGT_CACHE."""
+    env = dict(os.environ if base is None else base)
+    env.update(job.env)
+    # The parent consults the scan cache; a worker must always scan
+    env.pop("JGT_SCAN_CACHE", None)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (_PACKAGE_PARENT, env.get("PYTHONPATH")) if p)
+    if job.cache_dir:
+        env["JGT_CACHE"] = job.cache_dir
+    return env
+
+
+def run_scan_job(job: ScanJob, timeout: Optional[float] = None) -> ScanOutcome:
+    """Run one scan in its own process and collect its outcome."""
+    start = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            build_command(job),
+            env=job_environment(job),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        return ScanOutcome(
+            instrument=job.instrument,
+            timeframe=job.timeframe,
+            status="timeout",
+            returncode=None,
+            duration=time.perf_counter() - start,
+            stdout=_text(e.stdout),
+            stderr=_text(e.stderr),
+        )
+    return ScanOutcome(
+        instrument=job.instrument,
+        timeframe=job.timeframe,
+        status="ok" if completed.returncode == 0 else "failed",
+        returncode=completed.returncode,
+        duration=time.perf_counter() - start,
+        stdout=completed.stdout,
+        stderr=completed.stderr,
+        result=parse_result(completed.stdout),
+    )
+
+
+def parse_result(stdout: str) -> Optional[dict]:
+    """The worker's ScanResult: its stdout must be exactly one JSON object line."""
+    lines = (stdout or "").strip().splitlines()
+    if len(lines) != 1:
+        return None
+    try:
+        result = json.loads(lines[0])
+    except ValueError:
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def run_with_retries(job: ScanJob, timeout: Optional[float] = None, retries: int = 0,
+                     logger: Optional[logging.Logger] = None) -> ScanOutcome:
+    """Run a scan, rerunning it up to ``retries`` times after a failure or timeout."""
+    attempt = 1
+    outcome = run_scan_job(job, timeout)
+    while not outcome.ok and attempt <= retries:
+        if logger:
+            logger.info(f"[ScanWorkers] Retrying {job.key} after {outcome.status} ({attempt}/{retries})")
+        attempt += 1
+        outcome = run_scan_job(job, timeout)
+    outcome.attempts = attempt
+    return outcome
+
+
+def _text(output) -> str:
+    if output is None:
+        return ""
+    return output.decode(errors="replace") if isinstance(output, bytes) else output
+
+
+def run_scans(
+    instruments: Iterable[str],
+    timeframes: Iterable[str],
+    workers: Optional[int] = None,
+    real: bool = False,
+    cache_dir: Optional[str] = None,
+    timeout: Optional[float] = None,
+    env: Optional[Dict[str, str]] = None,
+    cache=None,
+    force: bool = False,
+    retries: int = 0,
+    logger: Optional[logging.Logger] = None
+) -> List[ScanOutcome]:
+    """
+    Scan every instrument/timeframe pair in isolated worker processes.
+
+    Args:
+        instruments: Instruments to scan
+        timeframes: Timeframes to scan for each instrument
+        workers: Maximum concurrent scans (env: JGT_SCAN_WORKERS, default 4)
+        real: Invoke the real FDBScan logic instead of dry-run
+        cache_dir: JGT_CACHE for the workers
+        timeout: Seconds before a scan is killed and reported as 'timeout'
+        env: Extra environment variables for every worker
+        cache: ScanResultCache shared with FDBScanAgent.scan_timeframe (both
+            store the ScanResult); scans unchanged since the last closed bar
+            return an outcome wrapping it (``cached=True``) without running
+        force: Rescan even when the cache holds a current result
+        retries: Reruns of a scan that failed or timed out
+        logger: Logger instance
+
+    Returns:
+        Outcomes in instrument-major grid order
+    """
+    logger = logger or logging.getLogger("ScanWorkers")
+    jobs = [
+        ScanJob(inst, tf, real=real, cache_dir=cache_dir, env=dict(env or {}))
+        for inst in instruments
+        for tf in timeframes
+    ]
+    if not jobs:
+        return []
+    outcomes: List[Optional[ScanOutcome]] = [None] * len(jobs)
+    bar_keys: Dict[int, Optional[str]] = {}
+    if cache is not None:
+        for i, job in enumerate(jobs):
+            hit = None if force else cache.get(job.instrument, job.timeframe)
+            if hit is not None:
+                outcomes[i] = ScanOutcome.from_result(job.instrument, job.timeframe, hit, cached=True)
+            else:
+                # Key results by the bar current when the scan starts
+                bar_keys[i] = cache.bar_key(job.timeframe)
+    pending = [i for i, outcome in enumerate(outcomes) if outcome is None]
+
+    workers = workers or int(os.getenv("JGT_SCAN_WORKERS", DEFAULT_WORKERS))
+    workers = max(1, min(workers, len(pending) or 1))
+
+    logger.info(
+        f"[ScanWorkers] Running {len(pending)} scans with {workers} workers"
+        + (f" ({len(jobs) - len(pending)} unchanged, from cache)" if len(pending) < len(jobs) else "")
+    )
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fdbscan") as pool:
+        for i, outcome in zip(pending, pool.map(lambda i: run_with_retries(jobs[i], timeout, retries, logger), pending)):
+            outcomes[i] = outcome
+            if cache is not None and outcome.ok and outcome.result is not None:
+                cache.put(outcome.instrument, outcome.timeframe, outcome.result, bar_close=bar_keys.get(i))
+
+    for outcome in outcomes:
+        if not outcome.ok:
+            logger.warning(
+                f"[ScanWorkers] {outcome.instrument} {outcome.timeframe} {outcome.status}"
+                f" (exit {outcome.returncode})"
+            )
+    logger.info(
+        f"[ScanWorkers] {sum(o.ok for o in outcomes)}/{len(outcomes)} scans ok"
+        f" in {time.perf_counter() - start:.1f}s"
+    )
+    return outcomes
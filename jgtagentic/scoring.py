@@ -12,6 +12,15 @@ from typing import Dict, List, Optional, Any
 
 from .regime import RegimeResult, TrendDirection
 
+# CDS columns read from the latest bar
+MFI_COLUMNS = ('mfi', 'mfi_fake', 'mfi_sig', 'mfi_sq', 'mfi_green', 'mfi_fade')
+ZONE_COLUMNS = ('zone_sig', 'zcol', 'zlc', 'zlcb', 'zlcs')
+AO_COLUMNS = ('ao', 'ac', 'aoaz', 'aobz', 'aocolor', 'accolor')
+ALLIGATOR_COLUMNS = ('jaw', 'teeth', 'lips')
+FDB_COLUMNS = ('fdb', 'fdbb', 'fdbs')
+# Fractal levels the stop is placed at
+FRACTAL_COLUMNS = ('fl', 'fh')
+
 
 @dataclass
 class ScoreBreakdown:
@@ -89,6 +98,13 @@ class SignalScorer:
     Total: 0-100 points
     """
     
+    # Every CDS column score() reads (prices for the Alligator and trade levels);
+    # frames projected to fewer columns score lower
+    REQUIRED_COLUMNS = (
+        ('High', 'Low', 'Close') + MFI_COLUMNS + ZONE_COLUMNS + AO_COLUMNS
+        + ALLIGATOR_COLUMNS + FDB_COLUMNS + FRACTAL_COLUMNS
+    )
+    
     def __init__(
         self,
         mfi_weight: int = 10,
@@ -175,28 +191,25 @@ class SignalScorer:
         signals = {}
         
         # MFI signals
-        mfi_cols = ['mfi', 'mfi_fake', 'mfi_sig', 'mfi_sq', 'mfi_green', 'mfi_fade']
-        for col in mfi_cols:
+        for col in MFI_COLUMNS:
             if col in row.index:
                 val = row[col]
                 if not pd.isna(val) and val != 0:
-                    signals[col] = float(val) if isinstance(val, (int, float)) else val
+                    signals[col] = float(val) if isinstance(val, (int, float, np.number)) else val
         
         # Zone signals
-        zone_cols = ['zone_sig', 'zcol', 'zlc', 'zlcb', 'zlcs']
-        for col in zone_cols:
+        for col in ZONE_COLUMNS:
             if col in row.index:
                 val = row[col]
                 if not pd.isna(val) and val != 0 and val != '':
                     signals[col] = val
         
         # AO/AC signals
-        ao_cols = ['ao', 'ac', 'aoaz', 'aobz', 'aocolor', 'accolor']
-        for col in ao_cols:
+        for col in AO_COLUMNS:
             if col in row.index:
                 val = row[col]
                 if not pd.isna(val):
-                    signals[col] = float(val) if isinstance(val, (int, float)) else val
+                    signals[col] = float(val) if isinstance(val, (int, float, np.number)) else val
         
         # Alligator state
         if 'jaw' in row.index and 'teeth' in row.index and 'lips' in row.index:
@@ -214,8 +227,7 @@ class SignalScorer:
                     signals['alligator'] = 'NEUTRAL'
         
         # FDB signals
-        fdb_cols = ['fdb', 'fdbb', 'fdbs']
-        for col in fdb_cols:
+        for col in FDB_COLUMNS:
             if col in row.index:
                 val = row[col]
                 if not pd.isna(val) and val != 0:
@@ -0,0 +1,165 @@
+"""
+Intent Spec Cache
+
+Loading a ``.jgtml-spec`` file means reading, YAML-parsing and validating
+it; daemon loops referencing the same files would redo that every cycle.
+``SpecCache`` keeps the processed spec per path and only reparses when the
+file's content changes:
+
+1. unchanged mtime and size      -> cached spec, no read
+2. changed stat, same SHA-256     -> cached spec, no parse
+3. new content seen before        -> pre-processed JSON from the persist dir
+4. otherwise                      -> parse (libyaml C loader if available),
+                                     process, remember and persist
+
+Configuration (env):
+    JGT_SPEC_CACHE    Directory for persisted pre-processed specs (default: memory only)
+"""
+
+import os
+import copy
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import yaml
+
+# libyaml-backed loader when PyYAML was built with it
+try:
+    _YAML_LOADER = yaml.CSafeLoader
+    _LIBYAML_AVAILABLE = True
+except AttributeError:
+    _YAML_LOADER = yaml.SafeLoader
+    _LIBYAML_AVAILABLE = False
+
+# Bump when the persisted form of processed specs changes
+CACHE_FORMAT = 1
+
+
+def load_yaml(text: str) -> Any:
+    """Parse YAML with the fastest safe loader available."""
+    return yaml.load(text, Loader=_YAML_LOADER)
+
+
+class SpecCache:
+    """
+    Processed intent specs by path, revalidated by mtime/size and content hash.
+    """
+
+    def __init__(
+        self,
+        process: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        namespace: str = "raw",
+        persist_dir: Optional[str] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            process: Applied to each parsed spec before caching (e.g.
+                IntentSpecParser.validate_spec); None keeps the parsed spec
+            namespace: Name of the processing, so persisted raw and validated
+                forms of the same content don't collide
+            persist_dir: Directory for <namespace>-<sha256>.json files
+                (env: JGT_SPEC_CACHE; default: memory only)
+            logger: Logger instance
+        """
+        self.process = process
+        self.namespace = namespace
+        persist_dir = persist_dir or os.getenv("JGT_SPEC_CACHE")
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self.logger = logger or logging.getLogger("SpecCache")
+        self.stats: Dict[str, int] = {"hits": 0, "rehashed": 0, "disk_hits": 0, "parses": 0}
+        # path -> (mtime_ns, size, sha256, processed spec)
+        self._entries: Dict[str, Tuple[int, int, str, Dict[str, Any]]] = {}
+        # sha256 -> processed spec, shared by paths with identical content
+        self._by_digest: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> Dict[str, Any]:
+        """
+        Processed spec of a file (a private copy the caller may modify).
+
+        Raises:
+            OSError: The file can't be read
+            yaml.YAMLError: The file isn't valid YAML
+        """
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            self.stats["hits"] += 1
+            return copy.deepcopy(entry[3])
+
+        with open(key, "rb") as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+
+        spec = self._by_digest.get(digest)
+        if spec is not None:
+            self.stats["rehashed"] += 1
+        else:
+            spec = self._read_persisted(digest)
+            if spec is not None:
+                self.stats["disk_hits"] += 1
+            else:
+                spec = self._parse(content)
+                self.stats["parses"] += 1
+                self._persist(digest, spec)
+
+        with self._lock:
+            self._entries[key] = (st.st_mtime_ns, st.st_size, digest, spec)
+            self._by_digest[digest] = spec
+        return copy.deepcopy(spec)
+
+    def _parse(self, content: bytes) -> Dict[str, Any]:
+        data = load_yaml(content.decode("utf-8")) or {}
+        return self.process(data) if self.process else data
+
+    def _persisted_path(self, digest: str) -> Optional[Path]:
+        if self.persist_dir is None:
+            return None
+        return self.persist_dir / f"{self.namespace}-{digest}.json"
+
+    def _read_persisted(self, digest: str) -> Optional[Dict[str, Any]]:
+        path = self._persisted_path(digest)
+        if path is None:
+            return None
+        try:
+            with open(path) as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"[SpecCache] Ignoring unreadable {path}: {e}")
+            return None
+        if stored.get("format") != CACHE_FORMAT or stored.get("sha256") != digest:
+            return None
+        return stored.get("spec")
+
+    def _persist(self, digest: str, spec: Dict[str, Any]) -> None:
+        path = self._persisted_path(digest)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.tmp{os.getpid()}-{threading.get_ident()}")
+            with open(tmp, "w") as f:
+                json.dump({"format": CACHE_FORMAT, "sha256": digest, "spec": spec}, f, default=str)
+            os.replace(tmp, path)
+        except OSError as e:
+            self.logger.warning(f"[SpecCache] Could not persist {path}: {e}")
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Forget one path (or everything held in memory)."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._by_digest.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
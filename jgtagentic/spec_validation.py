@@ -0,0 +1,274 @@
+"""
+Batch Spec Validation
+
+Validates a library of ``.jgtml-spec`` files in one run: files are hashed,
+specs whose content was already validated are answered from a result cache
+(keyed by SHA-256), and the rest are checked in parallel worker processes.
+The run produces a single JSON report.
+
+A spec is invalid when it can't be parsed, isn't a mapping, has fields of
+the wrong type or can't be compiled to a scan plan. Fields the parser
+fills with defaults, unknown timeframes and signal components the scanner
+doesn't check are reported as warnings.
+
+Configuration (env):
+    JGT_SPEC_CACHE    Directory holding validation.json, the result cache
+                      (default: no cache unless --cache is given)
+
+Usage:
+    report = validate_directory("specs/", workers=8)
+
+    jgtagentic spec validate-all specs/ --output report.json
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from .intent_spec import IntentSpecParser
+from .scan_plan import COMPONENT_COLUMNS, compile_plan
+from .spec_cache import load_yaml
+from .timeframes import TIMEFRAME_SECONDS
+
+DEFAULT_PATTERN = "*.jgtml-spec"
+
+# Bump when checks change, so cached results are revalidated
+VALIDATION_VERSION = 1
+
+_NUMERIC_RISK_FIELDS = ("position_size", "max_risk_percent", "target_rr")
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _string_list(spec: Dict[str, Any], name: str, errors: List[str]) -> List[str]:
+    value = spec.get(name)
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(isinstance(v, str) and v for v in value):
+        errors.append(f"{name} must be a list of non-empty strings")
+        return []
+    return value
+
+
+def check_spec(spec: Any) -> Tuple[List[str], List[str]]:
+    """
+    Errors and warnings of a parsed spec.
+
+    Returns:
+        (errors, warnings)
+    """
+    errors: List[str] = []
+    warnings: List[str] = []
+    if not isinstance(spec, dict):
+        return [f"spec must be a mapping, got {type(spec).__name__}"], warnings
+
+    for name in ("strategy_intent", "instruments", "timeframes"):
+        if name not in spec:
+            warnings.append(f"{name} missing, default applied")
+    if "strategy_intent" in spec and not isinstance(spec["strategy_intent"], str):
+        errors.append("strategy_intent must be a string")
+
+    _string_list(spec, "instruments", errors)
+    for tf in _string_list(spec, "timeframes", errors):
+        if tf not in TIMEFRAME_SECONDS:
+            warnings.append(f"unknown timeframe '{tf}'")
+
+    signals = spec.get("signals") or []
+    if not isinstance(signals, list):
+        errors.append("signals must be a list")
+        signals = []
+    for i, signal in enumerate(signals):
+        label = f"signals[{i}]"
+        if not isinstance(signal, dict):
+            errors.append(f"{label} must be a mapping")
+            continue
+        label = f"signal '{signal['name']}'" if signal.get("name") else label
+        if not signal.get("name"):
+            warnings.append(f"{label} has no name")
+        components = signal.get("jgtml_components") or {}
+        if not isinstance(components, dict):
+            errors.append(f"{label} jgtml_components must be a mapping")
+        else:
+            for name in components:
+                if name not in COMPONENT_COLUMNS:
+                    warnings.append(f"{label} component '{name}' is not checked by the scanner")
+        validation = signal.get("validation") or {}
+        if not isinstance(validation, dict):
+            errors.append(f"{label} validation must be a mapping")
+        elif "min_score" in validation and not _is_number(validation["min_score"]):
+            errors.append(f"{label} validation.min_score must be a number")
+        if "priority" in signal and not _is_number(signal["priority"]):
+            errors.append(f"{label} priority must be a number")
+
+    risk = spec.get("risk_management") or {}
+    if not isinstance(risk, dict):
+        errors.append("risk_management must be a mapping")
+    else:
+        for name in _NUMERIC_RISK_FIELDS:
+            if name in risk and not _is_number(risk[name]):
+                errors.append(f"risk_management.{name} must be a number")
+
+    return errors, warnings
+
+
+def validate_content(content: bytes) -> Dict[str, Any]:
+    """Validate the content of one spec file (runs in worker processes)."""
+    started = time.perf_counter()
+    result: Dict[str, Any] = {"valid": False, "errors": [], "warnings": []}
+    try:
+        spec = load_yaml(content.decode("utf-8"))
+    except (UnicodeDecodeError, yaml.YAMLError) as e:
+        result["errors"].append(f"unparseable: {e}")
+    else:
+        errors, warnings = check_spec(spec)
+        result["errors"], result["warnings"] = errors, warnings
+        if not errors:
+            try:
+                validated = IntentSpecParser().validate_spec(spec)
+                plan = compile_plan(validated)
+                result.update({
+                    "strategy_intent": validated["strategy_intent"],
+                    "signals": len(validated["signals"]),
+                    "keys": len(plan.keys),
+                    "plan": plan.fingerprint,
+                })
+            except Exception as e:
+                errors.append(f"does not compile to a scan plan: {e}")
+        result["valid"] = not errors
+    result["duration"] = round(time.perf_counter() - started, 6)
+    return result
+
+
+class ValidationCache:
+    """Validation results by spec content hash, stored as one JSON file."""
+
+    def __init__(self, path: Optional[str] = None, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger("ValidationCache")
+        if path is None and os.getenv("JGT_SPEC_CACHE"):
+            path = os.path.join(os.getenv("JGT_SPEC_CACHE"), "validation.json")
+        self.path = Path(path) if path else None
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if self.path is not None:
+            self._read()
+
+    def _read(self) -> None:
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"[ValidationCache] Ignoring unreadable {self.path}: {e}")
+            return
+        if stored.get("version") == VALIDATION_VERSION:
+            self.results = stored.get("results", {})
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        return self.results.get(digest)
+
+    def put(self, digest: str, result: Dict[str, Any]) -> None:
+        self.results[digest] = result
+        self._dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.tmp{os.getpid()}")
+            with open(tmp, "w") as f:
+                json.dump({"version": VALIDATION_VERSION, "results": self.results}, f)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as e:
+            self.logger.warning(f"[ValidationCache] Could not save {self.path}: {e}")
+
+
+def validate_directory(
+    directory: str,
+    pattern: str = DEFAULT_PATTERN,
+    workers: Optional[int] = None,
+    cache: Optional[ValidationCache] = None,
+    logger: Optional[logging.Logger] = None
+) -> Dict[str, Any]:
+    """
+    Validate every spec under a directory (recursively).
+
+    Args:
+        directory: Spec library root
+        pattern: Glob of spec file names
+        workers: Worker processes (default: CPU count; 1 validates in-process)
+        cache: Result cache (default: ValidationCache(), i.e. JGT_SPEC_CACHE if set)
+        logger: Logger instance
+
+    Returns:
+        Report with totals and one result per file, sorted by path
+    """
+    logger = logger or logging.getLogger("SpecValidation")
+    cache = cache if cache is not None else ValidationCache(logger=logger)
+    started = time.perf_counter()
+    root = Path(directory)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    digests: Dict[str, str] = {}
+    pending: Dict[str, bytes] = {}
+    for path in sorted(p for p in root.rglob(pattern) if p.is_file()):
+        name = str(path)
+        try:
+            content = path.read_bytes()
+        except OSError as e:
+            results[name] = {"valid": False, "errors": [f"unreadable: {e}"], "warnings": []}
+            continue
+        digest = hashlib.sha256(content).hexdigest()
+        digests[name] = digest
+        if cache.get(digest) is None:
+            pending.setdefault(digest, content)
+
+    cached = sum(1 for digest in digests.values() if digest not in pending)
+    if pending:
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(pending) > 1:
+            workers = min(workers, len(pending))
+            chunksize = max(1, len(pending) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(validate_content, pending.values(), chunksize=chunksize))
+        else:
+            outcomes = [validate_content(content) for content in pending.values()]
+        for digest, outcome in zip(pending, outcomes):
+            cache.put(digest, outcome)
+        cache.save()
+
+    for name, digest in digests.items():
+        results[name] = dict(cache.get(digest), sha256=digest, cached=digest not in pending)
+
+    report_results = [dict(path=name, **results[name]) for name in sorted(results)]
+    valid = sum(1 for r in report_results if r["valid"])
+    report = {
+        "directory": str(root),
+        "pattern": pattern,
+        "generated_at": datetime.now().isoformat(),
+        "version": VALIDATION_VERSION,
+        "total": len(report_results),
+        "valid": valid,
+        "invalid": len(report_results) - valid,
+        "cached": cached,
+        "validated": len(pending),
+        "duration": round(time.perf_counter() - started, 3),
+        "results": report_results,
+    }
+    logger.info(
+        f"[SpecValidation] {valid}/{report['total']} specs valid "
+        f"({len(pending)} validated, {cached} cached) in {report['duration']}s"
+    )
+    return report
@@ -0,0 +1,82 @@
+"""
+Timeframe and Bar-Close Helpers
+
+Bar boundaries for the JGT timeframe codes (m1 ... H4, D1, W1, M1), used to
+schedule work right after a bar closes and to tell whether data fetched
+earlier is still current.
+
+Bars are aligned on UTC epoch multiples of their duration; weekly bars open
+Sunday 00:00 UTC and monthly bars on the first of the month.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+TIMEFRAME_SECONDS: Dict[str, int] = {
+    "m1": 60,
+    "m5": 5 * 60,
+    "m15": 15 * 60,
+    "m30": 30 * 60,
+    "H1": 3600,
+    "H2": 2 * 3600,
+    "H3": 3 * 3600,
+    "H4": 4 * 3600,
+    "H6": 6 * 3600,
+    "H8": 8 * 3600,
+    "D1": 86400,
+    "W1": 7 * 86400,
+    "M1": 31 * 86400,  # upper bound; monthly boundaries use the calendar
+}
+
+# Sorted lowest to highest timeframe
+TIMEFRAME_ORDER: List[str] = sorted(TIMEFRAME_SECONDS, key=TIMEFRAME_SECONDS.get)
+
+# 1970-01-01 was a Thursday; weekly bars start on Sunday
+_ANCHOR_OFFSETS = {"W1": 3 * 86400}
+
+
+def _now(now: Optional[datetime]) -> datetime:
+    if now is None:
+        return datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        return now.replace(tzinfo=timezone.utc)
+    return now
+
+
+def bar_seconds(timeframe: str) -> int:
+    """Duration of a timeframe in seconds."""
+    try:
+        return TIMEFRAME_SECONDS[timeframe]
+    except KeyError:
+        raise ValueError(f"Unknown timeframe: {timeframe}")
+
+
+def last_bar_close(timeframe: str, now: Optional[datetime] = None) -> datetime:
+    """Time (UTC) at which the most recent bar of ``timeframe`` closed."""
+    now = _now(now)
+    if timeframe == "M1":
+        return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    seconds = bar_seconds(timeframe)
+    offset = _ANCHOR_OFFSETS.get(timeframe, 0)
+    epoch = now.timestamp() - offset
+    closed = epoch - (epoch % seconds) + offset
+    return datetime.fromtimestamp(closed, tz=timezone.utc)
+
+
+def next_bar_close(timeframe: str, now: Optional[datetime] = None) -> datetime:
+    """Time (UTC) at which the current bar of ``timeframe`` will close."""
+    last = last_bar_close(timeframe, now)
+    if timeframe == "M1":
+        year, month = (last.year + 1, 1) if last.month == 12 else (last.year, last.month + 1)
+        return last.replace(year=year, month=month)
+    return last + timedelta(seconds=bar_seconds(timeframe))
+
+
+def next_closes(timeframes: Iterable[str], now: Optional[datetime] = None) -> Tuple[datetime, List[str]]:
+    """Earliest upcoming bar close among ``timeframes`` and every timeframe closing then."""
+    now = _now(now)
+    closes = {tf: next_bar_close(tf, now) for tf in timeframes}
+    if not closes:
+        raise ValueError("No timeframes given")
+    when = min(closes.values())
+    return when, [tf for tf in TIMEFRAME_ORDER if closes.get(tf) == when]
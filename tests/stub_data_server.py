@@ -0,0 +1,168 @@
+"""
+Stand-in jgt-data-server for offline DataLoader tests and timing.
+
+Serves ``/market-data`` from an in-memory DataFrame and honours the
+``Accept`` header the way the real server negotiates payloads:
+columnar JSON, msgpack and Arrow IPC when the client offers them (and the
+codec is installed), the legacy list-of-rows JSON otherwise. Requests with
+a ``data_types`` parameter get one envelope holding every requested type.
+
+Run directly to compare decode times of row vs columnar payloads:
+
+    python tests/stub_data_server.py --rows 50000
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def make_frame(rows=1000, seed=7):
+    """Synthetic CDS-like frame with prices, indicators and a string zone column."""
+    rng = np.random.default_rng(seed)
+    close = 1.08 + np.cumsum(rng.normal(0, 0.0005, rows))
+    return pd.DataFrame({
+        "Date": pd.date_range("2024-01-01", periods=rows, freq="h").strftime("%Y-%m-%d %H:%M:%S"),
+        "Open": close + rng.normal(0, 0.0002, rows),
+        "High": close + 0.001,
+        "Low": close - 0.001,
+        "Close": close,
+        "ao": rng.normal(0, 0.001, rows),
+        "ac": rng.normal(0, 0.001, rows),
+        "fdbb": rng.integers(0, 2, rows).astype(float),
+        "fdbs": rng.integers(0, 2, rows).astype(float),
+        "zcol": rng.choice(["green", "red", "gray"], rows),
+    })
+
+
+class StubDataServer:
+    """Threaded HTTP server exposing a frame at /market-data."""
+
+    def __init__(self, frame=None, formats=("columns", "msgpack", "arrow", "bundle"), frames=None):
+        self.frame = make_frame() if frame is None else frame
+        # Optional frame per data type; types not listed serve ``frame``
+        self.frames = frames or {}
+        self.formats = set(formats)
+        self.requests = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                accept = self.headers.get("Accept", "")
+                stub.requests.append({"path": parsed.path, "params": params, "accept": accept})
+                if parsed.path != "/market-data":
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                if "data_types" in params and "bundle" in stub.formats:
+                    body, content_type = stub.encode_bundle(params["data_types"].split(","), accept)
+                else:
+                    body, content_type = stub.encode(accept, params.get("data_type"))
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def frame_for(self, data_type):
+        return self.frames.get(data_type, self.frame)
+
+    def encode(self, accept, data_type=None):
+        """Pick the payload format from the Accept header."""
+        df = self.frame_for(data_type)
+        if "arrow" in self.formats and pa is not None and "application/vnd.apache.arrow.stream" in accept:
+            sink = pa.BufferOutputStream()
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return sink.getvalue().to_pybytes(), "application/vnd.apache.arrow.stream"
+        columns = {c: df[c].tolist() for c in df.columns}
+        if "msgpack" in self.formats and msgpack is not None and "application/msgpack" in accept:
+            return msgpack.packb({"success": True, "data": columns}), "application/msgpack"
+        if "columns" in self.formats and "application/vnd.jgt.columns+json" in accept:
+            body = json.dumps({"success": True, "data": columns})
+            return body.encode(), "application/vnd.jgt.columns+json"
+        body = json.dumps({"success": True, "data": df.to_dict(orient="records")})
+        return body.encode(), "application/json"
+
+    def encode_bundle(self, data_types, accept):
+        """Envelope with one entry per data type; types without a frame are empty."""
+        data = {}
+        for data_type in data_types:
+            df = self.frame_for(data_type)
+            if df is None:
+                data[data_type] = []
+            elif "columns" in self.formats and "application/vnd.jgt.columns+json" in accept:
+                data[data_type] = {c: df[c].tolist() for c in df.columns}
+            else:
+                data[data_type] = df.to_dict(orient="records")
+        return json.dumps({"success": True, "data": data}).encode(), "application/json"
+
+
+def _time_load(url, repeat=5):
+    from jgtagentic.data_loader import DataLoader
+
+    loader = DataLoader(data_server_url=url, local_data_path="/nonexistent")
+    start = time.perf_counter()
+    for _ in range(repeat):
+        loader.load_cds("EUR-USD", "H1")
+    return (time.perf_counter() - start) / repeat
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import sys
+
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+    parser = argparse.ArgumentParser(description="Time DataLoader payload decoding against a stub server")
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+
+    frame = make_frame(args.rows)
+    with StubDataServer(frame, formats=()) as rows_server:
+        rows_time = _time_load(rows_server.url)
+    with StubDataServer(frame) as fast_server:
+        fast_time = _time_load(fast_server.url)
+    print(f"rows JSON:      {rows_time * 1000:.1f} ms/load")
+    print(f"negotiated:     {fast_time * 1000:.1f} ms/load")
@@ -96,3 +96,35 @@ def test_orchestrator_spiral(tmp_path, sample_signal):
     assert os.path.exists(script_path)
     assert 'Prepared environment' in env_result
     assert 'Decision for' in decision
+
+def test_orchestrator_import_has_no_side_effects():
+    import subprocess
+    code = (
+        "import sys, jgtagentic.agentic_entry_orchestrator as m; "
+        "assert m.AgenticEntryOrchestrator; "
+        "assert 'pandas' not in sys.modules and 'jgtagentic.fdbscan_agent' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+
+def test_orchestrator_runs_signal_file(tmp_path, sample_signal, monkeypatch):
+    from jgtagentic.agentic_entry_orchestrator import AgenticEntryOrchestrator
+    monkeypatch.setenv("PATH", str(tmp_path))  # no wtf available
+    signal_json = tmp_path / "signals.json"
+    signal_json.write_text(json.dumps([sample_signal]))
+    log = tmp_path / "logs" / "session.md"
+    orchestrator = AgenticEntryOrchestrator(str(signal_json), str(log), str(tmp_path))
+    assert orchestrator._fdbscan_agent is None
+
+    results = orchestrator.run()
+    assert [r["status"] for r in results] == ["success"]
+    assert os.path.exists(tmp_path / "GBP-USD_m5_250519140525.sh")
+    text = log.read_text()
+    assert "Parsed 1 signals" in text and "wtf not found" in text
+    assert orchestrator.fdbscan_agent is orchestrator._fdbscan_agent is not None
+
+def test_orchestrator_missing_signal_file(tmp_path):
+    from jgtagentic.agentic_entry_orchestrator import AgenticEntryOrchestrator
+    orchestrator = AgenticEntryOrchestrator(str(tmp_path / "absent.json"), str(tmp_path / "log.md"), dry_run=True)
+    with pytest.raises(FileNotFoundError):
+        orchestrator.run()
+    assert not os.path.exists(tmp_path / "log.md")
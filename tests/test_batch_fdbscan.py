@@ -0,0 +1,37 @@
+# Tests for the batch FDBScan runner
+import sys
+import time
+
+from jgtagentic import scan_workers
+from jgtagentic.batch_fdbscan import run_batch, summary_table
+
+
+def test_hung_scan_does_not_block_the_batch(monkeypatch, tmp_path):
+    real_build = scan_workers.build_command
+
+    def fake_command(job):
+        if job.instrument == "HUNG":
+            return [sys.executable, "-c", "import time; time.sleep(30)"]
+        return real_build(job)
+
+    monkeypatch.setattr(scan_workers, "build_command", fake_command)
+
+    start = time.perf_counter()
+    log = run_batch(["EUR/USD", "HUNG"], ["H1"], cache_dir=str(tmp_path / "cache"),
+                    log_dir=str(tmp_path / "logs"), workers=2, timeout=2, retries=1)
+    assert time.perf_counter() - start < 15
+    text = open(log).read()
+    assert "| HUNG | H1 | timeout |" in text
+    assert "| EUR/USD | H1 | ok | " in text
+    assert "1/2 scans ok" in text
+    # The worker's structured result supplies the signal count
+    assert "| 0 | 1 |" in text and "| - | 2 |" in text
+
+
+def test_summary_table_orders_slowest_first():
+    table = summary_table([
+        {"instrument": "A", "timeframe": "H1", "status": "ok", "duration": 0.5, "result": {"signal_count": 2}},
+        {"instrument": "B", "timeframe": "H1", "status": "failed", "duration": 3.0, "attempts": 2},
+    ])
+    rows = [line for line in table.splitlines() if line.startswith("| A") or line.startswith("| B")]
+    assert rows == ["| B | H1 | failed | 3.0 | - | 2 |", "| A | H1 | ok | 0.5 | 2 | 1 |"]
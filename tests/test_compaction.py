@@ -0,0 +1,105 @@
+# Tests for opt-in dtype compaction of loaded frames
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgtagentic import data_loader as dl
+from jgtagentic.alligator_regime import AlligatorDetector
+from jgtagentic.data_loader import DataLoader, compact_frame
+from jgtagentic.regime import RegimeDetector
+from jgtagentic.scoring import SignalScorer
+from tests.stub_data_server import make_frame
+
+
+def _cds_frame(rows=400, seed=11):
+    df = make_frame(rows, seed)
+    # Quotes carry 5 decimals like real FX prices
+    df[["Open", "High", "Low", "Close"]] = df[["Open", "High", "Low", "Close"]].round(5)
+    rng = np.random.default_rng(seed)
+    median = (df["High"] + df["Low"]) / 2
+    df["jaw"] = median.rolling(13).mean()
+    df["teeth"] = median.rolling(8).mean()
+    df["lips"] = median.rolling(5).mean()
+    df["mfi"] = rng.normal(0, 1e-5, rows)
+    df["mfi_sig"] = rng.integers(0, 4, rows).astype(float)
+    df["mfi_fake"] = rng.integers(0, 2, rows).astype(float)
+    df["Volume"] = rng.integers(100, 5000, rows)
+    return df
+
+
+def test_compact_frame_dtypes_and_memory():
+    df = _cds_frame()
+    compact = compact_frame(df, exclude=("Date",))
+    assert compact["Close"].dtype == "float32"
+    assert compact["fdbb"].dtype == "int8"
+    assert compact["mfi_sig"].dtype == "int8"
+    assert compact["zcol"].dtype == "category"
+    assert compact["Volume"].dtype == "int16"
+    assert compact["Date"].dtype == df["Date"].dtype
+    # jaw/teeth/lips have leading NaN - still float, never int8
+    assert compact["jaw"].dtype == "float32"
+    assert compact.memory_usage(deep=True).sum() < df.memory_usage(deep=True).sum() / 2
+    # Input untouched
+    assert df["Close"].dtype == "float64"
+
+
+def test_compact_frame_keeps_values_outside_tolerance():
+    df = pd.DataFrame({
+        "precise": [1.0 + 1e-12, 2.0],
+        "huge": [1e300, 1.0],
+        "fdbb": [1.0, np.nan],
+        "fdbs": [0.0, 300.0],
+    })
+    compact = compact_frame(df, rtol=1e-14)
+    assert compact["precise"].dtype == "float64"
+    assert compact_frame(df)["huge"].dtype == "float64"
+    assert compact["fdbb"].dtype != "int8"
+    assert compact["fdbs"].dtype != "int8"
+
+
+def test_decisions_identical_on_compacted_frames():
+    df = _cds_frame()
+    compact = compact_frame(df, exclude=("Date",))
+    regime_detector = RegimeDetector()
+    alligator = AlligatorDetector()
+    scorer = SignalScorer()
+
+    for end in range(120, len(df) + 1, 7):
+        full, small = df.iloc[:end], compact.iloc[:end]
+
+        regime_full = regime_detector.detect(full)
+        regime_small = regime_detector.detect(small)
+        assert regime_small.regime == regime_full.regime
+        assert regime_small.trend_direction == regime_full.trend_direction
+        # DM/TR differences amplify float32 rounding of prices
+        assert regime_small.adx == pytest.approx(regime_full.adx, rel=1e-3)
+
+        allig_full, allig_small = alligator.detect(full), alligator.detect(small)
+        assert (allig_small.state, allig_small.direction) == (allig_full.state, allig_full.direction)
+        # Spread is a difference of nearly equal lines - compare absolutely
+        assert allig_small.spread == pytest.approx(allig_full.spread, abs=1e-6)
+
+        scored_full = scorer.score(full, regime_full, "EUR-USD", "H1")
+        scored_small = scorer.score(small, regime_full, "EUR-USD", "H1")
+        assert scored_small.direction == scored_full.direction
+        assert scored_small.score == scored_full.score
+        assert scored_small.zone == scored_full.zone
+        assert scored_small.entry_price == pytest.approx(scored_full.entry_price, rel=1e-6)
+        assert set(scored_small.active_signals) == set(scored_full.active_signals)
+        assert all(not isinstance(v, np.generic) for v in scored_small.active_signals.values())
+
+
+def test_loader_compacts_local_reads(monkeypatch, tmp_path):
+    def failing_get(*args, **kwargs):
+        raise dl.requests.ConnectionError("down")
+
+    monkeypatch.setattr(dl.requests, "get", failing_get)
+    path = tmp_path / "current" / "cds"
+    path.mkdir(parents=True)
+    _cds_frame(50).to_csv(path / "EUR-USD-H1.csv", index=False)
+
+    monkeypatch.setenv("JGT_DATA_COMPACT", "1")
+    df = DataLoader(local_data_path=str(tmp_path)).load_cds("EUR-USD", "H1")
+    assert df["Close"].dtype == "float32"
+    assert df["fdbs"].dtype == "int8"
+    assert df["zcol"].dtype == "category"
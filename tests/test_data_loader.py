@@ -0,0 +1,425 @@
+# Tests for DataLoader API/local loading paths
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+from jgtagentic import data_loader as dl
+from jgtagentic.data_loader import DataLoader
+from tests.stub_data_server import StubDataServer, make_frame
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode()
+        self.headers = {"Content-Type": "application/json"}
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+def _rows(start, count, close=1.0):
+    dates = pd.date_range(start, periods=count, freq="h")
+    return [
+        {"Date": d.isoformat(), "High": close + 0.1, "Low": close - 0.1, "Close": close + i * 0.01}
+        for i, d in enumerate(dates)
+    ]
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    """Patch requests.get with a recorder serving rows from a mutable list."""
+    state = {"rows": _rows("2025-01-01", 50), "calls": []}
+
+    def fake_get(url, params=None, timeout=None, **kwargs):
+        state["calls"].append(dict(params or {}))
+        rows = state["rows"]
+        since = (params or {}).get("since")
+        if since:
+            rows = [r for r in rows if pd.Timestamp(r["Date"]) >= pd.Timestamp(since)]
+        return FakeResponse({"success": True, "data": rows})
+
+    monkeypatch.setattr(dl.requests, "get", fake_get)
+    return state
+
+
+def test_full_load_without_incremental(fake_server, tmp_path):
+    loader = DataLoader(local_data_path=str(tmp_path), incremental=False)
+    first = loader.load_cds("EUR-USD", "H1")
+    second = loader.load_cds("EUR-USD", "H1")
+    assert len(first) == len(second) == 50
+    assert all("since" not in c for c in fake_server["calls"])
+
+
+def test_incremental_requests_only_newer_rows(fake_server, tmp_path):
+    loader = DataLoader(local_data_path=str(tmp_path), incremental=True, overlap_bars=2)
+    df = loader.load_cds("EUR-USD", "H1")
+    assert len(df) == 50
+    full_bytes = loader.stats["api_bytes"]
+
+    # One new bar closes and the previous last bar is revised
+    rows = fake_server["rows"]
+    rows[-1] = dict(rows[-1], Close=9.99)
+    rows.append(_rows("2025-01-03 02:00", 1)[0])
+
+    df = loader.load_cds("EUR-USD", "H1")
+    since = fake_server["calls"][-1]["since"]
+    assert pd.Timestamp(since) == pd.Timestamp(rows[-3]["Date"])
+    assert len(df) == 51
+    assert df["Close"].iloc[-2] == pytest.approx(9.99)
+    assert df["Date"].is_monotonic_increasing
+    assert loader.stats["delta_requests"] == 1
+    assert loader.stats["api_bytes"] - full_bytes < full_bytes / 10
+
+
+def test_cached_frames_are_not_shared_with_callers(fake_server, tmp_path):
+    warm = DataLoader(local_data_path=str(tmp_path), reuse_within_bar=True)
+    first = warm.load_cds("EUR-USD", "H1")
+    first["extra"] = 1.0
+    again = warm.load_cds("EUR-USD", "H1")
+    assert warm.stats["warm_hits"] == 1
+    assert "extra" not in again.columns
+    again.drop(columns=["Close"], inplace=True)
+    assert "Close" in warm.load_cds("EUR-USD", "H1").columns
+
+    incremental = DataLoader(local_data_path=str(tmp_path), incremental=True)
+    first = incremental.load_cds("EUR-USD", "H1")
+    first["extra"] = 1.0
+    fake_server["rows"] = []  # nothing new since the last fetch
+    again = incremental.load_cds("EUR-USD", "H1")
+    assert len(again) == 50 and "extra" not in again.columns
+    again["extra"] = 2.0
+    assert "extra" not in incremental.load_cds("EUR-USD", "H1").columns
+
+
+def test_shared_loader_survives_concurrent_refresh(fake_server, tmp_path):
+    loader = DataLoader(local_data_path=str(tmp_path), reuse_within_bar=True, negative_ttl=60)
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(20):
+                loader.load_cds(f"I{n}-{i}", "H1")
+                loader._mark_missing(("cds", f"I{n}-{i}"))
+                loader.refresh(None if i % 5 == 0 else f"I{n}-{i}")
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert loader.stats["api_requests"] == len(fake_server["calls"]) == 80
+
+
+def test_refresh_forgets_cached_frames(fake_server, tmp_path):
+    loader = DataLoader(local_data_path=str(tmp_path), incremental=True)
+    loader.load_cds("EUR-USD", "H1")
+    loader.refresh("EUR-USD")
+    loader.load_cds("EUR-USD", "H1")
+    assert "since" not in fake_server["calls"][-1]
+
+
+def test_local_fallback_when_api_down(monkeypatch, tmp_path):
+    def failing_get(*args, **kwargs):
+        raise dl.requests.ConnectionError("down")
+
+    monkeypatch.setattr(dl.requests, "get", failing_get)
+    path = tmp_path / "current" / "cds"
+    path.mkdir(parents=True)
+    pd.DataFrame(_rows("2025-01-01", 5)).to_csv(path / "EUR-USD-H1.csv", index=False)
+
+    loader = DataLoader(local_data_path=str(tmp_path))
+    df = loader.load_cds("EUR/USD", "H1")
+    assert len(df) == 5
+    assert loader.stats["local_reads"] == 1
+
+
+def test_negotiates_columnar_payload(tmp_path):
+    frame = make_frame(200)
+    with StubDataServer(frame, formats=("columns",)) as server:
+        loader = DataLoader(data_server_url=server.url, local_data_path=str(tmp_path))
+        df = loader.load_cds("EUR-USD", "H1")
+        assert "application/vnd.jgt.columns+json" in server.requests[-1]["accept"]
+    assert list(df.columns) == list(frame.columns)
+    assert df["Close"].dtype == "float64"
+    pd.testing.assert_series_equal(df["Close"], frame["Close"])
+    assert df["zcol"].tolist() == frame["zcol"].tolist()
+
+
+def test_falls_back_to_row_payload(tmp_path):
+    frame = make_frame(200)
+    with StubDataServer(frame, formats=()) as rows_server, StubDataServer(frame) as fast_server:
+        rows_df = DataLoader(data_server_url=rows_server.url, local_data_path=str(tmp_path)).load_cds("EUR-USD", "H1")
+        fast_df = DataLoader(data_server_url=fast_server.url, local_data_path=str(tmp_path)).load_cds("EUR-USD", "H1")
+    pd.testing.assert_frame_equal(rows_df, fast_df, check_dtype=False)
+
+
+def test_columnar_nulls_become_nan():
+    df = DataLoader._frame_from_columns({"fh": [1.1, None, 1.2], "zcol": ["red", None, "green"]})
+    assert df["fh"].dtype == "float64"
+    assert df["fh"].isna().sum() == 1
+    assert df["zcol"].isna().tolist() == [False, True, False]
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    def failing_get(*args, **kwargs):
+        raise dl.requests.ConnectionError("down")
+
+    monkeypatch.setattr(dl.requests, "get", failing_get)
+
+
+def _write_cds(root, frame, name="EUR-USD-H1.csv"):
+    path = root / "current" / "cds"
+    path.mkdir(parents=True, exist_ok=True)
+    frame.to_csv(path / name, index=False)
+    return path / name
+
+
+def test_local_column_projection(offline, tmp_path):
+    _write_cds(tmp_path, make_frame(100))
+    loader = DataLoader(local_data_path=str(tmp_path))
+    df = loader.load_cds("EUR-USD", "H1", columns=["High", "Low", "Close"])
+    assert list(df.columns) == ["Date", "High", "Low", "Close"]
+    assert len(df) == 100
+
+
+def test_local_typed_read(offline, tmp_path):
+    _write_cds(tmp_path, make_frame(100))
+    loader = DataLoader(local_data_path=str(tmp_path), typed=True)
+    df = loader.load_cds("EUR-USD", "H1", columns=["High", "Low", "Close", "zcol", "missing"])
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.index.name == "Date"
+    assert list(df.columns) == ["High", "Low", "Close", "zcol"]
+    assert df["Close"].dtype == "float32"
+    assert df["zcol"].dtype == "category"
+
+
+def test_api_projection_and_typed(tmp_path):
+    with StubDataServer(make_frame(50), formats=("columns",)) as server:
+        loader = DataLoader(data_server_url=server.url, local_data_path=str(tmp_path), typed=True)
+        df = loader.load_cds("EUR-USD", "H1", columns=["Close"])
+        assert server.requests[-1]["params"]["columns"] == "Date,Close"
+    assert list(df.columns) == ["Close"]
+    assert df["Close"].dtype == "float32"
+    assert isinstance(df.index, pd.DatetimeIndex)
+
+
+def test_circuit_breaker_states():
+    now = [0.0]
+    breaker = dl.CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=lambda: now[0])
+    assert breaker.allow()
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.state == breaker.OPEN
+    assert not breaker.allow()
+
+    now[0] = 31
+    assert breaker.allow()          # half-open probe
+    assert not breaker.allow()      # only one probe at a time
+    breaker.record_failure()
+    assert breaker.state == breaker.OPEN
+
+    now[0] = 62
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == breaker.CLOSED
+    assert breaker.allow()
+
+
+def test_outage_degrades_to_local_without_waiting(monkeypatch, tmp_path):
+    calls = []
+
+    def failing_get(*args, **kwargs):
+        calls.append(kwargs.get("timeout"))
+        raise dl.requests.ConnectionError("down")
+
+    monkeypatch.setattr(dl.requests, "get", failing_get)
+    _write_cds(tmp_path, make_frame(20))
+    loader = DataLoader(local_data_path=str(tmp_path), failure_threshold=3, api_timeout=2)
+    for _ in range(10):
+        assert loader.load_cds("EUR-USD", "H1") is not None
+    assert len(calls) == 3
+    assert calls[0] == 2
+    assert loader.stats["api_skipped"] == 7
+    assert loader.breaker.state == dl.CircuitBreaker.OPEN
+
+
+def test_missing_files_are_not_restatted(offline, tmp_path, monkeypatch):
+    loader = DataLoader(local_data_path=str(tmp_path), negative_ttl=60)
+    assert loader.load_cds("NZD-USD", "H1") is None
+    assert loader.load_cds("NZD-USD", "H1") is None
+    assert loader.stats["negative_hits"] == 1
+
+    # Once the TTL lapses the file is looked up again
+    monkeypatch.setattr(dl.time, "monotonic", lambda: 10 ** 9)
+    _write_cds(tmp_path, make_frame(5), name="NZD-USD-H1.csv")
+    assert loader.load_cds("NZD-USD", "H1") is not None
+
+
+def test_api_not_found_is_negatively_cached(monkeypatch, tmp_path):
+    calls = []
+
+    def not_found(*args, **kwargs):
+        calls.append(1)
+        return FakeResponse({"success": False}, status_code=404)
+
+    monkeypatch.setattr(dl.requests, "get", not_found)
+    loader = DataLoader(local_data_path=str(tmp_path))
+    loader.load_cds("EUR-USD", "H1")
+    loader.load_cds("EUR-USD", "H1")
+    assert len(calls) == 1
+    assert loader.breaker.state == dl.CircuitBreaker.CLOSED
+
+
+def _bundle_frames(rows=30):
+    cds = make_frame(rows)
+    pds = cds[["Date", "Open", "High", "Low", "Close"]]
+    ttf = cds[["Date", "ao", "ac"]].iloc[5:]  # starts later than cds
+    return {"cds": cds, "pds": pds, "ttf": ttf}
+
+
+def test_bundle_loads_all_types_in_one_request(tmp_path):
+    frames = _bundle_frames()
+    with StubDataServer(frames["cds"], frames=frames) as server:
+        loader = DataLoader(data_server_url=server.url, local_data_path=str(tmp_path))
+        bundle = loader.load_bundle("EUR-USD", "H1", columns={"cds": ["Close", "fdbb"]})
+        assert len(server.requests) == 1
+        assert server.requests[0]["params"]["data_types"] == "cds,pds,ttf"
+        assert server.requests[0]["params"]["columns_cds"] == "Date,Close,fdbb"
+    assert set(bundle) == {"cds", "pds", "ttf"}
+    assert list(bundle["cds"].columns) == ["Close", "fdbb"]
+    assert bundle["pds"].index.equals(bundle["cds"].index)
+    assert bundle["ttf"].index.equals(bundle["cds"].index)
+    assert bundle["ttf"]["ao"].isna().sum() == 5
+    assert loader.stats["bundle_requests"] == 1
+
+
+def test_bundle_fills_missing_types_from_local(tmp_path):
+    frames = _bundle_frames()
+    frames["ttf"] = None
+    local = tmp_path / "current" / "ttf"
+    local.mkdir(parents=True)
+    make_frame(30)[["Date", "ao"]].to_csv(local / "EUR-USD-H1.csv", index=False)
+    with StubDataServer(frames["cds"], frames=frames) as server:
+        loader = DataLoader(data_server_url=server.url, local_data_path=str(tmp_path))
+        bundle = loader.load_bundle("EUR-USD", "H1")
+        assert len(server.requests) == 1
+    assert loader.stats["local_reads"] == 1
+    assert bundle["ttf"]["ao"].notna().all()
+
+
+def test_bundle_falls_back_per_type_without_server_support(tmp_path):
+    with StubDataServer(make_frame(20), formats=("columns",)) as server:
+        loader = DataLoader(data_server_url=server.url, local_data_path=str(tmp_path))
+        bundle = loader.load_bundle("EUR-USD", "H1", data_types=("cds", "pds"), align=False)
+        loader.load_bundle("EUR-USD", "H1", data_types=("cds", "pds"))
+        # One probe, then per-type requests only
+        assert len(server.requests) == 5
+        assert sum("data_types" in r["params"] for r in server.requests) == 1
+    assert len(bundle["cds"]) == len(bundle["pds"]) == 20
+
+
+def test_bundle_offline_reads_local_files(offline, tmp_path):
+    _write_cds(tmp_path, make_frame(10))
+    loader = DataLoader(local_data_path=str(tmp_path))
+    bundle = loader.load_bundle("EUR-USD", "H1", data_types=("cds", "pds"))
+    assert len(bundle["cds"]) == 10
+    assert bundle["pds"] is None
+
+
+@pytest.fixture
+def counting_server(monkeypatch):
+    calls = []
+
+    def fake_get(url, params=None, **kwargs):
+        calls.append(dict(params or {}))
+        return FakeResponse({"success": True, "data": _rows("2025-01-01", 3)})
+
+    monkeypatch.setattr(dl.requests, "get", fake_get)
+    return calls
+
+
+def test_local_first_skips_api_when_file_exists(counting_server, tmp_path):
+    _write_cds(tmp_path, make_frame(10))
+    loader = DataLoader(local_data_path=str(tmp_path), source_policy="local-first")
+    assert len(loader.load_cds("EUR-USD", "H1")) == 10
+    assert counting_server == []
+    assert len(loader.load_cds("GBP-USD", "H1")) == 3  # no file -> API
+    assert len(counting_server) == 1
+
+
+@pytest.mark.parametrize("bundle_reply", [
+    FakeResponse({"success": False, "error": "unknown parameter data_types"}, status_code=400),
+    FakeResponse({"success": False, "error": "unknown parameter data_types"}),
+    FakeResponse({"success": True, "data": _rows("2025-01-01", 3)}),
+])
+def test_bundle_rejection_falls_back_without_marking_missing(monkeypatch, tmp_path, bundle_reply):
+    calls = []
+
+    def fake_get(url, params=None, **kwargs):
+        calls.append(dict(params or {}))
+        if "data_types" in (params or {}):
+            return bundle_reply
+        return FakeResponse({"success": True, "data": _rows("2025-01-01", 3)})
+
+    monkeypatch.setattr(dl.requests, "get", fake_get)
+    loader = DataLoader(local_data_path=str(tmp_path))
+    bundle = loader.load_bundle("EUR-USD", "H1", data_types=("cds", "pds"), align=False)
+    assert len(bundle["cds"]) == len(bundle["pds"]) == 3
+    assert loader._bundle_supported is False
+    assert loader._missing == {}
+    loader.load_bundle("EUR-USD", "H1", data_types=("cds", "pds"), align=False)
+    assert sum("data_types" in c for c in calls) == 1
+
+
+def test_local_if_fresh_compares_mtime_with_last_bar_close(counting_server, tmp_path):
+    import os
+    path = _write_cds(tmp_path, make_frame(10))
+    loader = DataLoader(local_data_path=str(tmp_path), source_policy="local-if-fresh")
+    assert len(loader.load_cds("EUR-USD", "H1")) == 10
+    assert counting_server == []
+
+    # Written before the last H1 close -> stale, ask the API
+    old = path.stat().st_mtime - 2 * 3600
+    os.utime(path, (old, old))
+    assert len(loader.load_cds("EUR-USD", "H1")) == 3
+    assert len(counting_server) == 1
+
+
+def test_api_only_never_reads_local(offline, tmp_path):
+    _write_cds(tmp_path, make_frame(10))
+    loader = DataLoader(local_data_path=str(tmp_path), source_policy="api-only")
+    assert loader.load_cds("EUR-USD", "H1") is None
+    assert loader.stats["local_reads"] == 0
+
+
+def test_source_policy_from_env_is_validated(monkeypatch):
+    monkeypatch.setenv("JGT_DATA_SOURCE_POLICY", "local-first")
+    assert DataLoader().source_policy == "local-first"
+    with pytest.raises(ValueError):
+        DataLoader(source_policy="nearest")
+
+
+def test_unchanged_local_files_are_not_reparsed(offline, tmp_path):
+    import os
+    path = _write_cds(tmp_path, make_frame(10))
+    loader = DataLoader(local_data_path=str(tmp_path))
+    first = loader.load_cds("EUR-USD", "H1")
+    first["extra"] = 1
+    second = loader.load_cds("EUR-USD", "H1")
+    assert loader.stats["local_reads"] == 1
+    assert loader.stats["local_cache_hits"] == 1
+    assert "extra" not in second.columns
+
+    _write_cds(tmp_path, make_frame(12))
+    stamp = path.stat().st_mtime + 5
+    os.utime(path, (stamp, stamp))
+    assert len(loader.load_cds("EUR-USD", "H1")) == 12
+    assert loader.stats["local_reads"] == 2
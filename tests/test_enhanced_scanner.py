@@ -0,0 +1,129 @@
+# Tests for the data-driven intent scanner
+import time
+
+import numpy as np
+import pandas as pd
+
+from jgtagentic.alligator_regime import AlligatorDetector
+from jgtagentic.enhanced_fdb_scanner import EnhancedFDBScanner
+from jgtagentic.profiling import ScanProfiler
+
+
+def trending_frame(rows=200, slope=0.001):
+    close = 1.0 + slope * np.arange(rows)
+    fdbb = np.zeros(rows)
+    fdbb[-1] = 1.0
+    return pd.DataFrame({
+        "High": close + 0.0005,
+        "Low": close - 0.0005,
+        "Close": close,
+        "ao": np.full(rows, 2 * slope),
+        "fdbb": fdbb,
+    })
+
+
+class FrameLoader:
+    def __init__(self, frames=None):
+        self.frames = frames or {}
+        self.calls = 0
+        self.columns = None
+        self.default = trending_frame()
+
+    def load_cds(self, instrument, timeframe, columns=None):
+        self.calls += 1
+        self.columns = columns
+        if instrument == "MISSING":
+            return None
+        return self.frames.get((instrument, timeframe), self.default)
+
+
+class CountingDetector(AlligatorDetector):
+    calls = 0
+
+    def detect(self, df):
+        CountingDetector.calls += 1
+        return super().detect(df)
+
+
+SPEC = {
+    "instruments": ["EUR/USD", "MISSING"],
+    "timeframes": ["H4", "H1"],
+    "signals": [{
+        "name": "confluence",
+        "jgtml_components": {
+            "fractal_analysis": "jgtpy.fractal_detection",
+            "alligator_state": "TideAlligatorAnalysis.mouth_opening",
+            "momentum": "jgtpy.ao_acceleration",
+            "sentiment": "not.checked",
+        },
+    }],
+}
+
+
+def test_requirements_are_evaluated_on_loaded_data():
+    result = EnhancedFDBScanner(loader=FrameLoader()).scan_with_intent(SPEC)
+    signals = result["enhanced_signals"]
+    assert [(s["instrument"], s["timeframe"]) for s in signals] == [("EUR/USD", "H4"), ("EUR/USD", "H1")]
+    assert result["missing_data"] == ["MISSING H4", "MISSING H1"]
+    first = signals[0]
+    assert first["direction"] == "LONG"
+    assert first["alligator"]["state"] == "EATING"
+    requirement = first["requirements"][0]
+    assert requirement["met"] and requirement["unchecked"] == ["sentiment"]
+    assert requirement["components"] == {"fractal_analysis": True, "alligator_state": True, "momentum": True}
+    assert first["intent_aligned"]
+    assert result["recommendations"]["best"] == "EUR/USD H4 LONG"
+
+
+def test_failed_component_and_opposing_bias():
+    falling = trending_frame(slope=-0.001)
+    loader = FrameLoader({("EUR/USD", "H1"): falling})
+    result = EnhancedFDBScanner(loader=loader).scan_with_intent({**SPEC, "bias": "bearish"})
+    by_tf = {s["timeframe"]: s for s in result["enhanced_signals"]}
+    # Buy FDB on a falling market: momentum against the LONG direction
+    assert not by_tf["H1"]["requirements"][0]["components"]["momentum"]
+    assert not by_tf["H1"]["intent_aligned"]
+    assert not by_tf["H4"]["intent_aligned"]  # LONG signal, bearish intent
+    assert result["recommendations"]["action"] == "wait"
+
+
+def test_indicators_are_reused_until_data_changes():
+    CountingDetector.calls = 0
+    loader = FrameLoader()
+    scanner = EnhancedFDBScanner(loader=loader, detector=CountingDetector())
+    spec = {"instruments": [f"INST{i}" for i in range(20)], "timeframes": ["H4", "H1", "m15"]}
+    scanner.scan_with_intent(spec)
+    assert CountingDetector.calls == 60
+
+    start = time.perf_counter()
+    warm = scanner.scan_with_intent(spec)
+    assert time.perf_counter() - start < 1.0
+    assert CountingDetector.calls == 60
+    assert len(warm["enhanced_signals"]) == 60
+
+    loader.default = trending_frame(rows=201)
+    scanner.scan_with_intent(spec)
+    assert CountingDetector.calls == 120
+
+
+def test_indicator_cache_is_bounded():
+    CountingDetector.calls = 0
+    scanner = EnhancedFDBScanner(loader=FrameLoader(), detector=CountingDetector(), indicator_cache_size=2)
+    spec = {"instruments": ["A", "B", "C"], "timeframes": ["H1"]}
+    scanner.scan_with_intent(spec)
+    assert len(scanner._indicators) == 2 and CountingDetector.calls == 3
+    scanner.scan_with_intent({"instruments": ["C"], "timeframes": ["H1"]})
+    assert CountingDetector.calls == 3  # most recent keys stay cached
+
+    disabled = EnhancedFDBScanner(loader=FrameLoader(), detector=CountingDetector(), indicator_cache_size=0)
+    disabled.scan_with_intent(spec)
+    assert len(disabled._indicators) == 0
+
+
+def test_profile_includes_planning():
+    profiler = ScanProfiler()
+    scanner = EnhancedFDBScanner(loader=FrameLoader(), profiler=profiler)
+    scanner.scan_with_intent({"instruments": ["EUR/USD", "SPX500"], "timeframes": ["H1"]})
+    [span] = profiler.spans
+    assert {"plan", "signals"} <= set(span.phases)
+    assert (span.instrument, span.timeframe) == ("EUR/USD,SPX500", "H1")
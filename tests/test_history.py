@@ -0,0 +1,72 @@
+# Tests for the bounded ring-buffer histories
+import json
+import os
+
+from jgtagentic.enhanced_fdb_scanner import EnhancedFDBScanner
+from jgtagentic.history import RingHistory
+from jgtagentic.intent_spec import IntentSpecParser
+from jgtagentic.observation_capture import ObservationCapture
+
+
+def test_capacity_and_instrument_index():
+    history = RingHistory(3)
+    for i, inst in enumerate(["EUR/USD", "SPX500", "EUR/USD", "GBP/USD", "EUR/USD"]):
+        history.append({"instrument": inst, "n": i})
+    assert len(history) == 3
+    assert [e["n"] for e in history] == [2, 3, 4]
+    assert [e["n"] for e in history.for_instrument("EUR/USD")] == [2, 4]
+    assert history.for_instrument("EUR/USD", limit=1)[0]["n"] == 4
+    assert "SPX500" not in history.instruments()
+    assert history[-1]["n"] == 4 and [e["n"] for e in history.recent(2)] == [3, 4]
+
+
+def test_evicted_entries_spill_and_rotate(tmp_path):
+    path = tmp_path / "signals.ndjson"
+    history = RingHistory(2, spill_path=str(path), max_spill_bytes=60, backups=2)
+    for i in range(12):
+        history.append({"instrument": "EUR/USD", "n": i})
+    assert history.spilled == 10
+    spilled = []
+    for name in ("signals.ndjson.2", "signals.ndjson.1", "signals.ndjson"):
+        if (tmp_path / name).exists():
+            spilled += [json.loads(line)["n"] for line in (tmp_path / name).read_text().splitlines()]
+    # Oldest files beyond the backups are dropped; the rest stay in order
+    assert spilled == sorted(spilled) and spilled[-1] == 9
+    assert not (tmp_path / "signals.ndjson.3").exists()
+
+
+def test_env_configures_size_and_spill_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("JGT_HISTORY_SIZE", "2")
+    monkeypatch.setenv("JGT_HISTORY_DIR", str(tmp_path))
+    capture = ObservationCapture()
+    for text in ["EUR/USD breakout on H4", "SPX500 bearish", "GBP/USD trend H1"]:
+        capture.capture_observation(text)
+    assert len(capture.observation_history) == 2
+    spill = capture.observation_history.spill_path
+    assert spill.parent == tmp_path and spill.exists()
+    assert spill.name.startswith(f"observations.{os.getpid()}.") and spill.suffix == ".ndjson"
+    assert capture.observation_history.for_instrument("GBP/USD")
+
+
+def test_histories_with_the_same_name_spill_to_separate_files(monkeypatch, tmp_path):
+    monkeypatch.setenv("JGT_HISTORY_DIR", str(tmp_path))
+    first, second = RingHistory(1, name="signals"), RingHistory(1, name="signals")
+    assert first.spill_path != second.spill_path
+    for history, n in ((first, 1), (second, 2), (first, 3), (second, 4)):
+        history.append({"instrument": "EUR/USD", "n": n})
+    assert json.loads(first.spill_path.read_text())["n"] == 1
+    assert json.loads(second.spill_path.read_text())["n"] == 2
+
+
+def test_agent_histories_are_bounded(tmp_path):
+    scanner = EnhancedFDBScanner(history_size=5)
+    scanner.signal_history.extend({"instrument": "EUR/USD", "n": i} for i in range(50))
+    assert len(scanner.signal_history) == 5
+
+    parser = IntentSpecParser(history_size=1)
+    spec = tmp_path / "a.jgtml-spec"
+    spec.write_text("instruments: [SPX500]\n")
+    parser.load(str(spec))
+    parser.load(str(spec))
+    assert len(parser.spec_history) == 1
+    assert parser.spec_history.for_instrument("SPX500")
@@ -0,0 +1,87 @@
+# Tests for the memory-mapped market data store
+import mmap
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jgtagentic import data_loader as dl
+from jgtagentic.data_loader import DataLoader
+from jgtagentic.market_store import MarketStore, convert_csv_tree
+from tests.stub_data_server import make_frame
+
+
+@pytest.fixture
+def csv_tree(tmp_path):
+    root = tmp_path / "data"
+    path = root / "current" / "cds"
+    path.mkdir(parents=True)
+    make_frame(120).to_csv(path / "EUR-USD-H1.csv", index=False)
+    make_frame(80, seed=3).to_csv(path / "GBP-USD-H4.csv", index=False)
+    return root
+
+
+def test_convert_and_open_memory_mapped(csv_tree, tmp_path):
+    store_root = tmp_path / "store"
+    written = convert_csv_tree(str(csv_tree), str(store_root))
+    assert len(written) == 2
+
+    store = MarketStore(str(store_root))
+    df = store.open("EUR/USD", "H1", "cds", "current")
+    original = pd.read_csv(csv_tree / "current" / "cds" / "EUR-USD-H1.csv")
+    assert len(df) == 120
+    np.testing.assert_array_equal(df["Close"].to_numpy(), original["Close"].to_numpy())
+    assert df["zcol"].tolist() == original["zcol"].tolist()
+    assert pd.api.types.is_datetime64_any_dtype(df["Date"])
+
+    mapped = np.load(written[0] / "4.npy", mmap_mode="r")
+    assert isinstance(mapped, np.memmap)
+
+
+def _is_mapped(values):
+    while values is not None:
+        if isinstance(values, (np.memmap, mmap.mmap)):
+            return True
+        values = getattr(values, "base", None)
+    return False
+
+
+def test_typed_loader_keeps_store_columns_mapped(csv_tree, tmp_path, monkeypatch):
+    monkeypatch.setattr(dl.requests, "get", lambda *a, **k: (_ for _ in ()).throw(dl.requests.ConnectionError()))
+    store_root = tmp_path / "store"
+    convert_csv_tree(str(csv_tree), str(store_root), typed=True, compact=True)
+
+    loader = DataLoader(local_data_path=str(csv_tree), store_path=str(store_root), typed=True, compact=True)
+    df = loader.load_cds("EUR-USD", "H1")
+    assert loader.stats["store_reads"] == 1
+    assert isinstance(df.index, pd.DatetimeIndex) and "Date" not in df.columns
+    assert df["Close"].dtype == np.float32 and df["zcol"].dtype == "category"
+    assert _is_mapped(df["Close"].to_numpy()) and _is_mapped(df["ao"].to_numpy())
+
+
+def test_convert_skips_up_to_date_entries(csv_tree, tmp_path):
+    store_root = tmp_path / "store"
+    convert_csv_tree(str(csv_tree), str(store_root))
+    assert convert_csv_tree(str(csv_tree), str(store_root)) == []
+
+    csv_path = csv_tree / "current" / "cds" / "EUR-USD-H1.csv"
+    os.utime(csv_path, (1, 1))
+    assert len(convert_csv_tree(str(csv_tree), str(store_root))) == 1
+
+
+def test_data_loader_prefers_store(csv_tree, tmp_path, monkeypatch):
+    monkeypatch.setattr(dl.requests, "get", lambda *a, **k: (_ for _ in ()).throw(dl.requests.ConnectionError()))
+    store_root = tmp_path / "store"
+    convert_csv_tree(str(csv_tree), str(store_root))
+
+    loader = DataLoader(local_data_path=str(csv_tree), store_path=str(store_root))
+    df = loader.load_cds("EUR-USD", "H1", columns=["High", "Low", "Close"])
+    assert list(df.columns) == ["Date", "High", "Low", "Close"]
+    assert loader.stats["store_reads"] == 1
+    assert loader.stats["local_reads"] == 0
+
+    # A refreshed CSV makes the store entry stale until it is reconverted
+    os.utime(csv_tree / "current" / "cds" / "EUR-USD-H1.csv", (1, 1))
+    loader.load_cds("EUR-USD", "H1")
+    assert loader.stats["local_reads"] == 1
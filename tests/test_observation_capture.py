@@ -0,0 +1,139 @@
+# Tests for observation analysis and bulk ingestion
+import json
+
+from jgtagentic import observation_ingest
+from jgtagentic.observation_capture import ObservationCapture
+from jgtagentic.observation_ingest import ingest_observations, read_observations
+from jgtagentic.observation_matcher import ObservationMatcher
+
+
+def test_matcher_extracts_context_in_one_pass():
+    match = ObservationMatcher().match(
+        "Clearly bullish: gold breaking above resistance on the daily, SPX500 and GBP/JPY hourly aligned"
+    )
+    assert match.instruments == ["XAU/USD", "SPX500", "GBP/JPY"]
+    assert match.timeframes == ["H4", "H1", "D1"]
+    assert match.sentiment == "bullish"
+    assert match.signal_type == "breakout"
+    assert round(match.confidence, 2) == 0.8
+
+
+def test_matcher_uses_whole_words_and_currency_legs():
+    match = ObservationMatcher().match("USD weakens against the JPY; support holds, maybe")
+    assert match.instruments == ["USD/JPY"]
+    # 'up' inside 'support' is not a bullish cue
+    assert match.sentiment == "neutral"
+    assert match.timeframes == [] and match.signal_type == "general"
+    assert round(match.confidence, 2) == 0.6
+
+
+def test_configured_symbols_and_aliases():
+    matcher = ObservationMatcher(instruments=["NZD/CAD", "BTC/USD"], aliases={"bitcoin": "BTC/USD"})
+    assert matcher.match("nzdcad and bitcoin, EUR/USD ignored").instruments == ["NZD/CAD", "BTC/USD"]
+
+
+def test_capture_falls_back_to_defaults():
+    result = ObservationCapture(instruments=["SPX500"]).capture_observation("Alligator mouth opening, strong momentum")
+    observation = result["observation"]
+    assert observation["instruments"] == ["EUR/USD"]
+    assert observation["timeframes"] == ["H4", "H1"]
+    assert observation["signal_type"] == "alligator"
+    assert result["intent_specification"]["bias"] == "bullish"
+
+
+JOURNAL = """# 2024-03-01
+EUR/USD breaking above resistance,
+strong momentum on the daily
+
+- gold looks weak, maybe short
+```
+not an observation
+```
+## 2024-03-02
+SPX500 alligator mouth opening on the hourly
+"""
+
+
+def test_read_markdown_journal(tmp_path):
+    path = tmp_path / "journal.md"
+    path.write_text(JOURNAL)
+    records = list(read_observations(str(path)))
+    assert [r["text"] for r in records] == [
+        "EUR/USD breaking above resistance, strong momentum on the daily",
+        "gold looks weak, maybe short",
+        "SPX500 alligator mouth opening on the hourly",
+    ]
+    assert [r["section"] for r in records] == ["2024-03-01", "2024-03-01", "2024-03-02"]
+    assert records[1]["source"].endswith(":5")
+
+
+def test_hashtag_notes_are_not_headings(tmp_path):
+    path = tmp_path / "journal.md"
+    path.write_text("## Monday\n#EURUSD breaking out\n\n#\n#SPX500 weak\n")
+    records = list(read_observations(str(path)))
+    assert [(r["text"], r.get("section")) for r in records] == [
+        ("#EURUSD breaking out", "Monday"),
+        ("#SPX500 weak", None),
+    ]
+
+
+def test_pool_is_sized_to_the_input(monkeypatch):
+    pools = []
+
+    class RecordingPool(observation_ingest.ProcessPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            pools.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(observation_ingest, "ProcessPoolExecutor", RecordingPool)
+    ingest_observations(["EUR/USD bullish"] * 5, workers=8, batch_size=10)
+    assert pools == []
+    summary = ingest_observations(["EUR/USD bullish"] * 25, workers=8, batch_size=10)
+    assert pools == [3] and summary["observations"] == 25
+
+
+def test_capture_stream_consolidates_and_writes_in_order(tmp_path):
+    path = tmp_path / "notes.ndjson"
+    lines = [{"text": "EUR/USD breakout, clearly bullish", "id": i, "timestamp": f"2024-01-{i + 1:02d}"}
+             for i in range(7)]
+    lines.append("SPX500 bearish breakdown below support on the daily")
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\nnot json\n")
+    output = tmp_path / "out.ndjson"
+
+    capture = ObservationCapture()
+    summary = capture.capture_stream(str(path), output=str(output), workers=2, batch_size=3)
+    written = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [w.get("id") for w in written] == list(range(7)) + [None]
+    assert written[0]["observation"]["timestamp"] == "2024-01-01"
+    assert summary["observations"] == 8 and summary["observations_per_sec"] > 0
+    intent = summary["consolidated_intent"]
+    assert intent["instruments"] == ["EUR/USD", "SPX500"]
+    assert intent["bias"] == "bullish"
+    assert intent["signal_counts"] == {"breakout_signal": 8}
+    assert len(capture.observation_history) == 8
+
+
+def test_repeated_observations_reuse_the_analysis(monkeypatch):
+    capture = ObservationCapture(memo_size=2)
+    calls = []
+    analyze = capture._analyze_observation
+    monkeypatch.setattr(capture, "_analyze_observation", lambda text: calls.append(text) or analyze(text))
+
+    first = capture.capture_observation("EUR/USD breakout, clearly bullish")
+    first["intent_specification"]["instruments"].append("mutated")
+    again = capture.capture_observation("  eur/usd BREAKOUT,   clearly bullish ")
+    assert len(calls) == 1 and capture.memo_stats == {"hits": 1, "misses": 1}
+    assert again["intent_specification"]["instruments"] == ["EUR/USD"]
+    assert again["observation"]["text"] == "  eur/usd BREAKOUT,   clearly bullish "
+
+    capture.capture_observation("gold weak")
+    capture.capture_observation("SPX500 strong")
+    capture.capture_observation("EUR/USD breakout, clearly bullish")
+    assert len(calls) == 4
+
+
+def test_memo_can_be_disabled():
+    capture = ObservationCapture(memo_size=0)
+    capture.capture_observation("gold weak")
+    capture.capture_observation("gold weak")
+    assert capture.memo_stats == {"hits": 0, "misses": 0}
@@ -0,0 +1,75 @@
+# Tests for bar-close scheduling and DataLoader cache warming
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from jgtagentic import data_loader as dl
+from jgtagentic.data_loader import DataLoader
+from jgtagentic.prefetch import BarClosePrefetcher
+from jgtagentic.timeframes import last_bar_close, next_bar_close, next_closes
+from tests.stub_data_server import StubDataServer, make_frame
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_bar_close_boundaries():
+    now = _utc(2025, 3, 5, 13, 47, 12)  # a Wednesday
+    assert last_bar_close("m15", now) == _utc(2025, 3, 5, 13, 45)
+    assert next_bar_close("H4", now) == _utc(2025, 3, 5, 16, 0)
+    assert last_bar_close("D1", now) == _utc(2025, 3, 5)
+    assert last_bar_close("W1", now) == _utc(2025, 3, 2)  # Sunday
+    assert next_bar_close("M1", now) == _utc(2025, 4, 1)
+    assert next_bar_close("M1", _utc(2025, 12, 9)) == _utc(2026, 1, 1)
+    with pytest.raises(ValueError):
+        last_bar_close("X7", now)
+
+
+def test_next_closes_groups_coinciding_timeframes():
+    when, due = next_closes(["H4", "H1", "m15"], _utc(2025, 3, 5, 15, 50))
+    assert when == _utc(2025, 3, 5, 16, 0)
+    assert due == ["m15", "H1", "H4"]
+
+
+def test_reuse_within_bar_serves_warm_frames(tmp_path):
+    with StubDataServer(make_frame(50), formats=("columns",)) as server:
+        loader = DataLoader(data_server_url=server.url, local_data_path=str(tmp_path), reuse_within_bar=True)
+        prefetcher = BarClosePrefetcher(loader, ["EUR-USD", "GBP-USD"], ["D1"], jitter=0)
+        assert prefetcher.warm() == {"loaded": 2, "missing": 0}
+        assert loader.load_cds("EUR-USD", "D1") is not None
+        assert len(server.requests) == 2
+    assert loader.stats["warm_hits"] == 1
+
+
+def test_frames_from_before_the_bar_close_are_refetched(tmp_path):
+    with StubDataServer(make_frame(50), formats=("columns",)) as server:
+        loader = DataLoader(data_server_url=server.url, local_data_path=str(tmp_path), reuse_within_bar=True)
+        loader.load_cds("EUR-USD", "H1")
+        for cached in loader._cache.values():
+            cached.fetched_at -= 3600
+        loader.load_cds("EUR-USD", "H1")
+        assert len(server.requests) == 2
+    assert loader.stats["warm_hits"] == 0
+
+
+def test_prefetcher_fires_after_bar_close(monkeypatch, tmp_path):
+    monkeypatch.setattr(dl.requests, "get", lambda *a, **k: (_ for _ in ()).throw(dl.requests.ConnectionError()))
+    # Shift the clock so the next m1 close is 0.1s away
+    real = time.time()
+    offset = 60 - (real % 60) - 0.1
+    loader = DataLoader(local_data_path=str(tmp_path))
+    prefetcher = loader.start_prefetch(
+        ["EUR-USD"], ["m1"], delay=0, jitter=0, clock=lambda: time.time() + offset
+    )
+    try:
+        deadline = time.time() + 3
+        while prefetcher.cycles == 0 and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        prefetcher.stop()
+    assert prefetcher.cycles >= 1
+    assert "m1" in prefetcher.last_run
+    assert not prefetcher.running
+    assert loader.reuse_within_bar
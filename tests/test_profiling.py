@@ -0,0 +1,72 @@
+# Tests for per-scan phase timings and profiling
+import asyncio
+import time
+
+import pytest
+
+from jgtagentic.data_loader import DataLoader
+from jgtagentic.fdbscan_agent import FDBScanAgent
+from jgtagentic.profiling import ScanProfiler, current_span, phase, record_frame
+from jgtagentic.scan_cache import ScanResultCache
+from jgtagentic.scan_daemon import ScanDaemon
+from tests.stub_data_server import StubDataServer, make_frame
+
+
+def test_phases_and_data_accumulate_per_scan():
+    profiler = ScanProfiler()
+    with phase("load"):
+        pass  # nothing profiled: no-op
+    with profiler.scan("EUR/USD", "H1") as span:
+        with phase("load"):
+            with phase("load"):  # nested same phase counts once
+                time.sleep(0.02)
+            record_frame(make_frame(50))
+        with profiler.scan("ignored", "m5") as inner:
+            assert inner is span
+    assert current_span() is None
+    assert len(profiler.spans) == 1
+    assert 0.02 <= span.phases["load"] < span.total + 1e-9
+    assert span.rows == 50 and span.bytes > 0
+    report = profiler.report()
+    assert "EUR/USD H1" in report and "load" in report
+
+
+def test_loader_reads_are_attributed_to_the_scan(tmp_path):
+    profiler = ScanProfiler()
+    with StubDataServer(make_frame(120)) as server:
+        loader = DataLoader(data_server_url=server.url, local_data_path=str(tmp_path))
+        loader.load_cds("EUR-USD", "H1")  # outside a scan
+        with profiler.scan("EUR/USD", "H1") as span:
+            loader.load_cds("EUR-USD", "H1")
+    assert span.rows == 120 and "load" in span.phases
+
+
+def test_agent_records_scans_and_cprofile_captures(tmp_path):
+    profiler = ScanProfiler(mode="cprofile", output_dir=str(tmp_path / "prof"))
+    agent = FDBScanAgent(scan_cache=ScanResultCache(str(tmp_path / "cache")), profiler=profiler)
+    agent.ritual_sequence(["H4", "H1"])
+    assert [s.timeframe for s in profiler.spans] == ["H4", "H1"]
+    assert all("cache" in s.phases for s in profiler.spans)
+    assert (tmp_path / "prof" / "H4.prof").exists()
+    assert "Top 15 functions" in profiler.report()
+    assert profiler.to_dict()["scans"][0]["timeframe"] == "H4"
+
+
+def test_daemon_analysis_is_profiled():
+    class Loader:
+        def load_cds(self, instrument, timeframe):
+            frame = make_frame(120)
+            record_frame(frame)
+            return frame
+
+    profiler = ScanProfiler()
+    daemon = ScanDaemon(FDBScanAgent(profiler=profiler), ["EUR/USD"], ["H1"], loader=Loader())
+    records = asyncio.run(daemon.scan_due(["H1"]))
+    span = profiler.spans[0]
+    assert "indicators" in span.phases and span.rows == 120
+    assert records[0]["scan"]["data_rows"] == 120
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        ScanProfiler(mode="perf")
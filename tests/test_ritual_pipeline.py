@@ -0,0 +1,54 @@
+# Tests for the per-instrument pipelined ritual sequence
+import time
+
+from jgtagentic.fdbscan_agent import FDBScanAgent
+from jgtagentic.ritual_pipeline import run_pipeline
+from jgtagentic.scan_workers import ScanOutcome
+
+SEQUENCE = ["H4", "H1", "m15"]
+
+
+def _sleeper(durations=None, fail=()):
+    def run_job(job):
+        time.sleep((durations or {}).get(job.instrument, 0.2))
+        status = "failed" if (job.instrument, job.timeframe) in fail else "ok"
+        return ScanOutcome(job.instrument, job.timeframe, status, 0 if status == "ok" else 1, 0.2)
+    return run_job
+
+
+def test_chains_respect_timeframe_order_and_overlap():
+    report = run_pipeline(["A", "B", "C"], SEQUENCE, workers=3, run_job=_sleeper())
+    assert report.ok
+    for inst in "ABC":
+        spans = [s for s in report.spans if s.instrument == inst]
+        assert [s.timeframe for s in spans] == SEQUENCE
+        assert all(later.start >= earlier.end for earlier, later in zip(spans, spans[1:]))
+    # Three chains of three 0.2s scans run side by side
+    assert report.wall_seconds < 0.9
+    assert report.serial_seconds >= 1.7
+
+
+def test_lower_timeframe_runs_while_other_instrument_scans_higher():
+    report = run_pipeline(["fast", "slow"], SEQUENCE, workers=2, run_job=_sleeper({"fast": 0.1, "slow": 0.5}))
+    fast_m15 = next(s for s in report.spans if s.instrument == "fast" and s.timeframe == "m15")
+    slow_h4 = next(s for s in report.spans if s.instrument == "slow" and s.timeframe == "H4")
+    assert fast_m15.start < slow_h4.end
+    assert report.critical_path == ["slow H4", "slow H1", "slow m15"]
+    assert report.critical_path_seconds >= 1.5
+
+
+def test_failed_stage_skips_rest_of_chain():
+    report = run_pipeline(["A", "B"], SEQUENCE, workers=2, run_job=_sleeper({"A": 0.01, "B": 0.01}, fail={("A", "H1")}))
+    statuses = {(o.instrument, o.timeframe): o.status for o in report.outcomes}
+    assert statuses[("A", "H1")] == "failed"
+    assert statuses[("A", "m15")] == "skipped"
+    assert all(statuses[("B", tf)] == "ok" for tf in SEQUENCE)
+    assert not report.ok
+
+
+def test_agent_ritual_sequence_pipelines_instruments():
+    result = FDBScanAgent().ritual_sequence(["H1", "m15"], instruments=["EUR/USD", "SPX500"], workers=4)
+    assert result["ok"]
+    assert len(result["outcomes"]) == 4
+    assert "Would scan: m15 for SPX500" in result["outcomes"][-1]["stderr"]
+    assert len(result["critical_path"]) == 2
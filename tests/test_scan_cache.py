@@ -0,0 +1,105 @@
+# Tests for the last-closed-bar scan result cache
+from datetime import datetime, timezone
+
+import pytest
+
+from jgtagentic import scan_workers
+from jgtagentic.batch_fdbscan import run_batch
+from jgtagentic.fdbscan_agent import FDBScanAgent
+from jgtagentic.scan_cache import ScanResultCache
+from jgtagentic.scan_result import ScanResult
+from jgtagentic.scan_workers import ScanOutcome, run_scans
+
+
+def _utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+def test_entries_expire_at_the_next_bar_close(tmp_path):
+    cache = ScanResultCache(str(tmp_path), version="v1")
+    bar = cache.bar_key("H1", _utc(2025, 3, 5, 13, 10))
+    assert cache.put("EUR/USD", "H1", {"signals": 2}, bar_close=bar)
+    assert (tmp_path / "EUR-USD-H1.json").exists()
+
+    assert cache.get("EUR/USD", "H1", _utc(2025, 3, 5, 13, 59)) == {"signals": 2}
+    assert cache.get("EUR/USD", "H1", _utc(2025, 3, 5, 14, 0)) is None
+    assert ScanResultCache(str(tmp_path), version="v2").get("EUR/USD", "H1", _utc(2025, 3, 5, 13, 20)) is None
+    assert cache.stats == {"hits": 1, "misses": 1, "stores": 1}
+    assert not cache.put("EUR/USD", "X9", {})
+
+
+def _counting_runner(monkeypatch):
+    runs = []
+
+    def fake_run(job, timeout=None):
+        runs.append((job.instrument, job.timeframe))
+        result = ScanResult(job.instrument, job.timeframe, signals=[{"bs": "B"}], duration=0.01).to_dict()
+        return ScanOutcome.from_result(job.instrument, job.timeframe, result)
+
+    monkeypatch.setattr(scan_workers, "run_scan_job", fake_run)
+    return runs
+
+
+def test_run_scans_skips_unchanged_pairs(monkeypatch, tmp_path):
+    runs = _counting_runner(monkeypatch)
+    cache = ScanResultCache(str(tmp_path))
+    first = run_scans(["EUR/USD", "SPX500"], ["D1", "W1"], cache=cache)
+    second = run_scans(["EUR/USD", "SPX500"], ["D1", "W1"], cache=cache)
+    assert len(runs) == 4
+    assert not any(o.cached for o in first)
+    assert all(o.cached and o.ok and o.result["signal_count"] == 1 for o in second)
+    assert [o.stdout for o in second] == [o.stdout for o in first]
+
+    run_scans(["EUR/USD"], ["D1"], cache=cache, force=True)
+    assert len(runs) == 5
+
+
+def test_scan_timeframe_returns_previous_result(tmp_path, capsys):
+    agent = FDBScanAgent(scan_cache=ScanResultCache(str(tmp_path)))
+    fresh = agent.scan_timeframe("D1", "EUR/USD")
+    assert not fresh.cached
+    cached = agent.scan_timeframe("D1", "EUR/USD")
+    assert cached.ok and cached.cached
+    assert cached.started_at == fresh.started_at
+    out = capsys.readouterr().out
+    assert "Would scan: D1 for EUR/USD" in out
+    assert "Unchanged since last scan: D1 for EUR/USD" in out
+    assert not agent.scan_timeframe("D1", "EUR/USD", force=True).cached
+
+
+@pytest.mark.parametrize("agent_first", [True, False])
+def test_scan_timeframe_and_scan_many_share_entries(monkeypatch, tmp_path, agent_first):
+    runs = _counting_runner(monkeypatch)
+    monkeypatch.setenv("JGT_SCAN_CACHE", str(tmp_path))
+    agent = FDBScanAgent()
+    if agent_first:
+        scanned = agent.scan_timeframe("H1", "EUR/USD")
+        [outcome] = agent.scan_many(["EUR/USD"], ["H1"])
+        assert runs == [] and outcome["cached"] and outcome["status"] == "ok"
+        assert ScanResult.from_dict(outcome["result"]).bar_close == scanned.bar_close
+    else:
+        [outcome] = agent.scan_many(["EUR/USD"], ["H1"])
+        scanned = agent.scan_timeframe("H1", "EUR/USD")
+        assert runs == [("EUR/USD", "H1")] and scanned.cached
+        assert scanned.signals == [{"bs": "B"}] and scanned.signal_count == 1
+
+
+def test_worker_environment_never_uses_the_cache(monkeypatch):
+    monkeypatch.setenv("JGT_SCAN_CACHE", "/tmp/scan-cache")
+    env = scan_workers.job_environment(scan_workers.ScanJob("EUR/USD", "H1"))
+    assert "JGT_SCAN_CACHE" not in env
+
+
+def test_batch_log_reports_cache_hits(monkeypatch, tmp_path):
+    runs = _counting_runner(monkeypatch)
+    kwargs = dict(cache_dir=str(tmp_path / "cache"), log_dir=str(tmp_path / "logs"))
+    run_batch(["EUR/USD", "SPX500"], ["D1", "W1"], log_file=str(tmp_path / "first.md"), **kwargs)
+    log = run_batch(["EUR/USD", "SPX500"], ["D1", "W1"], log_file=str(tmp_path / "second.md"), **kwargs)
+    text = open(log).read()
+    assert len(runs) == 4
+    assert "## Scan cache: 4 hit(s), 0 miss(es)" in text
+    assert "Status: ok (unchanged, cached)" in text
+
+    forced = run_batch(["EUR/USD"], ["D1"], log_file=str(tmp_path / "forced.md"), force=True, **kwargs)
+    assert len(runs) == 5
+    assert "(forced)" in open(forced).read()
@@ -0,0 +1,97 @@
+# Tests for the bar-close driven scan daemon
+import asyncio
+import json
+import time
+
+import pytest
+
+from jgtagentic.fdbscan_agent import FDBScanAgent
+from jgtagentic.scan_daemon import ScanDaemon
+from tests.stub_data_server import make_frame
+
+
+class FrameLoader:
+    def __init__(self):
+        self.calls = []
+
+    def load_cds(self, instrument, timeframe):
+        self.calls.append((instrument, timeframe))
+        return make_frame(120) if instrument != "MISSING" else None
+
+
+def test_scan_due_publishes_to_file_and_queue(tmp_path):
+    output = tmp_path / "scans.ndjson"
+    loader = FrameLoader()
+    daemon = ScanDaemon(FDBScanAgent(), ["EUR/USD", "MISSING"], ["H1", "H4"], output=str(output), loader=loader)
+    assert daemon.timeframes == ["H4", "H1"]
+
+    async def scenario():
+        daemon.queue = asyncio.Queue()
+        records = await daemon.scan_due(["H4", "H1"])
+        queued = [daemon.queue.get_nowait() for _ in range(daemon.queue.qsize())]
+        return records, queued
+
+    records, queued = asyncio.run(scenario())
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert len(records) == len(queued) == len(lines) == 4
+    assert [(r["instrument"], r["timeframe"]) for r in lines] == [
+        ("EUR/USD", "H4"), ("MISSING", "H4"), ("EUR/USD", "H1"), ("MISSING", "H1"),
+    ]
+    assert all(r["status"] == "ok" for r in lines)
+    assert lines[0]["analysis"]["signal"]["instrument"] == "EUR/USD"
+    assert lines[1]["analysis"] is None
+    assert len(loader.calls) == 4
+
+
+def test_bounded_queue_drops_oldest_results():
+    daemon = ScanDaemon(FDBScanAgent(), ["EUR/USD", "GBP/USD"], ["H1", "H4"], analyze=False)
+
+    async def scenario():
+        daemon.queue = asyncio.Queue(maxsize=3)
+        await daemon.scan_due(["H4", "H1"])
+        return [daemon.queue.get_nowait() for _ in range(daemon.queue.qsize())]
+
+    queued = asyncio.run(scenario())
+    assert [(r["instrument"], r["timeframe"]) for r in queued] == [
+        ("GBP/USD", "H4"), ("EUR/USD", "H1"), ("GBP/USD", "H1"),
+    ]
+    assert daemon.published == 4 and daemon.dropped == 1
+
+
+def test_results_are_not_queued_without_a_consumer():
+    daemon = ScanDaemon(FDBScanAgent(), ["EUR/USD"], ["H1"], analyze=False)
+    asyncio.run(daemon.scan_due(["H1"]))
+    assert daemon.queue is None and daemon.published == 1
+
+
+def test_daemon_wakes_on_bar_close(tmp_path):
+    # Shift the clock so the next m1 close is 0.1s away
+    offset = 60 - (time.time() % 60) - 0.1
+    daemon = ScanDaemon(
+        FDBScanAgent(), ["EUR/USD"], ["m1", "H4"], output=str(tmp_path / "out.ndjson"),
+        analyze=False, delay=0, clock=lambda: time.time() + offset,
+    )
+    start = time.perf_counter()
+    asyncio.run(asyncio.wait_for(daemon.run(max_cycles=1), timeout=5))
+    assert time.perf_counter() - start < 3
+    assert daemon.cycles == 1
+    record = json.loads((tmp_path / "out.ndjson").read_text())
+    assert record["timeframe"] == "m1"
+
+
+def test_stop_ends_a_waiting_daemon():
+    daemon = ScanDaemon(FDBScanAgent(), ["EUR/USD"], ["D1"], analyze=False)
+
+    async def scenario():
+        task = asyncio.create_task(daemon.run())
+        await asyncio.sleep(0.05)
+        daemon.stop()
+        await asyncio.wait_for(task, timeout=2)
+
+    asyncio.run(scenario())
+    assert daemon.cycles == 0
+
+
+def test_unknown_timeframe_is_rejected():
+    with pytest.raises(ValueError):
+        ScanDaemon(FDBScanAgent(), ["EUR/USD"], ["H5"], analyze=False)
@@ -0,0 +1,88 @@
+# Tests for compiled intent scan plans
+from jgtagentic.enhanced_fdb_scanner import EnhancedFDBScanner
+from jgtagentic.intent_spec import IntentSpecParser
+from jgtagentic.alligator_regime import AlligatorDetector, CompatResult
+from jgtagentic.scan_plan import BASE_COLUMNS, compile_plan, spec_fingerprint
+from jgtagentic.scoring import SignalScorer
+from tests.test_enhanced_scanner import FrameLoader, trending_frame
+
+SPEC = {
+    "strategy_intent": "confluence",
+    "instruments": ["EUR/USD", "SPX500", "EUR/USD"],
+    "timeframes": ["m15", "H4", "H1", "H4"],
+    "signals": [
+        {"name": "fractal", "jgtml_components": {"fractal_analysis": "x", "sentiment": "y"}},
+        {"name": "volume", "jgtml_components": {"volume_analysis": "z"}, "validation": {"min_score": 20}},
+    ],
+    "bias": "Bullish",
+}
+
+
+def test_plan_dedups_keys_and_collects_requirements():
+    plan = compile_plan(SPEC)
+    assert plan.keys == (
+        ("EUR/USD", "m15"), ("EUR/USD", "H4"), ("EUR/USD", "H1"),
+        ("SPX500", "m15"), ("SPX500", "H4"), ("SPX500", "H1"),
+    )
+    assert plan.htf == {"m15": "H1", "H1": "H4", "H4": None}
+    assert set(BASE_COLUMNS) <= set(plan.columns)
+    assert {"fh", "fl", "mfi_sig", "jaw"} <= set(plan.columns)
+    assert plan.indicators == ("alligator", "score", "fractals", "mfi")
+    assert plan.signals[0].unchecked == ("sentiment",)
+    assert plan.signals[1].min_score == 20
+    assert plan.bias == "bullish"
+
+
+def test_fingerprint_ignores_validation_timestamp():
+    assert spec_fingerprint(SPEC) == spec_fingerprint({**SPEC, "validation_timestamp": "now"})
+    assert spec_fingerprint(SPEC) != spec_fingerprint({**SPEC, "bias": "bearish"})
+
+
+def test_repeated_scans_reuse_the_plan_and_project_columns():
+    loader = FrameLoader()
+    scanner = EnhancedFDBScanner(loader=loader)
+    first = scanner.scan_with_intent(dict(SPEC))
+    scanner.scan_with_intent(dict(SPEC))
+    assert scanner.plans.stats == {"hits": 1, "compiled": 1}
+    assert loader.calls == 12  # six unique keys, twice
+    assert loader.columns == list(compile_plan(SPEC).columns)
+
+    by_key = {(s["instrument"], s["timeframe"]): s for s in first["enhanced_signals"]}
+    assert by_key[("EUR/USD", "m15")]["htf"] == "H1"
+    assert by_key[("EUR/USD", "m15")]["htf_aligned"] is True
+    assert by_key[("EUR/USD", "H4")]["htf"] is None
+
+
+def test_htf_disagreement_and_compiled_plan_input():
+    falling = trending_frame(slope=-0.001).assign(fdbb=0.0)
+    loader = FrameLoader({("EUR/USD", "H4"): falling})
+    plan = IntentSpecParser().compile({"instruments": ["EUR/USD"], "timeframes": ["H4", "H1"]})
+    result = EnhancedFDBScanner(loader=loader).scan_with_intent(plan)
+    h1 = next(s for s in result["enhanced_signals"] if s["timeframe"] == "H1")
+    assert h1["htf_aligned"] is False
+    assert result["plan"] == plan.fingerprint
+    assert result["intent_context"]["keys"] == [["EUR/USD", "H4"], ["EUR/USD", "H1"]]
+
+
+def test_projected_frames_score_like_full_frames():
+    full = trending_frame().assign(
+        mfi_sig=1.0, mfi_green=1.0, zcol="green", fl=0.99, fh=1.3, volume=100.0
+    )
+    full = full.assign(lips=full["Close"] - 0.01, teeth=full["Close"] - 0.02, jaw=full["Close"] - 0.03)
+
+    class ProjectingLoader(FrameLoader):
+        def load_cds(self, instrument, timeframe, columns=None):
+            super().load_cds(instrument, timeframe, columns)
+            return full[[c for c in columns if c in full.columns]]
+
+    spec = {"instruments": ["EUR/USD"], "timeframes": ["H4"],
+            "signals": [{"name": "fdb", "jgtml_components": {"fractal_analysis": "x"},
+                         "validation": {"min_score": 40}}]}
+    loader = ProjectingLoader()
+    signal = EnhancedFDBScanner(loader=loader).scan_with_intent(spec)["enhanced_signals"][0]
+    assert "volume" not in loader.columns
+
+    unprojected = SignalScorer().score(full, CompatResult(AlligatorDetector().detect(full)), "EUR/USD", "H4")
+    assert signal["score"] == unprojected.score >= 40
+    assert signal["stop"] == unprojected.stop_price
+    assert signal["requirements"][0]["met"]
@@ -0,0 +1,105 @@
+# Tests for structured scan results and NDJSON output
+import json
+import os
+import subprocess
+import sys
+
+from jgtagentic.fdbscan_agent import FDBScanAgent
+from jgtagentic.scan_result import ScanResult, read_signal_output, signals_from
+from jgtagentic.scan_workers import ScanJob, parse_result, run_scan_job
+
+
+def test_dry_scan_returns_result(capsys):
+    result = FDBScanAgent().scan_timeframe("H1", "EUR/USD")
+    assert isinstance(result, ScanResult)
+    assert (result.instrument, result.timeframe, result.status, result.mode) == ("EUR/USD", "H1", "ok", "dry")
+    assert result.signals == [] and result.duration >= 0 and result.started_at
+    assert "Would scan: H1 for EUR/USD" in capsys.readouterr().out
+
+
+def test_real_scan_collects_signals_and_failures(monkeypatch):
+    signals = {"EUR/USD_H1_1": {"entry": 1.1, "stop": 1.09, "bs": "B"}}
+    scanner = type("S", (), {"main": staticmethod(lambda: signals)})
+    monkeypatch.setattr("jgtagentic.fdbscan_agent._FDBSCAN_AVAILABLE", True)
+    monkeypatch.setattr("jgtagentic.fdbscan_agent.fdb_scanner_2408", scanner)
+    result = FDBScanAgent(real=True).scan_timeframe("H1", "EUR/USD")
+    assert result.mode == "real" and result.signal_count == 1
+    assert result.signals[0] == {"key": "EUR/USD_H1_1", "entry": 1.1, "stop": 1.09, "bs": "B"}
+
+    def broken():
+        raise RuntimeError("no data")
+
+    monkeypatch.setattr("jgtagentic.fdbscan_agent.fdb_scanner_2408", type("S", (), {"main": staticmethod(broken)}))
+    failed = FDBScanAgent(real=True).scan_timeframe("H1", "EUR/USD")
+    assert not failed.ok and failed.error == "no data"
+
+
+def test_real_scan_reads_the_signal_file(monkeypatch, tmp_path):
+    stale = tmp_path / "fdb_signals_out__250101.json"
+    stale.write_text(json.dumps({"EUR/USD_H1_0": {"bs": "S"}}))
+    os.utime(stale, (0, 0))
+
+    def main():
+        (tmp_path / "fdb_signals_out__250102.json").write_text(json.dumps([
+            {"instrument": "EUR/USD", "timeframe": "H1", "bs": "B"},
+            {"instrument": "SPX500", "timeframe": "H1", "bs": "S"},
+            {"instrument": "EUR/USD", "timeframe": "H4", "bs": "S"},
+        ]))
+
+    monkeypatch.setenv("JGT_SIGNALS_DIR", str(tmp_path))
+    monkeypatch.setattr("jgtagentic.fdbscan_agent._FDBSCAN_AVAILABLE", True)
+    monkeypatch.setattr("jgtagentic.fdbscan_agent.fdb_scanner_2408", type("S", (), {"main": staticmethod(main)}))
+    result = FDBScanAgent(real=True).scan_timeframe("H1", "EUR/USD")
+    assert result.ok and result.signals == [{"instrument": "EUR/USD", "timeframe": "H1", "bs": "B"}]
+
+    (tmp_path / "fdb_signals_out__250102.json").unlink()
+    monkeypatch.setattr("jgtagentic.fdbscan_agent.fdb_scanner_2408", type("S", (), {"main": staticmethod(lambda: None)}))
+    assert FDBScanAgent(real=True).scan_timeframe("H1", "EUR/USD").signals == []
+    assert read_signal_output("EUR/USD", "H1", since=0, directory=str(tmp_path)) == [{"key": "EUR/USD_H1_0", "bs": "S"}]
+
+
+def test_round_trip_and_signal_shapes():
+    result = ScanResult("SPX500", "m15", signals=[{"bs": "S"}], data_rows=300)
+    line = result.to_json()
+    assert "\n" not in line
+    data = json.loads(line)
+    assert data["signal_count"] == 1
+    assert ScanResult.from_dict(data) == result
+    assert signals_from(None) == []
+    assert signals_from(["x"]) == [{"value": "x"}]
+
+
+def test_sequence_returns_results():
+    results = FDBScanAgent().ritual_sequence(["H4", "H1"])
+    assert [r.timeframe for r in results] == ["H4", "H1"]
+
+
+def test_cli_streams_ndjson():
+    out = subprocess.run(
+        [sys.executable, "-m", "jgtagentic.fdbscan_agent", "ritual", "--sequence", "H4", "H1", "--ndjson"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    records = [json.loads(line) for line in out.splitlines()]
+    assert [r["timeframe"] for r in records] == ["H4", "H1"]
+
+
+def test_worker_outcome_carries_result():
+    outcome = run_scan_job(ScanJob("EUR/USD", "H1"), timeout=60)
+    assert outcome.ok
+    assert outcome.result["instrument"] == "EUR/USD" and outcome.result["status"] == "ok"
+    assert outcome.stdout.count("\n") == 1
+    assert parse_result("Would scan\n") is None
+    assert parse_result('Would scan\n{"status": "ok"}\n') is None
+    assert parse_result('{"status": "ok"}\n') == {"status": "ok"}
+
+
+def test_progress_goes_to_stdout_unless_a_stream_is_given(capsys):
+    FDBScanAgent(progress_stream=sys.stderr).scan_timeframe("H1", "EUR/USD")
+    captured = capsys.readouterr()
+    assert captured.out == "" and "Would scan: H1 for EUR/USD" in captured.err
+
+    out = subprocess.run(
+        [sys.executable, "-m", "jgtagentic.fdbscan_agent", "scan", "--timeframe", "H1", "--instrument", "EUR/USD"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    assert out.startswith("Would scan: H1 for EUR/USD")
@@ -0,0 +1,68 @@
+# Tests for isolated, parallel FDBScan worker processes
+import sys
+import time
+
+from jgtagentic import scan_workers
+from jgtagentic.fdbscan_agent import FDBScanAgent
+from jgtagentic.scan_workers import ScanJob, run_scans
+
+
+def test_scan_many_runs_each_pair_in_a_worker(tmp_path):
+    agent = FDBScanAgent()
+    results = agent.scan_many(["EUR/USD", "SPX500"], ["H4", "H1"], workers=4, cache_dir=str(tmp_path))
+    assert [(r["instrument"], r["timeframe"]) for r in results] == [
+        ("EUR/USD", "H4"), ("EUR/USD", "H1"), ("SPX500", "H4"), ("SPX500", "H1"),
+    ]
+    assert all(r["status"] == "ok" and r["returncode"] == 0 for r in results)
+    assert "Would scan: H1 for SPX500" in results[3]["stderr"]
+    assert results[3]["result"]["instrument"] == "SPX500"
+
+
+def test_job_environment_is_isolated(monkeypatch):
+    monkeypatch.setenv("JGT_CACHE", "/parent/cache")
+    job = ScanJob("EUR/USD", "H1", cache_dir="/job/cache", env={"EXTRA": "1"})
+    env = scan_workers.job_environment(job)
+    assert env["JGT_CACHE"] == "/job/cache"
+    assert env["EXTRA"] == "1"
+    assert scan_workers.os.environ["JGT_CACHE"] == "/parent/cache"
+
+
+def test_failures_and_timeouts_are_reported(monkeypatch):
+    def fake_command(job):
+        if job.timeframe == "fail":
+            return [sys.executable, "-c", "import sys; sys.exit(3)"]
+        if job.timeframe == "slow":
+            return [sys.executable, "-c", "import time; time.sleep(30)"]
+        return [sys.executable, "-c", "print('ok')"]
+
+    monkeypatch.setattr(scan_workers, "build_command", fake_command)
+    outcomes = run_scans(["EUR/USD"], ["H1", "fail", "slow"], workers=3, timeout=1)
+    assert [o.status for o in outcomes] == ["ok", "failed", "timeout"]
+    assert outcomes[0].stdout.strip() == "ok"
+    assert outcomes[1].returncode == 3
+
+
+def test_concurrency_is_capped(monkeypatch):
+    monkeypatch.setattr(
+        scan_workers, "build_command",
+        lambda job: [sys.executable, "-c", "import time; time.sleep(0.5)"],
+    )
+    start = time.perf_counter()
+    outcomes = run_scans(["A", "B", "C", "D"], ["H1"], workers=2)
+    elapsed = time.perf_counter() - start
+    assert all(o.ok for o in outcomes)
+    # Two waves of two half-second scans
+    assert 1.0 <= elapsed < 2.0
+
+
+def test_failed_scans_are_retried(monkeypatch, tmp_path):
+    marker = tmp_path / "attempted"
+    # Fails on the first attempt, succeeds once the marker exists
+    script = f"import os, sys; p = {str(marker)!r}; ok = os.path.exists(p); open(p, 'w').close(); sys.exit(0 if ok else 1)"
+    monkeypatch.setattr(scan_workers, "build_command", lambda job: [sys.executable, "-c", script])
+    outcomes = run_scans(["EUR/USD"], ["H1"], retries=2)
+    assert outcomes[0].ok and outcomes[0].attempts == 2
+
+    monkeypatch.setattr(scan_workers, "build_command", lambda job: [sys.executable, "-c", "import sys; sys.exit(1)"])
+    outcomes = run_scans(["EUR/USD"], ["H1"], retries=2)
+    assert outcomes[0].status == "failed" and outcomes[0].attempts == 3
@@ -0,0 +1,55 @@
+# Tests for cached intent spec loading
+import os
+
+import yaml
+
+from jgtagentic.intent_spec import IntentSpecParser
+from jgtagentic.spec_cache import SpecCache
+
+
+def write_spec(path, **spec):
+    path.write_text(yaml.safe_dump(spec))
+    return str(path)
+
+
+def test_unchanged_file_is_not_reparsed(tmp_path):
+    path = write_spec(tmp_path / "a.jgtml-spec", strategy_intent="Demo", instruments=["SPX500"])
+    parser = IntentSpecParser()
+    first = parser.load(path)
+    first["instruments"].append("mutated")
+    second = parser.load(path)
+    assert second["instruments"] == ["SPX500"]
+    assert parser.spec_cache.stats["parses"] == 1
+    assert parser.spec_cache.stats["hits"] == 1
+    assert len(parser.spec_history) == 2
+
+
+def test_touched_file_with_same_content_is_rehashed_not_parsed(tmp_path):
+    path = write_spec(tmp_path / "a.jgtml-spec", strategy_intent="Demo")
+    cache = SpecCache()
+    cache.load(path)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert cache.load(path) == {"strategy_intent": "Demo"}
+    assert cache.stats["rehashed"] == 1 and cache.stats["parses"] == 1
+
+    write_spec(tmp_path / "a.jgtml-spec", strategy_intent="Changed")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2 * 10**9))
+    assert cache.load(path) == {"strategy_intent": "Changed"}
+    assert cache.stats["parses"] == 2
+
+
+def test_persisted_form_is_reused_across_caches(tmp_path):
+    path = write_spec(tmp_path / "a.jgtml-spec", strategy_intent="Demo", timeframes=["H1"])
+    store = tmp_path / "store"
+    first = SpecCache(IntentSpecParser().validate_spec, namespace="validated", persist_dir=str(store))
+    validated = first.load(path)
+    assert len(list(store.glob("validated-*.json"))) == 1
+
+    second = SpecCache(IntentSpecParser().validate_spec, namespace="validated", persist_dir=str(store))
+    assert second.load(path) == validated
+    assert second.stats == {"hits": 0, "rehashed": 0, "disk_hits": 1, "parses": 0}
+
+    raw = SpecCache(namespace="raw", persist_dir=str(store))
+    assert raw.load(path) == {"strategy_intent": "Demo", "timeframes": ["H1"]}
+    assert raw.stats["parses"] == 1
@@ -0,0 +1,58 @@
+# Tests for batch spec validation
+import json
+
+import yaml
+
+from jgtagentic.spec_validation import ValidationCache, check_spec, validate_directory
+
+GOOD = {
+    "strategy_intent": "confluence",
+    "instruments": ["EUR/USD"],
+    "timeframes": ["H4", "H1"],
+    "signals": [{"name": "fdb", "jgtml_components": {"fractal_analysis": "x", "sentiment": "y"}}],
+}
+
+
+def write_library(root):
+    (root / "nested").mkdir(parents=True)
+    (root / "good.jgtml-spec").write_text(yaml.safe_dump(GOOD))
+    (root / "nested" / "copy.jgtml-spec").write_text(yaml.safe_dump(GOOD))
+    (root / "bad.jgtml-spec").write_text(yaml.safe_dump({"instruments": "EUR/USD", "signals": [3]}))
+    (root / "broken.jgtml-spec").write_text("signals: [unclosed\n")
+    (root / "notes.txt").write_text("ignored")
+
+
+def test_check_spec_separates_errors_from_warnings():
+    errors, warnings = check_spec(dict(GOOD, timeframes=["H4", "H9"], risk_management={"target_rr": "2"}))
+    assert errors == ["risk_management.target_rr must be a number"]
+    assert "unknown timeframe 'H9'" in warnings
+    assert any("'sentiment' is not checked" in w for w in warnings)
+    assert check_spec(["not", "a", "mapping"])[0] == ["spec must be a mapping, got list"]
+
+
+def test_validate_directory_reports_every_spec(tmp_path):
+    write_library(tmp_path / "specs")
+    report = validate_directory(str(tmp_path / "specs"), workers=2, cache=ValidationCache())
+    by_name = {r["path"].rsplit("/", 1)[-1]: r for r in report["results"]}
+    assert set(by_name) == {"good.jgtml-spec", "copy.jgtml-spec", "bad.jgtml-spec", "broken.jgtml-spec"}
+    assert (report["total"], report["valid"], report["invalid"]) == (4, 2, 2)
+    # identical content is validated once
+    assert report["validated"] == 3
+    assert by_name["good.jgtml-spec"]["keys"] == 2
+    assert by_name["bad.jgtml-spec"]["errors"] == [
+        "instruments must be a list of non-empty strings", "signals[0] must be a mapping"
+    ]
+    assert by_name["broken.jgtml-spec"]["errors"][0].startswith("unparseable")
+    json.dumps(report)
+
+
+def test_results_are_cached_by_content(tmp_path):
+    write_library(tmp_path / "specs")
+    cache_file = tmp_path / "cache" / "validation.json"
+    validate_directory(str(tmp_path / "specs"), workers=1, cache=ValidationCache(str(cache_file)))
+
+    (tmp_path / "specs" / "bad.jgtml-spec").write_text(yaml.safe_dump(dict(GOOD, strategy_intent="fixed")))
+    report = validate_directory(str(tmp_path / "specs"), workers=1, cache=ValidationCache(str(cache_file)))
+    assert report["validated"] == 1 and report["cached"] == 3
+    assert report["invalid"] == 1
+    assert [r["cached"] for r in report["results"] if r["path"].endswith("bad.jgtml-spec")] == [False]